@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: BatchEvaluator versus replaying with GameState.make_move.
+
+Generates random schedules for a roster (random walks over valid moves,
+with some illegal moves mixed in), grades them all with NumPy, and grades
+a sample by replaying each one on a fresh GameState.
+
+Usage: python -m benchmarks.batch_eval [--people 6] [--schedules 1000000] [--sample 10000]
+"""
+import argparse
+import random
+import time
+import numpy as np
+from models import Bridge, Flashlight, GameState, Move, Person
+from solvers.batch_eval import BatchEvaluator, LEFT_TO_RIGHT, RIGHT_TO_LEFT
+
+
+def random_schedules(bridge, persons, count, length, rng):
+    """Random walks over the compact encoding; about one schedule in ten makes an illegal move."""
+    num_persons = len(persons)
+    full_mask = (1 << num_persons) - 1
+    groups = np.zeros((count, length), dtype=np.int64)
+    directions = np.zeros((count, length), dtype=np.int8)
+    for row in range(count):
+        right, on_right = 0, False
+        for step in range(length):
+            side = right if on_right else full_mask & ~right
+            members = [i for i in range(num_persons) if side >> i & 1]
+            if not members:
+                break
+            if rng.random() < 0.01:
+                members = range(num_persons)
+            size = rng.randint(1, min(bridge.get_capacity(), len(members)))
+            group = sum(1 << i for i in rng.sample(members, size))
+            groups[row, step] = group
+            directions[row, step] = RIGHT_TO_LEFT if on_right else LEFT_TO_RIGHT
+            right ^= group
+            on_right = not on_right
+    return groups, directions
+
+
+def replay(bridge, persons, groups, directions):
+    for row in range(groups.shape[0]):
+        state = GameState(bridge, Flashlight(), persons)
+        for group, direction in zip(groups[row], directions[row]):
+            if group == 0:
+                break
+            members = [p for i, p in enumerate(persons) if int(group) >> i & 1]
+            move = Move(members, "left_to_right" if direction == LEFT_TO_RIGHT else "right_to_left")
+            if not state.make_move(move):
+                break
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--people", type=int, default=6)
+    parser.add_argument("--schedules", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    persons = [Person(f"P{i}", rng.randint(1, 20)) for i in range(args.people)]
+    bridge = Bridge(capacity=2, max_time=10 * args.people * 20)
+    length = 2 * args.people + 3
+
+    sample_groups, sample_directions = random_schedules(bridge, persons, args.sample, length, rng)
+    reps = max(1, args.schedules // args.sample)
+    groups = np.tile(sample_groups, (reps, 1))
+    directions = np.tile(sample_directions, (reps, 1))
+
+    evaluator = BatchEvaluator(bridge, persons)
+    start = time.perf_counter()
+    valid, _, _ = evaluator.evaluate(groups, directions)
+    batch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    replay(bridge, persons, sample_groups, sample_directions)
+    replay_seconds = time.perf_counter() - start
+
+    batch_rate = groups.shape[0] / batch_seconds
+    replay_rate = args.sample / replay_seconds
+    print(f"schedules graded:       {groups.shape[0]:,} ({valid.mean():.1%} valid)")
+    print(f"BatchEvaluator:         {batch_rate:,.0f} schedules/s ({batch_seconds:.3f} s)")
+    print(f"GameState.make_move:    {replay_rate:,.0f} schedules/s (sample of {args.sample:,})")
+    print(f"speedup:                {batch_rate / replay_rate:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Node-count benchmark: bidirectional Dijkstra versus unidirectional Dijkstra.
+
+Solves random capacity-3 rosters of each size with both solvers and reports
+the states each expanded, the reduction, and the wall time.
+
+Usage: python -m benchmarks.bidirectional [--sizes 12 14 16] [--instances 2] [--capacity 3]
+"""
+import argparse
+import random
+from models import Bridge, Person
+from solvers import BidirectionalSolver, DijkstraSolver
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[12, 14, 16])
+    parser.add_argument("--instances", type=int, default=2)
+    parser.add_argument("--capacity", type=int, default=3)
+    parser.add_argument("--max-crossing-time", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'people':>6} {'optimum':>8} {'dijkstra':>10} {'bidirectional':>14} {'reduction':>10} "
+          f"{'dijkstra s':>11} {'bidirectional s':>16}")
+    for num_people in args.sizes:
+        for _ in range(args.instances):
+            persons = [Person(f"P{i}", rng.randint(1, args.max_crossing_time)) for i in range(num_people)]
+            bridge = Bridge(capacity=args.capacity, max_time=2 * num_people * args.max_crossing_time)
+            one_way = DijkstraSolver(bridge, persons).solve()
+            two_way = BidirectionalSolver(bridge, persons).solve()
+            if one_way.get_total_time() != two_way.get_total_time():
+                raise AssertionError(f"solvers disagree: {one_way} versus {two_way}")
+            reduction = 1 - two_way.get_nodes_expanded() / one_way.get_nodes_expanded()
+            print(f"{num_people:>6} {one_way.get_total_time():>8} {one_way.get_nodes_expanded():>10,} "
+                  f"{two_way.get_nodes_expanded():>14,} {reduction:>10.1%} "
+                  f"{one_way.get_wall_time():>11.2f} {two_way.get_wall_time():>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Frame-time benchmark for the pygame GUI: dirty rectangles versus full redraws.
+
+Runs the GUI headless (SDL's dummy video driver) on rosters of each size,
+autoplaying the optimal schedule with the game advanced by 1/60 s per frame,
+and reports the time each frame took to handle events, update and draw,
+with and without dirty-rectangle rendering.
+
+Usage: python -m benchmarks.gui_frames [--sizes 4 100 500] [--capacity 2] [--frames 1200]
+"""
+import argparse
+import os
+from models import Bridge, Flashlight, GameState
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+from gui.puzzle_gui import PuzzleGUI, make_roster  # noqa: E402  (the prompt setting must come first)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 100, 500])
+    parser.add_argument("--capacity", type=int, default=2)
+    parser.add_argument("--frames", type=int, default=1200)
+    args = parser.parse_args()
+
+    print(f"{'people':>6} {'mode':>6} {'mean ms':>8} {'p99 ms':>7} {'max ms':>7} {'fps':>8} {'moves':>6} "
+          f"{'sprites':>8} {'hit rate':>9}")
+    for num_people in args.sizes:
+        persons = make_roster(num_people)
+        for dirty_rects in (True, False):
+            bridge = Bridge(args.capacity, 2 * sum(p.get_crossing_time() for p in persons))
+            game_state = GameState(bridge, Flashlight(), persons)
+            gui = PuzzleGUI(game_state, persons, headless=True, dirty_rects=dirty_rects, fps=0)
+            gui.run(max_frames=args.frames, autoplay=True, frame_dt=1 / 60)
+            times = sorted(gui.get_frame_times())
+            moves = gui.get_crossings()
+            cache = gui.get_sprite_cache()
+            gui.close()
+
+            mean = sum(times) / len(times)
+            hit_rate = cache.get_hits() / max(1, cache.get_hits() + cache.get_misses())
+            print(f"{num_people:>6} {'dirty' if dirty_rects else 'full':>6} {mean * 1000:>8.3f} "
+                  f"{times[int(0.99 * (len(times) - 1))] * 1000:>7.3f} {times[-1] * 1000:>7.3f} "
+                  f"{1 / mean:>8,.0f} {moves:>6} {len(cache):>8} {hit_rate:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
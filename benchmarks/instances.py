@@ -0,0 +1,58 @@
+"""
+Seeded instance generator for the benchmarks.
+
+The same arguments always give the same roster and bridge, so timings from
+different runs (and machines) measure the same work.
+"""
+import math
+import random
+from typing import List, Tuple
+from models import Bridge, Person
+from solvers.greedy import escort_schedule
+
+DISTRIBUTIONS = ("uniform", "heavy_tailed", "ties")
+
+
+def crossing_times(num_people: int, distribution: str, rng: random.Random) -> List[int]:
+    """
+    Draw crossing times in minutes.
+
+    * ``uniform``: 1 to 100;
+    * ``heavy_tailed``: Pareto with shape 1.2, so most people are fast and a
+      few are very slow (capped at 10,000);
+    * ``ties``: only five distinct values, so many people share a time.
+    """
+    if distribution == "uniform":
+        return [rng.randint(1, 100) for _ in range(num_people)]
+    if distribution == "heavy_tailed":
+        return [min(10_000, math.ceil(rng.paretovariate(1.2))) for _ in range(num_people)]
+    if distribution == "ties":
+        return [rng.choice((1, 2, 5, 10, 20)) for _ in range(num_people)]
+    raise ValueError(f"unknown distribution '{distribution}', expected one of {DISTRIBUTIONS}")
+
+
+def generate_instance(num_people: int, capacity: int, distribution: str = "uniform", tightness: float = 1.0,
+                      seed: int = 0) -> Tuple[List[Person], Bridge]:
+    """
+    Build a roster and bridge.
+
+    Args:
+        num_people (int): Roster size
+        capacity (int): Bridge capacity
+        distribution (str): One of `DISTRIBUTIONS`
+        tightness (float): Time limit as a multiple of `escort_schedule`'s total;
+            1.0 leaves no slack over that heuristic schedule, below 1.0 may
+            leave no schedule at all
+        seed (int): Random seed
+
+    Returns:
+        Tuple[List[Person], Bridge]: The people and the bridge
+    """
+    rng = random.Random(f"{seed}:{num_people}:{capacity}:{distribution}")
+    times = crossing_times(num_people, distribution, rng)
+    persons = [Person(f"P{i}", t) for i, t in enumerate(times)]
+
+    ordered = sorted(times)
+    groups = escort_schedule(ordered, capacity)
+    reference = sum(ordered[group.bit_length() - 1] for group in groups) if groups else sum(times)
+    return persons, Bridge(capacity, max(1, round(reference * tightness)))
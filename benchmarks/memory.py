@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: bytes per expanded search state.
+
+Expands states breadth-first from the initial position of a generated
+roster and measures, with tracemalloc, how many bytes each kept GameState
+costs (the roster, bridge and crossing-time table are shared and not
+counted), alongside CompactState and Move objects.
+
+Usage: python -m benchmarks.memory [--people 20] [--states 20000]
+"""
+import argparse
+import gc
+import tracemalloc
+from models import Bridge, CompactState, Flashlight, GameState, Move, Person
+
+
+def measure(build, count: int) -> float:
+    """Return the average traced bytes per object for `count` objects made by `build`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def make_people(num_people: int):
+    return [Person(f"P{i}", 1 + (i * 7) % 23) for i in range(num_people)]
+
+
+def expand_states(num_people: int):
+    def build(count: int):
+        root = GameState(Bridge(capacity=2, max_time=10 ** 9), Flashlight(), make_people(num_people))
+        kept = []
+        layer = [root]
+        while len(kept) < count:
+            next_layer = []
+            for state in layer:
+                for _, successor in state.iter_successors():
+                    kept.append(successor)
+                    next_layer.append(successor)
+                    if len(kept) == count:
+                        return kept
+            layer = next_layer
+        return kept
+    return build
+
+
+def compact_states(count: int):
+    return [CompactState(i, bool(i & 1), i) for i in range(count)]
+
+
+def people(count: int):
+    return [Person(f"P{i}", i) for i in range(count)]
+
+
+def moves(num_people: int):
+    roster = make_people(num_people)
+
+    def build(count: int):
+        return [Move([roster[i % num_people], roster[(i + 1) % num_people]], "left_to_right")
+                for i in range(count)]
+    return build
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--people", type=int, default=20)
+    parser.add_argument("--states", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {
+        f"GameState successor ({args.people} people)": measure(expand_states(args.people), args.states),
+        "CompactState": measure(compact_states, args.states),
+        "Person": measure(people, args.states),
+        "Move (2 people)": measure(moves(args.people), args.states),
+    }
+    for name, size in results.items():
+        print(f"{name:<36} {size:10.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Pattern-database benchmark: heuristic strength and A* node reduction.
+
+Generates a family of rosters of one size, capacity and distribution, builds
+one database for the whole family (`family_floor` rounded down to bucket
+edges) plus one per roster (`keep_slowest`), and solves every roster with
+A* using the built-in bound alone and combined with each database. Reports
+each heuristic's estimate of the start as a fraction of the optimum, the
+states A* expanded, and the build, save and memory-mapped load costs.
+
+Usage: python -m benchmarks.pattern_db [--people 14] [--capacity 3] [--instances 5] [--keep 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+from solvers import AStarSolver
+from solvers.pattern_db import PatternDatabase, bucket_floors, family_floor, keep_slowest
+from .instances import DISTRIBUTIONS, generate_instance
+
+EDGES = (1, 2, 3, 5, 8, 12, 20, 30, 50, 80, 120, 200, 500, 1_000, 2_000, 5_000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--people", type=int, default=14)
+    parser.add_argument("--capacity", type=int, default=3)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="ties")
+    parser.add_argument("--instances", type=int, default=5)
+    parser.add_argument("--keep", type=int, default=8, help="exact times kept by the per-roster database")
+    parser.add_argument("--tightness", type=float, default=1.5)
+    parser.add_argument("--directory", help="where databases are saved (default: a temporary directory)")
+    args = parser.parse_args()
+
+    instances = [generate_instance(args.people, args.capacity, args.distribution, args.tightness, seed)
+                 for seed in range(args.instances)]
+    directory = args.directory or tempfile.mkdtemp(prefix="pattern-db-")
+
+    floor = bucket_floors(family_floor([[p.get_crossing_time() for p in persons] for persons, _ in instances]),
+                          EDGES)
+    start = time.perf_counter()
+    built = PatternDatabase.build(floor, args.capacity)
+    build_seconds = time.perf_counter() - start
+    path = os.path.join(directory, "family.npy")
+    built.save(path)
+    start = time.perf_counter()
+    family = PatternDatabase.load(path)
+    load_seconds = time.perf_counter() - start
+    print(f"family database: {family.get_num_states():,} states, {family.get_nbytes():,} bytes, "
+          f"built in {build_seconds:.2f} s, loaded in {load_seconds * 1000:.2f} ms")
+
+    print(f"{'seed':>4} {'optimum':>8} {'h/opt':>6} {'+family':>8} {'+keep':>6} {'nodes':>9} "
+          f"{'+family':>9} {'+keep':>9} {'keep build s':>13}")
+    totals = [0, 0, 0]
+    for seed, (persons, bridge) in enumerate(instances):
+        start = time.perf_counter()
+        own = PatternDatabase.build(keep_slowest([p.get_crossing_time() for p in persons], args.keep),
+                                    args.capacity)
+        own_seconds = time.perf_counter() - start
+
+        solvers = [AStarSolver(bridge, persons), AStarSolver(bridge, persons, pattern_databases=[family]),
+                   AStarSolver(bridge, persons, pattern_databases=[own])]
+        results = [solver.solve() for solver in solvers]
+        optimum = results[0].get_total_time()
+        if any(result.get_total_time() != optimum for result in results):
+            raise AssertionError(f"heuristics disagree on the optimum: {results}")
+        space = solvers[0].get_space()
+        estimates = [space.lower_bound(0), max(space.lower_bound(0), family.heuristic(space)(0)),
+                     max(space.lower_bound(0), own.heuristic(space)(0))]
+        nodes = [result.get_nodes_expanded() for result in results]
+        totals = [total + count for total, count in zip(totals, nodes)]
+        strength = " ".join(f"{estimate / optimum:>{width}.2f}" if optimum else f"{'-':>{width}}"
+                            for estimate, width in zip(estimates, (6, 8, 6)))
+        print(f"{seed:>4} {optimum if optimum is not None else '-':>8} {strength} "
+              f"{nodes[0]:>9,} {nodes[1]:>9,} {nodes[2]:>9,} {own_seconds:>13.2f}")
+
+    if totals[0]:
+        print(f"node reduction: family {1 - totals[1] / totals[0]:.1%}, keep-{args.keep} {1 - totals[2] / totals[0]:.1%}")
+
+
+if __name__ == "__main__":
+    main()
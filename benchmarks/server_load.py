@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Load test for the game server: moves per second and latency at many concurrent sessions.
+
+Opens `--connections` sockets, creates `--sessions` classic-puzzle sessions
+spread over them, and has every session play the 17-minute solution and
+undo it `--rounds` times, all at once: each session keeps one request in
+flight, so up to `--sessions` requests are queued at any moment. Latency
+is from writing a request to reading its reply. Unless `--connect` names a
+running server, one is started in a separate process.
+
+Usage: python -m benchmarks.server_load [--sessions 10000] [--connections 50] [--rounds 2] [--connect HOST:PORT]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import time
+from collections import deque
+from typing import List
+from server import serve
+
+# The classic optimal schedule as roster indices: You + Lab Assistant over,
+# You back, Worker + Scientist over, Lab Assistant back, both fast ones over.
+SOLUTION = ("0,1", "0", "2,3", "1", "0,1")
+
+
+class Connection:
+    """One socket with pipelined requests; replies are matched to requests in order."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, latencies: List[float]):
+        self._reader = reader
+        self._writer = writer
+        self._latencies = latencies
+        self._waiting = deque()
+        self._receiver = asyncio.create_task(self._receive())
+
+    async def request(self, line: str) -> str:
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append((future, time.perf_counter()))
+        self._writer.write(line.encode() + b"\n")
+        return await future
+
+    async def close(self) -> None:
+        self._receiver.cancel()
+        self._writer.close()
+
+    async def _receive(self) -> None:
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                return
+            future, sent = self._waiting.popleft()
+            self._latencies.append(time.perf_counter() - sent)
+            future.set_result(line.decode().rstrip("\n"))
+
+
+async def play(connection: Connection, rounds: int) -> int:
+    reply = await connection.request("NEW")
+    session = reply.split()[1]
+    moves = 0
+    for _ in range(rounds):
+        for group in SOLUTION:
+            reply = await connection.request(f"MOVE {session} {group}")
+            if not reply.startswith("OK"):
+                raise AssertionError(f"move {group} of session {session} refused: {reply}")
+            moves += 1
+        if not reply.endswith("status=won"):
+            raise AssertionError(f"session {session} did not win: {reply}")
+        for _ in SOLUTION:
+            await connection.request(f"UNDO {session}")
+            moves += 1
+    await connection.request(f"CLOSE {session}")
+    return moves
+
+
+async def run_load(host: str, port: int, sessions: int, connections: int, rounds: int) -> None:
+    latencies: List[float] = []
+    links = [Connection(*await asyncio.open_connection(host, port), latencies) for _ in range(connections)]
+    start = time.perf_counter()
+    moves = sum(await asyncio.gather(*(play(links[i % connections], rounds) for i in range(sessions))))
+    elapsed = time.perf_counter() - start
+    stats = await links[0].request("STATS")
+    for link in links:
+        await link.close()
+
+    latencies.sort()
+    percentile = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+    print(f"{sessions:,} sessions over {connections} connections, {len(latencies):,} requests in {elapsed:.2f} s")
+    print(f"moves (MOVE + UNDO): {moves:,} -> {moves / elapsed:,.0f} moves/s, "
+          f"{len(latencies) / elapsed:,.0f} requests/s")
+    print(f"latency: p50 {percentile(0.50):.2f} ms, p99 {percentile(0.99):.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+    print(f"server: {stats}")
+
+
+def run_server(port: int) -> None:
+    asyncio.run(serve("127.0.0.1", port, idle_timeout=300.0, max_sessions=1_000_000))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--connect", help="HOST:PORT of a running server (default: start one)")
+    args = parser.parse_args()
+
+    server = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        port = int(port)
+    else:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            host, port = probe.getsockname()
+        server = multiprocessing.Process(target=run_server, args=(port,), daemon=True)
+        server.start()
+        for _ in range(100):
+            try:
+                socket.create_connection((host, port)).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+    try:
+        asyncio.run(run_load(host, int(port), args.sessions, args.connections, args.rounds))
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
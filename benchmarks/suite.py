@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: every solver and the GameState primitives on generated instances.
+
+Instances come from `benchmarks.instances`, varying the roster size, the
+capacity, the crossing-time distribution and the tightness of the time
+limit. Each case is timed (best of `--repeats`, each averaged over enough
+calls to last 50 ms) and written as JSON; with
+`--baseline`, the run is compared against a saved result file and the exit
+status is 1 if any case got slower than `--threshold` allows or an optimal
+solver's total changed.
+
+Usage: python -m benchmarks.suite [--quick] [--output results.json] [--baseline baseline.json]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List
+from models import Flashlight, GameState, Move
+from solvers import (AStarSolver, BidirectionalSolver, BranchAndBoundSolver, BruteForceSolver, DijkstraSolver,
+                     GreedySolver, IncrementalSolver, ParallelSolver)
+from .instances import DISTRIBUTIONS, generate_instance
+
+# Solver name -> factory(bridge, persons) and the cases it is practical for:
+# the largest roster, and optionally the only capacities and distributions.
+SOLVERS: Dict[str, dict] = {
+    "greedy": {"factory": GreedySolver, "max_people": 100_000, "capacities": (2,)},
+    "astar": {"factory": AStarSolver, "max_people": 12},
+    "astar_symmetric": {"factory": lambda bridge, persons: AStarSolver(bridge, persons, symmetric=True),
+                        "max_people": 12},
+    "dijkstra": {"factory": DijkstraSolver, "max_people": 10},
+    "bidirectional": {"factory": BidirectionalSolver, "max_people": 10},
+    "branch_and_bound": {"factory": BranchAndBoundSolver, "max_people": 8},
+    "incremental": {"factory": IncrementalSolver, "max_people": 12},
+    "parallel": {"factory": lambda bridge, persons: ParallelSolver(bridge, persons, workers=2), "max_people": 10},
+    # Exhaustive: slack over the fastest people's times multiplies the schedules.
+    "brute_force": {"factory": BruteForceSolver, "max_people": 4, "capacities": (2,),
+                    "distributions": ("uniform", "ties")},
+}
+
+FULL_GRID = {
+    "search_people": (4, 6, 8, 10, 12),
+    "greedy_people": (4, 100, 1_000, 10_000, 100_000),
+    "capacities": (2, 3, 4, 5, 6),
+    "tightness": (1.0, 1.5),
+    "primitive_people": (10, 100, 1_000),
+}
+QUICK_GRID = {
+    "search_people": (4, 8),
+    "greedy_people": (4, 1_000),
+    "capacities": (2, 3),
+    "tightness": (1.0,),
+    "primitive_people": (10, 100),
+}
+
+
+def per_call(function: Callable[[], object], min_seconds: float = 0.05) -> float:
+    """Seconds per call of `function`, averaged over enough calls to last `min_seconds`."""
+    calls, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < min_seconds:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / calls
+
+
+def solver_cases(grid: dict, seed: int) -> Iterator[dict]:
+    for solver_name, limits in SOLVERS.items():
+        people = grid["greedy_people"] if solver_name == "greedy" else grid["search_people"]
+        for num_people in people:
+            if num_people > limits["max_people"]:
+                continue
+            for capacity in limits.get("capacities", grid["capacities"]):
+                if capacity >= num_people and capacity != 2:
+                    continue
+                for distribution in limits.get("distributions", DISTRIBUTIONS):
+                    for tightness in grid["tightness"]:
+                        yield {"kind": "solver", "solver": solver_name, "people": num_people,
+                               "capacity": capacity, "distribution": distribution,
+                               "tightness": tightness, "seed": seed}
+
+
+def run_solver_case(case: dict, repeats: int) -> dict:
+    persons, bridge = generate_instance(case["people"], case["capacity"], case["distribution"],
+                                        case["tightness"], case["seed"])
+    factory = SOLVERS[case["solver"]]["factory"]
+    result = factory(bridge, persons).solve()
+    seconds = min(per_call(lambda: factory(bridge, persons).solve()) for _ in range(repeats))
+    return {"seconds": seconds, "total_time": result.get_total_time(),
+            "nodes_expanded": result.get_nodes_expanded()}
+
+
+def primitive_cases(grid: dict, seed: int) -> Iterator[dict]:
+    for primitive in ("get_valid_moves", "make_move", "deepcopy"):
+        for num_people in grid["primitive_people"]:
+            yield {"kind": "primitive", "primitive": primitive, "people": num_people, "capacity": 2,
+                   "distribution": "uniform", "seed": seed}
+
+
+def run_primitive_case(case: dict, repeats: int) -> dict:
+    persons, bridge = generate_instance(case["people"], case["capacity"], case["distribution"],
+                                        10.0, case["seed"])
+    state = GameState(bridge, Flashlight(), persons)
+    fastest = sorted(persons, key=lambda p: p.get_crossing_time())[:2]
+    if case["primitive"] == "get_valid_moves":
+        function = state.get_valid_moves
+    elif case["primitive"] == "make_move":
+        # A forward and back pair, undone each time so the state stays put.
+        start = state.checkpoint()
+
+        def function():
+            state.make_move(Move(fastest, "left_to_right"))
+            state.make_move(Move(fastest[:1], "right_to_left"))
+            state.rollback(start)
+    else:
+        function = state.deepcopy
+    seconds = min(per_call(function) for _ in range(repeats))
+    return {"seconds": seconds}
+
+
+def case_name(case: dict) -> str:
+    if case["kind"] == "primitive":
+        return f"primitive/{case['primitive']}/n={case['people']}"
+    return (f"solver/{case['solver']}/n={case['people']}/c={case['capacity']}/"
+            f"{case['distribution']}/tight={case['tightness']}")
+
+
+def run_suite(grid: dict, repeats: int, seed: int, verbose: bool = True) -> dict:
+    results = {}
+    cases = list(solver_cases(grid, seed)) + list(primitive_cases(grid, seed))
+    for number, case in enumerate(cases, 1):
+        runner = run_solver_case if case["kind"] == "solver" else run_primitive_case
+        outcome = runner(case, repeats)
+        name = case_name(case)
+        results[name] = {**case, **outcome}
+        if verbose:
+            print(f"[{number}/{len(cases)}] {name}: {outcome['seconds'] * 1000:.3f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """Print each shared case's speed against the baseline; return the regressions."""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] > 0 else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  SLOWER"
+            regressions.append(f"{name}: {ratio:.2f}x slower")
+        if result.get("total_time") != before.get("total_time"):
+            flag += "  RESULT CHANGED"
+            regressions.append(f"{name}: total {before.get('total_time')} -> {result.get('total_time')}")
+        print(f"{name:<60} {before['seconds'] * 1000:>10.3f} ms -> {result['seconds'] * 1000:>10.3f} ms "
+              f"({ratio:5.2f}x){flag}", file=sys.stderr)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="run a small grid")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this earlier results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before a case is flagged")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    current = run_suite(QUICK_GRID if args.quick else FULL_GRID, args.repeats, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(current, output, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
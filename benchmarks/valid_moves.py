@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Move-generation benchmark: GameState.iter_valid_moves versus checking every candidate.
+
+The reference builds every group of up to the bridge capacity from the
+flashlight side and keeps those `GameState.can_make_move` accepts, which is
+how `get_valid_moves` used to work. Both must produce the same set of moves.
+
+Usage: python -m benchmarks.valid_moves [--people 50] [--capacity 2] [--max-time 150] [--repeats 20]
+"""
+import argparse
+import random
+import time
+from itertools import combinations
+from models import Bridge, Flashlight, GameState, Move, Person
+
+
+def reference_valid_moves(state: GameState):
+    if state.is_flashlight_on_right():
+        side, direction = state.get_right_side(), "right_to_left"
+    else:
+        side, direction = state.get_left_side(), "left_to_right"
+    candidates = (Move(group, direction)
+                  for size in range(1, state._bridge.get_capacity() + 1)
+                  for group in combinations(side, size))
+    return [move for move in candidates if state.can_make_move(move)]
+
+
+def as_set(move: Move):
+    return frozenset(move.get_crossing_persons()), move.get_direction()
+
+
+def time_per_call(function, state: GameState, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function(state)
+    return (time.perf_counter() - start) / repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--people", type=int, default=50)
+    parser.add_argument("--capacity", type=int, default=2)
+    parser.add_argument("--max-time", type=int, default=150)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    persons = [Person(f"P{i}", rng.randint(1, 100)) for i in range(args.people)]
+    state = GameState(Bridge(capacity=args.capacity, max_time=args.max_time), Flashlight(), persons)
+
+    # Measure at the start and after a couple of moves, when the time left is shorter.
+    for label in ("start", "after 2 moves"):
+        lazy = state.get_valid_moves()
+        reference = reference_valid_moves(state)
+        if len(lazy) != len(reference) or set(map(as_set, lazy)) != set(map(as_set, reference)):
+            raise AssertionError("iter_valid_moves and the reference disagree")
+
+        lazy_seconds = time_per_call(GameState.get_valid_moves, state, args.repeats)
+        reference_seconds = time_per_call(reference_valid_moves, state, args.repeats)
+        first_seconds = time_per_call(lambda s: next(s.iter_valid_moves(), None), state, args.repeats)
+        print(f"{label}: {len(lazy):,} valid moves, {state.get_remaining_time()} min left")
+        print(f"  check every candidate:  {reference_seconds * 1000:9.3f} ms")
+        print(f"  get_valid_moves:        {lazy_seconds * 1000:9.3f} ms "
+              f"({reference_seconds / lazy_seconds:.1f}x)")
+        print(f"  first lazy move:        {first_seconds * 1000:9.3f} ms")
+
+        if label == "start":
+            fastest = sorted(persons, key=Person.get_crossing_time)
+            state.make_move(Move(fastest[:2], "left_to_right"))
+            state.make_move(Move(fastest[:1], "right_to_left"))
+
+
+if __name__ == "__main__":
+    main()
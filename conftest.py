@@ -0,0 +1 @@
+# Lets pytest import the top-level packages (models, solvers, ...) from the tests.
@@ -0,0 +1,5 @@
+from .puzzle_gui import PuzzleGUI, SpriteCache
+__all__ = [
+    "PuzzleGUI",
+    "SpriteCache",
+]
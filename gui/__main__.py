@@ -0,0 +1,3 @@
+from .puzzle_gui import main
+
+main()
@@ -0,0 +1,507 @@
+"""
+Pygame frontend for the bridge puzzle, driven by `GameState`.
+
+Click people on the flashlight's side to select them, then press Space or
+Enter to send them across. U takes back the last move, R starts over and A
+plays the optimal schedule. Rosters of hundreds of people are laid out in a
+grid on each bank.
+
+Rendering keeps a static layer (background, people standing still, the
+flashlight and the status bar) and only touches what changes: each frame
+restores the static layer under the rectangles that moved and draws the
+crossing people on top, and only those rectangles are sent to the display.
+Each person's token is rendered once per style by `SpriteCache`. Game logic
+and animation advance in fixed steps of `UPDATE_STEP` seconds, however
+fast or slow frames are drawn.
+
+Usage: python -m gui [--people 4] [--capacity 2] [--max-time 17] [--headless --frames 600]
+"""
+import argparse
+import math
+import os
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, GameState, Move, Person
+from solvers import StateSpace, solve
+from solvers.greedy import escort_schedule
+
+UPDATE_STEP = 1 / 120
+# Longest frame the update loop catches up on, so a stall does not cause a burst of steps.
+MAX_FRAME_TIME = 0.25
+
+BACKGROUND = (24, 28, 36)
+BANK = (46, 74, 52)
+RIVER = (30, 58, 96)
+PLANKS = (120, 86, 52)
+HUD = (16, 18, 24)
+TEXT = (230, 230, 230)
+TOKEN_STYLES = {"idle": ((70, 90, 140), TEXT), "selected": ((220, 170, 40), (20, 20, 20))}
+LAMP = (255, 221, 87)
+
+
+class SpriteCache:
+    """
+    Pre-rendered person tokens, keyed by name, crossing time and style.
+
+    Rendering text is by far the most expensive drawing call, so each token
+    is rendered once and blitted from then on.
+    """
+
+    def __init__(self, size: Tuple[int, int], font_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            size (Tuple[int, int]): Token width and height in pixels
+            font_size (int): Label font size
+        """
+        import pygame
+        self._size = size
+        self._font = pygame.font.Font(None, font_size)
+        self._sprites: Dict[Tuple[str, int, str], "pygame.Surface"] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, person: Person, style: str = "idle"):
+        key = (person.get_name(), person.get_crossing_time(), style)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._hits += 1
+            return sprite
+
+        import pygame
+        self._misses += 1
+        fill, color = TOKEN_STYLES[style]
+        sprite = pygame.Surface(self._size)
+        sprite.fill(fill)
+        pygame.draw.rect(sprite, BACKGROUND, sprite.get_rect(), 1)
+        label = self._font.render(f"{person.get_name()} {person.get_crossing_time()}", True, color)
+        sprite.blit(label, (3, (self._size[1] - label.get_height()) // 2))
+        self._sprites[key] = sprite
+        return sprite
+
+    def get_hits(self) -> int:
+        return self._hits
+
+    def get_misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+
+class PuzzleGUI:
+    """
+    Window showing a `GameState` on two banks joined by the bridge.
+
+    Every person keeps the same grid slot on both banks (their roster
+    index), so a crossing only moves the people in it. The game state is
+    updated as soon as a move starts; the animation only catches the
+    picture up, taking `seconds_per_minute` per minute of crossing time.
+    """
+
+    def __init__(self, game_state: GameState, persons: Sequence[Person], size: Tuple[int, int] = (1280, 720),
+                 headless: bool = False, dirty_rects: bool = True, fps: int = 60,
+                 seconds_per_minute: float = 0.05):
+        """
+        Open the window.
+
+        Args:
+            game_state (GameState): The game to show and play
+            persons (Sequence[Person]): The game's roster, in roster order
+            size (Tuple[int, int]): Window size in pixels
+            headless (bool): Render off screen with SDL's dummy video driver
+            dirty_rects (bool): Update only changed rectangles; False redraws the whole frame
+            fps (int): Frame rate cap; 0 runs uncapped
+            seconds_per_minute (float): Animation time per minute of crossing time
+        """
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        import pygame
+        pygame.init()
+        pygame.display.set_caption("Bridge and Flashlight Puzzle")
+        self._pygame = pygame
+        self._screen = pygame.display.set_mode(size)
+        self._game_state = game_state
+        self._persons = list(persons)
+        self._dirty_rects = dirty_rects
+        self._fps = fps
+        self._seconds_per_minute = seconds_per_minute
+
+        width, height = size
+        hud_height = 36
+        bank_width = width * 2 // 5
+        self._hud = pygame.Rect(0, 0, width, hud_height)
+        self._banks = (pygame.Rect(0, hud_height, bank_width, height - hud_height),
+                       pygame.Rect(width - bank_width, hud_height, bank_width, height - hud_height))
+        self._bridge_y = hud_height + (height - hud_height) // 2
+
+        # Tokens four times as wide as tall, as large as fits the roster on one bank.
+        count = max(1, len(self._persons))
+        token_height = int(max(10, min(24, math.sqrt(bank_width * (height - hud_height) / count / 4))))
+        self._columns = max(1, bank_width // (4 * token_height))
+        while math.ceil(count / self._columns) * token_height > height - hud_height and token_height > 6:
+            token_height -= 1
+            self._columns = max(1, bank_width // (4 * token_height))
+        self._token_size = (bank_width // self._columns, token_height)
+        self._sprites = SpriteCache(self._token_size, max(10, token_height))
+        self._hud_font = pygame.font.Font(None, 26)
+
+        self._background = self._draw_background(size)
+        self._layer = self._background.copy()
+        self._dirty: List["pygame.Rect"] = []
+        self._moving_rects: List["pygame.Rect"] = []
+
+        self._on_right = [False] * len(self._persons)
+        self._selected: List[int] = []
+        # Current animation: (person_index, waypoints) per mover, progress and duration.
+        self._movers: List[Tuple[int, List[Tuple[float, float]]]] = []
+        self._progress = 0.0
+        self._duration = 0.0
+        self._plan: List[Move] = []
+        self._autoplay = False
+        self._message = ""
+        self._hud_text = None
+        self._frame_times: List[float] = []
+        self._crossings = 0
+        self._redraw_all()
+
+    def get_frame_times(self) -> List[float]:
+        """Seconds spent on each frame's events, updates and drawing (not on waiting for the cap)."""
+        return self._frame_times.copy()
+
+    def get_crossings(self) -> int:
+        """Return how many crossings were animated, across restarts."""
+        return self._crossings
+
+    def get_sprite_cache(self) -> SpriteCache:
+        return self._sprites
+
+    def get_token_size(self) -> Tuple[int, int]:
+        return self._token_size
+
+    def is_animating(self) -> bool:
+        return bool(self._movers)
+
+    def run(self, max_frames: Optional[int] = None, autoplay: bool = False, frame_dt: Optional[float] = None) -> None:
+        """
+        Run the event loop until the window is closed (or `max_frames` frames are drawn).
+
+        Args:
+            max_frames (Optional[int]): Stop after this many frames
+            autoplay (bool): Keep playing the optimal schedule, starting over after each win
+            frame_dt (Optional[float]): Advance the game this much per frame instead of by the
+                wall clock, so a benchmark sees the same work whatever its frame rate
+        """
+        pygame = self._pygame
+        clock = pygame.time.Clock()
+        self._autoplay = autoplay
+        accumulator = 0.0
+        previous = time.perf_counter()
+        frames = 0
+        running = True
+        while running and (max_frames is None or frames < max_frames):
+            start = time.perf_counter()
+            accumulator += frame_dt if frame_dt is not None else min(start - previous, MAX_FRAME_TIME)
+            previous = start
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    running = self._on_key(event.key)
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    self._on_click(event.pos)
+            while accumulator >= UPDATE_STEP:
+                self.update(UPDATE_STEP)
+                accumulator -= UPDATE_STEP
+            self.render()
+            self._frame_times.append(time.perf_counter() - start)
+            frames += 1
+            if self._fps:
+                clock.tick(self._fps)
+
+    def update(self, dt: float) -> None:
+        """Advance the animation by `dt` seconds and start the next planned move when it ends."""
+        if self._movers:
+            self._progress = min(1.0, self._progress + dt / self._duration)
+            if self._progress >= 1.0:
+                self._finish_crossing()
+        if not self._movers and self._autoplay:
+            if self._game_state.is_game_won():
+                self.reset()
+            if not self._plan:
+                self._plan = self._plan_moves()
+            if self._plan:
+                self._start_crossing(self._plan.pop(0))
+            else:
+                self._stop_autoplay()
+
+    def render(self) -> None:
+        self._update_hud()
+        screen = self._screen
+        current = [self._blit_position(waypoints) for _, waypoints in self._movers]
+        current_rects = [self._pygame.Rect(position, self._token_size) for position in current]
+
+        if not self._dirty_rects:
+            screen.blit(self._layer, (0, 0))
+        else:
+            rects = self._dirty + self._moving_rects + current_rects
+            for rect in rects:
+                screen.blit(self._layer, rect, rect)
+        self._draw_movers(current)
+        if self._dirty_rects:
+            self._pygame.display.update(self._dirty + self._moving_rects + current_rects)
+        else:
+            self._pygame.display.flip()
+        self._dirty = []
+        self._moving_rects = current_rects
+
+    def cross_selected(self) -> bool:
+        """Send the selected people across; returns False (and says why) if the move is not allowed."""
+        if self._movers or not self._selected:
+            return False
+        direction = "right_to_left" if self._game_state.is_flashlight_on_right() else "left_to_right"
+        move = Move([self._persons[i] for i in self._selected], direction)
+        if not self._game_state.can_make_move(move):
+            self._message = "That move is not allowed"
+            return False
+        self._start_crossing(move)
+        return True
+
+    def undo(self) -> None:
+        if self._movers:
+            return
+        move = self._game_state.undo_move()
+        if move is None:
+            return
+        self._clear_selection()
+        indices = [self._game_state.get_person_index(p) for p in move.get_crossing_persons()]
+        for index in indices:
+            self._erase_token(index)
+            self._on_right[index] = not self._on_right[index]
+        for index in indices:
+            self._draw_token(index)
+        self._draw_lamp()
+        self._message = ""
+
+    def reset(self) -> None:
+        self._game_state.reset()
+        self._movers = []
+        self._selected = []
+        self._plan = []
+        self._message = ""
+        self._on_right = [False] * len(self._persons)
+        self._redraw_all()
+
+    def close(self) -> None:
+        self._pygame.quit()
+
+    def _plan_moves(self) -> List[Move]:
+        """Optimal schedule from the start: the solvers for small or capacity-2 rosters, else the escort schedule."""
+        bridge = Bridge(self._capacity(), 10 ** 9)
+        if bridge.get_capacity() == 2 or len(self._persons) <= 12:
+            return solve(bridge, self._persons).get_moves() or []
+        space = StateSpace(self._persons, bridge.get_capacity())
+        groups = escort_schedule(space.get_times(), bridge.get_capacity())
+        return space.to_moves(groups) if groups else []
+
+    def _capacity(self) -> int:
+        return self._game_state._bridge.get_capacity()
+
+    def _on_key(self, key: int) -> bool:
+        pygame = self._pygame
+        if key in (pygame.K_ESCAPE, pygame.K_q):
+            return False
+        if key in (pygame.K_SPACE, pygame.K_RETURN):
+            self.cross_selected()
+        elif key == pygame.K_u:
+            self.undo()
+        elif key == pygame.K_r:
+            self.reset()
+        elif key == pygame.K_a:
+            if self._game_state.get_move_history():
+                self.reset()
+            self._autoplay = True
+        return True
+
+    def _on_click(self, position: Tuple[int, int]) -> None:
+        if self._movers or self._game_state.is_game_over():
+            return
+        on_right = self._game_state.is_flashlight_on_right()
+        bank = self._banks[on_right]
+        if not bank.collidepoint(position):
+            return
+        column = (position[0] - bank.x) // self._token_size[0]
+        index = (position[1] - bank.y) // self._token_size[1] * self._columns + column
+        if column >= self._columns or index >= len(self._persons) or self._on_right[index] != on_right:
+            return
+        if index in self._selected:
+            self._selected.remove(index)
+        elif len(self._selected) < self._capacity():
+            self._selected.append(index)
+        else:
+            return
+        self._draw_token(index)
+
+    def _start_crossing(self, move: Move) -> None:
+        if not self._game_state.make_move(move):
+            # Only planned moves get here (e.g. the optimum is over the time
+            # limit); planning again would fail the same way every frame.
+            self._stop_autoplay()
+            return
+        self._clear_selection()
+        self._erase_lamp()
+        self._movers = []
+        for person in move.get_crossing_persons():
+            index = self._game_state.get_person_index(person)
+            self._erase_token(index)
+            start = self._slot(index, self._on_right[index])
+            end = self._slot(index, not self._on_right[index])
+            self._movers.append((index, self._path(start.topleft, end.topleft)))
+        self._crossings += 1
+        self._progress = 0.0
+        self._duration = max(0.25, min(1.5, move.get_time_taken() * self._seconds_per_minute))
+        self._message = ""
+
+    def _stop_autoplay(self) -> None:
+        self._autoplay = False
+        self._plan = []
+        self._message = "No schedule fits the time limit"
+
+    def _finish_crossing(self) -> None:
+        for index, _ in self._movers:
+            self._on_right[index] = not self._on_right[index]
+            self._draw_token(index)
+        self._movers = []
+        self._draw_lamp()
+
+    def _path(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[float, float]]:
+        """Waypoints from a slot to the bridge, across it and on to the other slot."""
+        left, right = self._banks[0].right, self._banks[1].left - self._token_size[0]
+        y = self._bridge_y - self._token_size[1] // 2
+        ends = (left, right) if start[0] < end[0] else (right, left)
+        return [start, (ends[0], y), (ends[1], y), end]
+
+    def _blit_position(self, waypoints: List[Tuple[float, float]]) -> Tuple[int, int]:
+        # A fifth of the time to reach the bridge, three fifths on it, a fifth to the slot.
+        t = self._progress
+        segment, fraction = (0, t / 0.2) if t < 0.2 else (1, (t - 0.2) / 0.6) if t < 0.8 else (2, (t - 0.8) / 0.2)
+        (x0, y0), (x1, y1) = waypoints[segment], waypoints[segment + 1]
+        return round(x0 + (x1 - x0) * fraction), round(y0 + (y1 - y0) * fraction)
+
+    def _draw_movers(self, positions: List[Tuple[int, int]]) -> None:
+        for (index, _), position in zip(self._movers, positions):
+            self._screen.blit(self._sprites.get(self._persons[index]), position)
+        if positions:
+            x, y = positions[0]
+            self._pygame.draw.circle(self._screen, LAMP, (x + 6, y + self._token_size[1] // 2), 4)
+
+    def _slot(self, index: int, on_right: bool):
+        bank = self._banks[on_right]
+        width, height = self._token_size
+        return self._pygame.Rect(bank.x + index % self._columns * width, bank.y + index // self._columns * height,
+                                 width, height)
+
+    def _draw_token(self, index: int) -> None:
+        rect = self._slot(index, self._on_right[index])
+        style = "selected" if index in self._selected else "idle"
+        self._layer.blit(self._sprites.get(self._persons[index], style), rect)
+        self._dirty.append(rect)
+
+    def _erase_token(self, index: int) -> None:
+        rect = self._slot(index, self._on_right[index])
+        self._layer.blit(self._background, rect, rect)
+        self._dirty.append(rect)
+
+    def _lamp_rect(self, on_right: bool):
+        x = self._banks[0].right + 8 if not on_right else self._banks[1].left - 24
+        return self._pygame.Rect(x, self._bridge_y - 40, 16, 16)
+
+    def _draw_lamp(self) -> None:
+        if self._game_state.get_flashlight_holder() is None:
+            return
+        rect = self._lamp_rect(self._game_state.is_flashlight_on_right())
+        self._pygame.draw.circle(self._layer, LAMP, rect.center, 7)
+        self._dirty.append(rect)
+
+    def _erase_lamp(self) -> None:
+        rect = self._lamp_rect(self._game_state.is_flashlight_on_right())
+        self._layer.blit(self._background, rect, rect)
+        self._dirty.append(rect)
+
+    def _clear_selection(self) -> None:
+        selected, self._selected = self._selected, []
+        for index in selected:
+            self._draw_token(index)
+
+    def _update_hud(self) -> None:
+        state = self._game_state
+        if state.is_game_won():
+            status = "Everyone crossed!"
+        elif state.is_game_over():
+            status = "Out of time"
+        else:
+            status = self._message or f"{len(self._selected)}/{self._capacity()} selected"
+        text = (f"Time {state.get_elapsed_time()}/{state._bridge.get_max_time()}   "
+                f"Remaining {state.get_remaining_time()}   Moves {len(state.get_move_history())}   {status}")
+        if text == self._hud_text:
+            return
+        self._hud_text = text
+        self._layer.fill(HUD, self._hud)
+        self._layer.blit(self._hud_font.render(text, True, TEXT), (10, 9))
+        self._dirty.append(self._hud)
+
+    def _draw_background(self, size: Tuple[int, int]):
+        pygame = self._pygame
+        surface = pygame.Surface(size)
+        surface.fill(RIVER)
+        for bank in self._banks:
+            surface.fill(BANK, bank)
+        deck = pygame.Rect(self._banks[0].right, self._bridge_y - 14, self._banks[1].left - self._banks[0].right, 28)
+        surface.fill(PLANKS, deck)
+        for x in range(deck.left, deck.right, 12):
+            pygame.draw.line(surface, BACKGROUND, (x, deck.top), (x, deck.bottom - 1))
+        surface.fill(HUD, self._hud)
+        return surface
+
+    def _redraw_all(self) -> None:
+        self._layer.blit(self._background, (0, 0))
+        for index in range(len(self._persons)):
+            self._draw_token(index)
+        self._draw_lamp()
+        self._hud_text = None
+        self._dirty = [self._screen.get_rect()]
+
+
+def make_roster(num_people: int, seed: int = 0) -> List[Person]:
+    """The classic four people, or `num_people` random ones (1 to 100 minutes each)."""
+    if num_people == 4:
+        return [Person("You", 1), Person("Lab", 2), Person("Worker", 5), Person("Scientist", 10)]
+    rng = random.Random(seed)
+    return [Person(f"P{i}", rng.randint(1, 100)) for i in range(num_people)]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Play the bridge puzzle in a pygame window.")
+    parser.add_argument("--people", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=2)
+    parser.add_argument("--max-time", type=int, help="time limit (default: 17 for the classic four, else generous)")
+    parser.add_argument("--headless", action="store_true", help="render off screen and report frame times")
+    parser.add_argument("--frames", type=int, default=600, help="frames to render with --headless")
+    args = parser.parse_args(argv)
+
+    persons = make_roster(args.people)
+    max_time = args.max_time or (17 if args.people == 4 else 2 * sum(p.get_crossing_time() for p in persons))
+    game_state = GameState(Bridge(args.capacity, max_time), Flashlight(), persons)
+    gui = PuzzleGUI(game_state, persons, headless=args.headless, fps=0 if args.headless else 60)
+    try:
+        if args.headless:
+            gui.run(max_frames=args.frames, autoplay=True, frame_dt=1 / 60)
+            times = sorted(gui.get_frame_times())
+            print(f"{len(times)} frames: mean {sum(times) / len(times) * 1000:.2f} ms, "
+                  f"p99 {times[int(0.99 * (len(times) - 1))] * 1000:.2f} ms")
+        else:
+            gui.run()
+    finally:
+        gui.close()
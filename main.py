@@ -4,6 +4,7 @@ Bridge and Flashlight Puzzle - Main Demo
 Demonstrates the puzzle classes and shows the optimal solution.
 """
 from models import Person, Bridge, Flashlight, GameState, Move
+from solvers import AStarSolver, CostToGoTable
 
 
 def create_puzzle_setup():
@@ -50,7 +51,6 @@ def demonstrate_optimal_solution():
     print("=" * 60)
 
     game_state, people = create_puzzle_setup()
-    you, lab_assistant, worker, scientist = people
 
     print("\nInitial Setup:")
     print("- You (1 min), Lab Assistant (2 min), Worker (5 min), Scientist (10 min)")
@@ -60,14 +60,10 @@ def demonstrate_optimal_solution():
 
     print_game_state(game_state, 0)
 
-    # Optimal solution sequence
-    moves = [
-        Move([you, lab_assistant], "left_to_right"),  # You and Lab Assistant cross (2 min)
-        Move([you], "right_to_left"),  # You return with flashlight (1 min)
-        Move([worker, scientist], "left_to_right"),  # Worker and Scientist cross (10 min)
-        Move([lab_assistant], "right_to_left"),  # Lab Assistant returns (2 min)
-        Move([you, lab_assistant], "left_to_right"),  # You and Lab Assistant cross again (2 min)
-    ]
+    # Search for the optimal solution sequence
+    result = AStarSolver(game_state._bridge, people).solve()
+    print(f"\nSolver: {result}")
+    moves = result.get_moves() or []
 
     print(f"\nExecuting optimal solution:")
     total_time = 0
@@ -157,13 +153,14 @@ def play_interactive_game():
     game_state, people = create_puzzle_setup()
     you, lab_assistant, worker, scientist = people
 
-    print(f"\n⏰ TIME LIMIT: {game_state._bridge.get_max_time()} minutes")
-    print("Let's begin!")
+    # Minimum time left from every position, for hints, grades and warnings.
+    cost_table = CostToGoTable(game_state._bridge, people)
 
-    move_count = 0
+    print(f"\n⏰ TIME LIMIT: {game_state._bridge.get_max_time()} minutes")
+    print("Let's begin! Press 'h' at any time for a hint.")
 
     while not game_state.is_game_over():
-        move_count += 1
+        move_count = len(game_state.get_move_history()) + 1
         print(f"\n{'=' * 60}")
         print(f"MOVE #{move_count}")
         print(f"{'=' * 60}")
@@ -189,12 +186,28 @@ def play_interactive_game():
         # Get user choice
         while True:
             try:
-                choice = input(f"\nChoose your move (1-{len(valid_moves)}) or 'q' to quit: ").strip()
+                choice = input(f"\nChoose your move (1-{len(valid_moves)}), 'h' for a hint, "
+                               f"'u' to take back or 'q' to quit: ").strip()
 
                 if choice.lower() == 'q':
                     print("Thanks for playing! 👋")
                     return
 
+                if choice.lower() == 'h':
+                    hint = cost_table.get_hint(game_state)
+                    if hint is None:
+                        print("💡 No move can get everyone across in time from here; try 'u' to take back.")
+                    else:
+                        persons_str = " + ".join([p.get_name() for p in hint.get_crossing_persons()])
+                        direction = "→" if hint.get_direction() == "left_to_right" else "←"
+                        print(f"💡 Hint: {persons_str} {direction} "
+                              f"(everyone can be across in {cost_table.get_cost_to_go(game_state)} more minutes)")
+                    continue
+
+                if choice.lower() == 'u':
+                    selected_move = None
+                    break
+
                 choice_num = int(choice)
                 if 1 <= choice_num <= len(valid_moves):
                     selected_move = valid_moves[choice_num - 1]
@@ -202,7 +215,19 @@ def play_interactive_game():
                 else:
                     print(f"Please enter a number between 1 and {len(valid_moves)}")
             except ValueError:
-                print("Please enter a valid number or 'q' to quit")
+                print("Please enter a valid number, 'u' or 'q'")
+
+        if selected_move is None:
+            taken_back = game_state.undo_move()
+            if taken_back is None:
+                print("Nothing to take back yet!")
+            else:
+                persons_str = " + ".join([p.get_name() for p in taken_back.get_crossing_persons()])
+                print(f"\n↩️  Took back {persons_str} ({taken_back.get_time_taken()} min)")
+            continue
+
+        # Grade the move against the best one first (None once the game can no longer be won)
+        minutes_lost = cost_table.grade_move(game_state, selected_move)
 
         # Execute the move
         if game_state.make_move(selected_move):
@@ -213,6 +238,13 @@ def play_interactive_game():
             print(f"\n✅ {persons_str} {direction_word} in {time_taken} minutes!")
             print(f"⏱️  Total time elapsed: {game_state.get_elapsed_time()} minutes")
             print(f"⏰ Time remaining: {game_state.get_remaining_time()} minutes")
+
+            if minutes_lost == 0:
+                print("⭐ Optimal move!")
+            elif minutes_lost is not None:
+                print(f"🤔 The best move would have saved {minutes_lost} minute{'s' if minutes_lost != 1 else ''}.")
+            if not game_state.is_game_won() and not cost_table.can_still_win(game_state):
+                print("🧟 Warning: there is no longer enough time to get everyone across. Press 'u' to take back.")
         else:
             print("❌ Failed to execute move!")
 
@@ -243,9 +275,13 @@ def play_interactive_game():
     show_solution = input(f"\nWould you like to see the optimal solution? (y/n): ").strip().lower()
     if show_solution == 'y':
         print(f"\n{'📚' * 20}")
-        print("OPTIMAL SOLUTION:")
+        print(f"OPTIMAL SOLUTION ({cost_table.get_optimal_time()} minutes):")
         print(f"{'📚' * 20}")
-        demonstrate_optimal_solution()
+        fresh_state, _ = create_puzzle_setup()
+        for i, move in enumerate(cost_table.optimal_moves(fresh_state), 1):
+            persons_str = " + ".join([p.get_name() for p in move.get_crossing_persons()])
+            direction = "→" if move.get_direction() == "left_to_right" else "←"
+            print(f"{i}. {persons_str} {direction} ({move.get_time_taken()} min)")
 
 
 def display_current_state(game_state):
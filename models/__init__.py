@@ -3,10 +3,16 @@ from .person import Person
 from .flashlight import Flashlight
 from .game_state import GameState
 from .move import Move
+from .compact_state import CompactState
+from .crossing_times import CrossingTimeTable
+from .rules import crossing_error
 __all__ = [
     "Person",
     "Bridge",
     "Flashlight",
     "GameState",
     "Move",
+    "CompactState",
+    "CrossingTimeTable",
+    "crossing_error",
 ]
\ No newline at end of file
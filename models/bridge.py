@@ -5,6 +5,8 @@ from .person import Person
 class Bridge:
     """Represents the bridge, with capacity and time constraints."""
 
+    __slots__ = ("_capacity", "_max_time", "_is_destroyed")
+
     def __init__(self, capacity: int = 2, max_time: int = 17):
         self._capacity = capacity
         self._max_time = max_time
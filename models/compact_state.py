@@ -0,0 +1,68 @@
+class CompactState:
+    """
+    Immutable, hashable snapshot of a GameState position.
+
+    People are identified by their index in the game's roster, so the whole
+    position fits in one integer bitmask (bit ``i`` set means person ``i`` is
+    on the right side), a flashlight-side flag and the elapsed time.
+    """
+
+    __slots__ = ("_right_mask", "_flashlight_on_right", "_elapsed_time")
+
+    def __init__(self, right_mask: int, flashlight_on_right: bool, elapsed_time: int = 0):
+        """
+        Initialize the compact state.
+
+        Args:
+            right_mask (int): Bitmask of roster indices on the right side
+            flashlight_on_right (bool): True if the flashlight is on the right side
+            elapsed_time (int): Minutes elapsed so far
+        """
+        self._right_mask = right_mask
+        self._flashlight_on_right = flashlight_on_right
+        self._elapsed_time = elapsed_time
+
+    def get_right_mask(self) -> int:
+        return self._right_mask
+
+    def get_left_mask(self, num_persons: int) -> int:
+        return ((1 << num_persons) - 1) & ~self._right_mask
+
+    def is_flashlight_on_right(self) -> bool:
+        return self._flashlight_on_right
+
+    def get_elapsed_time(self) -> int:
+        return self._elapsed_time
+
+    def is_goal(self, num_persons: int) -> bool:
+        return self._right_mask == (1 << num_persons) - 1
+
+    def key(self) -> tuple:
+        """Return the position without the elapsed time (who is where, and the flashlight side)."""
+        return self._right_mask, self._flashlight_on_right
+
+    def __str__(self) -> str:
+        side = "right" if self._flashlight_on_right else "left"
+        return f"CompactState(right={self._right_mask:#b}, flashlight={side}, time={self._elapsed_time})"
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactState(right_mask={self._right_mask}, "
+            f"flashlight_on_right={self._flashlight_on_right}, elapsed_time={self._elapsed_time})"
+        )
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, CompactState)
+            and self._right_mask == other._right_mask
+            and self._flashlight_on_right == other._flashlight_on_right
+            and self._elapsed_time == other._elapsed_time
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._right_mask, self._flashlight_on_right, self._elapsed_time))
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"CompactState is immutable; cannot set '{name}'")
+        object.__setattr__(self, name, value)
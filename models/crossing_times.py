@@ -0,0 +1,56 @@
+from typing import List, Tuple
+from .person import Person
+
+
+class CrossingTimeTable:
+    """
+    Memoized crossing time for groups of a fixed roster.
+
+    Groups are keyed by a bitmask of roster indices (bit ``i`` is
+    ``persons[i]``). A group's time is computed once, as the slowest member's
+    time, and looked up in O(1) afterwards. Replacing the roster with
+    `set_roster` drops every cached entry.
+    """
+
+    def __init__(self, persons: List[Person], max_entries: int = 1 << 16):
+        """
+        Initialize the table.
+
+        Args:
+            persons (List[Person]): The roster, in index order
+            max_entries (int): Cache size at which the cache is cleared and refilled
+        """
+        self._max_entries = max_entries
+        self.set_roster(persons)
+
+    def set_roster(self, persons: List[Person]) -> None:
+        self._times = [p.get_crossing_time() for p in persons]
+        self._time_order = sorted((time, index) for index, time in enumerate(self._times))
+        self._cache = {}
+
+    def get_roster_size(self) -> int:
+        return len(self._times)
+
+    def get_time_order(self) -> List[Tuple[int, int]]:
+        """Return `(crossing_time, roster_index)` for everyone, fastest first."""
+        return self._time_order
+
+    def group_time(self, mask: int) -> int:
+        time = self._cache.get(mask)
+        if time is None:
+            time = 0
+            rest = mask
+            while rest:
+                low = rest & -rest
+                time = max(time, self._times[low.bit_length() - 1])
+                rest ^= low
+            if len(self._cache) >= self._max_entries:
+                self._cache.clear()
+            self._cache[mask] = time
+        return time
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f"CrossingTimeTable(roster={len(self._times)}, cached_groups={len(self._cache)})"
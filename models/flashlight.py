@@ -3,6 +3,8 @@ from .person import Person
 class Flashlight:
     """Single flashlight that can be passed between people."""
 
+    __slots__ = ("_is_on", "_current_holder")
+
     def __init__(self):
         self._is_on = True
         self._current_holder: Optional[Person] = None
@@ -1,11 +1,14 @@
 import copy
-from typing import List, Optional
+from bisect import bisect_left, insort
+from typing import Iterator, List, Optional, Tuple
 from itertools import combinations
 from .person import Person
 from .bridge import Bridge
 from .flashlight import Flashlight
 from .move import Move
-from copy import deepcopy
+from .compact_state import CompactState
+from .crossing_times import CrossingTimeTable
+from .rules import crossing_error
 
 
 class GameState:
@@ -14,6 +17,12 @@ class GameState:
     Tracks positions of people, elapsed time, and win/lose conditions.
     """
 
+    __slots__ = (
+        "_bridge", "_flashlight", "_all_persons", "_person_index", "_crossing_times",
+        "_left_side", "_right_side", "_right_mask",
+        "_elapsed_time", "_game_won", "_game_over", "_move_history", "_undo_marks",
+    )
+
     def __init__(self, bridge: Bridge, flashlight: Flashlight, all_persons: List[Person]):
         """
         Initialize the game state.
@@ -21,28 +30,40 @@ class GameState:
         Args:
             bridge (Bridge): The bridge object
             flashlight (Flashlight): The flashlight object
-            all_persons (List[Person]): All people in the game
+            all_persons (List[Person]): All people in the game; no two may share both name and crossing time
         """
+        if len(set(all_persons)) != len(all_persons):
+            seen = set()
+            duplicate = next(person for person in all_persons if person in seen or seen.add(person))
+            raise ValueError(f"{duplicate.get_name()} ({duplicate.get_crossing_time()} min) appears more than once; "
+                             "people are told apart by name and crossing time")
         self._bridge = bridge
         self._flashlight = flashlight
         self._all_persons = all_persons.copy()
+        self._person_index = {person: i for i, person in enumerate(self._all_persons)}
+        self._crossing_times = CrossingTimeTable(self._all_persons)
 
-        self._left_side = all_persons.copy()
+        # Each side is kept in roster order, so a person is found by bisection
+        # and the position before a move can be restored without recording it.
+        self._left_side = self._all_persons.copy()
         self._right_side = []
+        self._right_mask = 0
 
         self._elapsed_time = 0
         self._game_won = False
         self._game_over = False
         self._move_history = []
+        # (generation, history length) after undos, for `rollback`; see `_undo_marks_since`.
+        self._undo_marks = None
 
         if self._all_persons:
             self._flashlight.give_to(self._all_persons[0])
 
-    def get_left_side(self) -> List[Person]:
-        return self._left_side.copy()
+    def get_left_side(self) -> Tuple[Person, ...]:
+        return tuple(self._left_side)
 
-    def get_right_side(self) -> List[Person]:
-        return self._right_side.copy()
+    def get_right_side(self) -> Tuple[Person, ...]:
+        return tuple(self._right_side)
 
     def get_elapsed_time(self) -> int:
         return self._elapsed_time
@@ -59,33 +80,83 @@ class GameState:
     def get_flashlight_holder(self) -> Optional[Person]:
         return self._flashlight.get_current_holder()
 
-    def get_move_history(self) -> List[Move]:
-        return self._move_history.copy()
+    def get_move_history(self) -> Tuple[Move, ...]:
+        return tuple(self._move_history)
 
-    def can_make_move(self, move: Move) -> bool:
-        if self.is_game_over():
-            return False
+    def get_person_index(self, person: Person) -> Optional[int]:
+        """Return the roster index of `person`, or None if they are not in this game."""
+        return self._person_index.get(person)
 
-        if not move.is_valid(self._bridge):
-            return False
+    def mask_of(self, persons: List[Person]) -> Optional[int]:
+        """Return the bitmask of roster indices for `persons`, or None if one is unknown."""
+        mask = 0
+        for person in persons:
+            index = self._person_index.get(person)
+            if index is None:
+                return None
+            mask |= 1 << index
+        return mask
 
-        crossing_persons = move.get_crossing_persons()
-        direction = move.get_direction()
+    def persons_of(self, mask: int) -> List[Person]:
+        """Return the people whose roster index bits are set in `mask`, in roster order."""
+        return [person for i, person in enumerate(self._all_persons) if mask >> i & 1]
 
-        flashlight_holder = self._flashlight.get_current_holder()
-        if not flashlight_holder:
+    def is_flashlight_on_right(self) -> bool:
+        holder = self._flashlight.get_current_holder()
+        if holder is None:
             return False
+        index = self._person_index.get(holder)
+        return index is not None and bool(self._right_mask >> index & 1)
+
+    def to_compact(self) -> CompactState:
+        """Return an immutable, hashable snapshot of the current position."""
+        return CompactState(self._right_mask, self.is_flashlight_on_right(), self._elapsed_time)
+
+    @classmethod
+    def from_compact(cls, bridge: Bridge, flashlight: Flashlight, all_persons: List[Person],
+                     compact: CompactState) -> "GameState":
+        """
+        Rebuild a full GameState from a compact snapshot.
+
+        The move history is not part of the snapshot, so the returned state has
+        an empty history. The flashlight goes to the first person (in roster
+        order) on the flashlight side.
+        """
+        state = cls(bridge, flashlight, all_persons)
+        state._set_right_mask(compact.get_right_mask())
+        state._elapsed_time = compact.get_elapsed_time()
+
+        flashlight_side = state._right_side if compact.is_flashlight_on_right() else state._left_side
+        if flashlight_side:
+            flashlight.give_to(flashlight_side[0])
+        else:
+            flashlight.take_from_current_holder()
+
+        state._game_won = state.is_game_won()
+        state._game_over = state.is_game_over()
+        return state
 
-        flashlight_side = self._left_side if flashlight_holder in self._left_side else self._right_side
+    def _set_right_mask(self, right_mask: int) -> None:
+        self._right_mask = right_mask
+        self._left_side = [p for i, p in enumerate(self._all_persons) if not right_mask >> i & 1]
+        self._right_side = [p for i, p in enumerate(self._all_persons) if right_mask >> i & 1]
 
-        if not all(person in flashlight_side for person in crossing_persons):
+    def can_make_move(self, move: Move) -> bool:
+        if not self._bridge.is_passable() or not self._flashlight.get_current_holder():
             return False
 
-        move_time = move.calculate_time(self._bridge)
-        if self._elapsed_time + move_time > self._bridge.get_max_time():
+        crossing_persons = move.get_crossing_persons()
+        group_mask = self.mask_of(crossing_persons)
+        if group_mask is None or bin(group_mask).count("1") != len(crossing_persons):
             return False
 
-        return True
+        # The group heads away from the flashlight's side; `crossing_error` checks the rest.
+        on_right = self.is_flashlight_on_right()
+        if move.get_direction() != ("right_to_left" if on_right else "left_to_right"):
+            return False
+
+        return crossing_error(self._crossing_times, self._bridge.get_capacity(), self._bridge.get_max_time(),
+                              self._right_mask, on_right, self._elapsed_time, group_mask) is None
 
     def make_move(self, move: Move) -> bool:
         if not self.can_make_move(move):
@@ -94,18 +165,13 @@ class GameState:
         crossing_persons = move.get_crossing_persons()
         direction = move.get_direction()
 
-        if direction == "left_to_right":
-            for person in crossing_persons:
-                self._left_side.remove(person)
-                self._right_side.append(person)
-        else:
-            for person in crossing_persons:
-                self._right_side.remove(person)
-                self._left_side.append(person)
+        self._cross(crossing_persons, direction == "left_to_right")
+        group_mask = self.mask_of(crossing_persons)
+        self._right_mask ^= group_mask
 
         self._flashlight.give_to(crossing_persons[0])
 
-        move_time = move.calculate_time(self._bridge)
+        move_time = self._crossing_times.group_time(group_mask)
         self._elapsed_time += move_time
         move.set_time_taken(move_time)
         self._move_history.append(move)
@@ -115,14 +181,109 @@ class GameState:
 
         return True
 
+    def undo_move(self) -> Optional[Move]:
+        """
+        Take back the last move, restoring the sides, flashlight holder and time.
+
+        Costs O(group size) bisections. Nothing is recorded for undo: the
+        sides are in roster order, and the flashlight goes back to whoever
+        led the move before (or, for the first move, to the first person in
+        roster order on its side, as `__init__` and `from_compact` choose).
+
+        Returns:
+            Optional[Move]: The move taken back, or None if there was none
+        """
+        if not self._move_history:
+            return None
+
+        move = self._move_history.pop()
+        self._mark_undo()
+        crossing_persons = move.get_crossing_persons()
+        self._cross(crossing_persons, move.get_direction() != "left_to_right")
+        self._right_mask ^= self.mask_of(crossing_persons)
+        if self._move_history:
+            self._flashlight.give_to(self._move_history[-1].get_crossing_persons()[0])
+        else:
+            side = self._right_side if move.get_direction() == "right_to_left" else self._left_side
+            self._flashlight.give_to(side[0])
+        self._elapsed_time -= move.get_time_taken()
+
+        self._game_won = self.is_game_won()
+        self._game_over = self.is_game_over()
+        return move
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """Return a token for the current position, to pass to `rollback` later."""
+        return len(self._move_history), self._generation()
+
+    def rollback(self, checkpoint: Tuple[int, int]) -> List[Move]:
+        """
+        Undo moves until the position of `checkpoint` is restored.
+
+        The token is the history length and the number of undos (and resets)
+        made so far.
+        If any undo since then went below that length, the moves that were
+        checkpointed are gone (whatever was played instead), so the position
+        cannot be restored.
+
+        Args:
+            checkpoint (Tuple[int, int]): A value returned by `checkpoint` on this state
+
+        Returns:
+            List[Move]: The moves taken back, most recent first
+
+        Raises:
+            ValueError: If the line of play has diverged from the checkpoint
+        """
+        length, generation = checkpoint
+        marks = self._undo_marks or []
+        # Marks are in generation order; the first one after the token is the
+        # shortest the history has been since.
+        first = bisect_left(marks, generation + 1, key=lambda mark: mark[0])
+        if (not 0 <= length <= len(self._move_history) or generation > self._generation()
+                or first < len(marks) and marks[first][1] < length):
+            raise ValueError(f"checkpoint {checkpoint} is not on the current line of play")
+        return [self.undo_move() for _ in range(len(self._move_history) - length)]
+
+    def _generation(self) -> int:
+        return self._undo_marks[-1][0] if self._undo_marks else 0
+
+    def _mark_undo(self) -> None:
+        """
+        Record an undo as `(generation, history length after it)`.
+
+        Only what `rollback` needs is kept: the shortest length since each
+        generation. A mark is dropped once a later undo goes at least as low,
+        so lengths increase along the list and it never holds more marks than
+        the longest history.
+        """
+        generation = self._generation() + 1
+        length = len(self._move_history)
+        if self._undo_marks is None:
+            self._undo_marks = []
+        marks = self._undo_marks
+        while marks and marks[-1][1] >= length:
+            marks.pop()
+        marks.append((generation, length))
+
+    def _cross(self, persons: Tuple[Person, ...], to_right: bool) -> None:
+        source, target = (self._left_side, self._right_side) if to_right else (self._right_side, self._left_side)
+        index = self._person_index.__getitem__
+        for person in persons:
+            del source[bisect_left(source, index(person), key=index)]
+            insort(target, person, key=index)
+
     def reset(self) -> None:
         self._left_side = self._all_persons.copy()
         self._right_side = []
+        self._right_mask = 0
 
         self._elapsed_time = 0
         self._game_won = False
         self._game_over = False
         self._move_history = []
+        # Checkpoints taken before the reset are off the line of play now.
+        self._mark_undo()
 
         self._bridge.repair()
 
@@ -130,57 +291,94 @@ class GameState:
             self._flashlight.give_to(self._all_persons[0])
 
     def get_valid_moves(self) -> List[Move]:
-        if self.is_game_over():
-            return []
-
-        valid_moves = []
-        flashlight_holder = self.get_flashlight_holder()
-        if not flashlight_holder:
-            return []
+        return list(self.iter_valid_moves())
 
-        flashlight_side = self._left_side if flashlight_holder in self._left_side else self._right_side
-        direction = "left_to_right" if flashlight_side is self._left_side else "right_to_left"
+    def iter_valid_moves(self) -> Iterator[Move]:
+        """
+        Lazily yield every move `can_make_move` would accept, without checking each one.
+
+        The flashlight side and the time left are worked out once. People are
+        taken in crossing-time order from the roster's time table, stopping at
+        the first one too slow to finish within the limit; every group of up
+        to the bridge capacity drawn from the rest is then valid. The rest are
+        put back in roster order first, so moves and their members come in
+        the same order as filtering every group of the flashlight side with
+        `can_make_move`, and compare equal to moves built from the roster.
+        The moves reflect the state at the time the first one is requested.
+        """
+        if self.is_game_over() or not self._bridge.is_passable():
+            return
+        if not self._flashlight.get_current_holder():
+            return
 
-        for person in flashlight_side:
-            move = Move([person], direction)
-            if self.can_make_move(move):
-                valid_moves.append(move)
+        if self.is_flashlight_on_right():
+            side_mask, direction = self._right_mask, "right_to_left"
+        else:
+            side_mask, direction = ~self._right_mask, "left_to_right"
 
-        for p1, p2 in combinations(flashlight_side, 2):
-            move = Move([p1, p2], direction)
-            if self.can_make_move(move):
-                valid_moves.append(move)
+        remaining_time = self._bridge.get_max_time() - self._elapsed_time
+        eligible_indices = []
+        for crossing_time, index in self._crossing_times.get_time_order():
+            if crossing_time > remaining_time:
+                break
+            if side_mask >> index & 1:
+                eligible_indices.append(index)
+        eligible = [self._all_persons[index] for index in sorted(eligible_indices)]
 
-        return valid_moves
+        for size in range(1, min(self._bridge.get_capacity(), len(eligible)) + 1):
+            for group in combinations(eligible, size):
+                yield Move(group, direction)
 
     def next_state(self, move: Move) -> Optional["GameState"]:
-        if not move.is_valid(self._bridge):
-            return None
+        """
+        Return the state reached by making `move`, leaving this state untouched.
 
-        move_time = move.calculate_time(self._bridge)
-        new_elapsed = self._elapsed_time + move_time
-        if new_elapsed > self._max_time:
+        Returns None if the move is not valid here. See `_successor` for what
+        the new state shares with this one.
+        """
+        if not self.can_make_move(move):
             return None
+        return self._successor(move)
 
-        new_state = deepcopy(self)
+    def iter_successors(self) -> Iterator[Tuple[Move, "GameState"]]:
+        """Lazily yield `(move, successor)` for every valid move from this state."""
+        for move in self.iter_valid_moves():
+            yield move, self._successor(move)
 
-        crossing = frozenset(move.get_crossing_persons())
-        if self._flashlight_side == "left":
-            # Move from left to right
-            if not crossing.issubset(new_state._left_side):
-                return None
-            new_state._left_side = new_state._left_side - crossing
-            new_state._right_side = new_state._right_side.union(crossing)
-            new_state._flashlight_side = "right"
-        else:
-            # Move from right to left
-            if not crossing.issubset(new_state._right_side):
-                return None
-            new_state._right_side = new_state._right_side - crossing
-            new_state._left_side = new_state._left_side.union(crossing)
-            new_state._flashlight_side = "left"
+    def _successor(self, move: Move) -> "GameState":
+        """
+        Build the successor for an already-validated move without deep copying.
+
+        The bridge, roster, roster index and crossing-time table are shared with
+        this state; only the sides, history and flashlight are new. The new
+        flashlight is pointed at its holder directly rather than through
+        `Flashlight.give_to`, so the shared Person objects' flashlight flags
+        are left as they are.
+        """
+        crossing_persons = move.get_crossing_persons()
+        group_mask = self.mask_of(crossing_persons)
+        move_time = self._crossing_times.group_time(group_mask)
+        move.set_time_taken(move_time)
 
-        new_state._elapsed_time = new_elapsed
+        new_state = GameState.__new__(GameState)
+        new_state._bridge = self._bridge
+        new_state._all_persons = self._all_persons
+        new_state._person_index = self._person_index
+        new_state._crossing_times = self._crossing_times
+
+        new_state._left_side = self._left_side.copy()
+        new_state._right_side = self._right_side.copy()
+        new_state._cross(crossing_persons, move.get_direction() == "left_to_right")
+        new_state._right_mask = self._right_mask ^ group_mask
+
+        new_state._flashlight = Flashlight()
+        new_state._flashlight._current_holder = crossing_persons[0]
+
+        new_state._elapsed_time = self._elapsed_time + move_time
+        new_state._move_history = self._move_history + [move]
+        new_state._undo_marks = None
+        new_state._game_won = new_state.is_game_won()
+        new_state._game_over = new_state.is_game_over()
         return new_state
 
     def __str__(self) -> str:
@@ -233,11 +431,18 @@ class GameState:
             copy.deepcopy(self._flashlight),
             copy.deepcopy(self._all_persons),
         )
-        new_state._left_side = copy.deepcopy(self._left_side)
-        new_state._right_side = copy.deepcopy(self._right_side)
+        # The sides and flashlight must refer to the copy's own people; the
+        # constructor handed the flashlight to the first of them.
+        new_state._set_right_mask(self._right_mask)
+        holder = self.get_flashlight_holder()
+        if holder is None:
+            new_state._flashlight.take_from_current_holder()
+        else:
+            new_state._flashlight.give_to(new_state._all_persons[self._person_index[holder]])
         new_state._elapsed_time = self._elapsed_time
         new_state._game_won = self._game_won
         new_state._game_over = self._game_over
         new_state._move_history = copy.deepcopy(self._move_history)
+        new_state._undo_marks = None if self._undo_marks is None else self._undo_marks.copy()
         return new_state
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence, Tuple
 from . import Bridge
 from .person import Person
 import copy
@@ -7,14 +7,17 @@ import copy
 class Move:
     """Represents a single crossing or return journey."""
 
-    def __init__(self, crossing_persons: List[Person], direction: str):
-        self._crossing_persons = crossing_persons.copy()
+    __slots__ = ("_crossing_persons", "_direction", "_time_taken", "_is_executed", "_crossing_time")
+
+    def __init__(self, crossing_persons: Sequence[Person], direction: str):
+        self._crossing_persons = tuple(crossing_persons)
         self._direction = direction  # 'left_to_right' or 'right_to_left'
         self._time_taken = 0
         self._is_executed = False
+        self._crossing_time = None
 
-    def get_crossing_persons(self) -> List[Person]:
-        return self._crossing_persons.copy()
+    def get_crossing_persons(self) -> Tuple[Person, ...]:
+        return self._crossing_persons
 
     def get_direction(self) -> str:
         return self._direction
@@ -26,7 +29,10 @@ class Move:
         return self._is_executed
 
     def calculate_time(self, bridge: Bridge) -> int:
-        return bridge.calculate_crossing_time(self._crossing_persons)
+        # Crossing times never change, so the group's time is computed once per move.
+        if self._crossing_time is None:
+            self._crossing_time = bridge.calculate_crossing_time(self._crossing_persons)
+        return self._crossing_time
 
     def is_valid(self, bridge: Bridge) -> bool:
         return bridge.can_cross(self._crossing_persons)
@@ -66,7 +72,7 @@ class Move:
 
     def __hash__(self) -> int:
         # Use tuple of persons (assuming Person is hashable) and direction string
-        return hash((tuple(self._crossing_persons), self._direction))
+        return hash((self._crossing_persons, self._direction))
 
     def deepcopy(self):
         # Deepcopy persons list, copy direction, and primitive types
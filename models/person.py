@@ -1,6 +1,8 @@
 class Person:
     """Represents a person in the bridge crossing puzzle."""
 
+    __slots__ = ("_name", "_crossing_time", "_has_flashlight")
+
     def __init__(self, name: str, crossing_time: int):
         self._name = name
         self._crossing_time = crossing_time
@@ -29,15 +31,16 @@ class Person:
         )
 
     def __eq__(self, other) -> bool:
+        # Identity is name and crossing time only; the flashlight flag changes
+        # as the game is played, so it must not affect equality or hashing.
         return (
             isinstance(other, Person) and
             self._name == other._name and
-            self._crossing_time == other._crossing_time and
-            self._has_flashlight == other._has_flashlight
+            self._crossing_time == other._crossing_time
         )
 
     def __hash__(self) -> int:
-        return hash((self._name, self._crossing_time, self._has_flashlight))
+        return hash((self._name, self._crossing_time))
 
     def deepcopy(self):
         # Create a deep copy of this person instance
@@ -0,0 +1,36 @@
+from typing import Optional
+from .crossing_times import CrossingTimeTable
+
+
+def crossing_error(crossing_times: CrossingTimeTable, capacity: int, max_time: int, right_mask: int,
+                   flashlight_on_right: bool, elapsed_time: int, group: int) -> Optional[str]:
+    """
+    Return why `group` may not cross from a position, or None if it may.
+
+    These are the crossing rules on roster bitmasks (bit ``i`` is roster
+    person ``i``), shared by `GameState.can_make_move` and the game server:
+    the game is not over, 1 to `capacity` people cross, all of them are on
+    the flashlight's side, and they arrive within `max_time`.
+
+    Args:
+        crossing_times (CrossingTimeTable): Group times of the roster
+        capacity (int): Bridge capacity
+        max_time (int): Time limit
+        right_mask (int): Bitmask of the people on the right side
+        flashlight_on_right (bool): True if the flashlight is on the right side
+        elapsed_time (int): Minutes elapsed so far
+        group (int): Bitmask of the people crossing
+    """
+    full_mask = (1 << crossing_times.get_roster_size()) - 1
+    if right_mask == full_mask or elapsed_time >= max_time:
+        return "game is over"
+    size = bin(group).count("1")
+    if not 1 <= size <= capacity:
+        return f"a crossing takes 1 to {capacity} people"
+    side = right_mask if flashlight_on_right else full_mask & ~right_mask
+    if group & ~side:
+        return "everyone crossing must be on the flashlight's side"
+    finish = elapsed_time + crossing_times.group_time(group)
+    if finish > max_time:
+        return f"too slow: would finish at {finish}, limit {max_time}"
+    return None
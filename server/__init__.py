@@ -0,0 +1,7 @@
+from .game_server import GameServer, Scenario, Session, serve
+__all__ = [
+    "GameServer",
+    "Scenario",
+    "Session",
+    "serve",
+]
@@ -0,0 +1,3 @@
+from .game_server import main
+
+main()
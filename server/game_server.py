@@ -0,0 +1,357 @@
+"""
+Line-protocol game server: many concurrent puzzle sessions in one asyncio process.
+
+Clients send one command per line and get exactly one reply line per
+command, in order, so requests can be pipelined. A connection may drive any
+number of sessions; sessions outlive connections until they are closed or
+sit idle for longer than the idle timeout.
+
+Commands (people are roster indices, joined by commas)::
+
+    NEW                                  -> OK <session>          the classic 4-person puzzle
+    NEW <capacity> <max_time> <t0> <t1> ... -> OK <session>       a custom roster
+    MOVE <session> <i>[,<j>...]          -> OK time=<elapsed>/<limit> status=<playing|won|lost>
+    UNDO <session>                       -> OK time=<elapsed>/<limit> status=...
+    STATE <session>                      -> OK right=<i,j,...> flashlight=<left|right> time=... status=...
+    MOVES <session>                      -> OK <i,j> <k> ... [more] valid groups, at most MAX_MOVES
+    CLOSE <session>                      -> OK
+    STATS                                -> OK sessions=<n> created=<n> evicted=<n> moves=<n>
+
+Anything else, or a move the rules forbid, gets ``ERR <reason>``. The
+direction of a move is the flashlight's side, as in the game. A large
+roster can have millions of valid groups, so MOVES lists the first
+MAX_MOVES (smallest groups first) and ends with ``more`` if it stopped
+there.
+
+Usage: python -m server [--host 127.0.0.1] [--port 7777] [--idle-timeout 300] [--max-sessions 100000]
+"""
+import argparse
+import asyncio
+import time
+from collections import OrderedDict
+from itertools import combinations, count, islice
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, CompactState, CrossingTimeTable, Flashlight, GameState, Person, crossing_error
+
+CLASSIC_ROSTER = (("You", 1), ("Lab Assistant", 2), ("Worker", 5), ("Scientist", 10))
+
+# Longest command line accepted, in bytes, largest custom roster and most
+# groups listed by one MOVES reply.
+MAX_LINE = 4096
+MAX_PEOPLE = 64
+MAX_MOVES = 1000
+
+
+class Scenario:
+    """
+    A roster and bridge shared by every session playing it.
+
+    Holds what sessions must not each carry: the people, the limits and the
+    memoized group times. `validate` applies `crossing_error`, the rules
+    `GameState.can_make_move` uses, to a `CompactState`.
+    """
+
+    __slots__ = ("_persons", "_capacity", "_max_time", "_crossing_times", "_full_mask")
+
+    def __init__(self, persons: Sequence[Person], capacity: int, max_time: int):
+        """
+        Initialize the scenario.
+
+        Args:
+            persons (Sequence[Person]): The roster; indices in commands refer to this order
+            capacity (int): Bridge capacity
+            max_time (int): Time limit
+        """
+        self._persons = list(persons)
+        self._capacity = capacity
+        self._max_time = max_time
+        self._crossing_times = CrossingTimeTable(self._persons)
+        self._full_mask = (1 << len(self._persons)) - 1
+
+    def get_persons(self) -> List[Person]:
+        return self._persons.copy()
+
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    def get_max_time(self) -> int:
+        return self._max_time
+
+    def group_time(self, group: int) -> int:
+        return self._crossing_times.group_time(group)
+
+    def is_won(self, state: CompactState) -> bool:
+        return state.is_goal(len(self._persons))
+
+    def is_over(self, state: CompactState) -> bool:
+        return self.is_won(state) or state.get_elapsed_time() >= self._max_time
+
+    def status(self, state: CompactState) -> str:
+        if self.is_won(state):
+            return "won"
+        return "lost" if self.is_over(state) else "playing"
+
+    def validate(self, state: CompactState, group: int) -> Optional[str]:
+        """Return why moving `group` from `state` is not allowed, or None if it is."""
+        return crossing_error(self._crossing_times, self._capacity, self._max_time, state.get_right_mask(),
+                              state.is_flashlight_on_right(), state.get_elapsed_time(), group)
+
+    def cross(self, state: CompactState, group: int) -> CompactState:
+        """Return the state after an already-validated move of `group`."""
+        return CompactState(state.get_right_mask() ^ group, not state.is_flashlight_on_right(),
+                            state.get_elapsed_time() + self.group_time(group))
+
+    def valid_groups(self, state: CompactState, limit: Optional[int] = None) -> List[int]:
+        """Return the groups that may move from `state`, smallest first; at most `limit` of them if given."""
+        if self.is_over(state):
+            return []
+        right = state.get_right_mask()
+        side = right if state.is_flashlight_on_right() else self._full_mask & ~right
+        remaining = self._max_time - state.get_elapsed_time()
+        eligible = [1 << i for t, i in self._crossing_times.get_time_order() if t <= remaining and side >> i & 1]
+        groups = (sum(members) for size in range(1, min(self._capacity, len(eligible)) + 1)
+                  for members in combinations(eligible, size))
+        return list(islice(groups, limit))
+
+    def to_game_state(self, state: CompactState) -> GameState:
+        """Rebuild the full `GameState` of a position (without its move history)."""
+        return GameState.from_compact(Bridge(self._capacity, self._max_time), Flashlight(), self._persons, state)
+
+
+class Session:
+    """
+    One game in progress: a position, the groups moved so far and when it was last used.
+
+    Positions are `CompactState` snapshots and the history is a list of
+    group masks, so a session costs a few small ints whatever the roster.
+    """
+
+    __slots__ = ("scenario", "state", "history", "last_active")
+
+    def __init__(self, scenario: Scenario, now: float):
+        self.scenario = scenario
+        self.state = CompactState(0, False, 0)
+        self.history: List[int] = []
+        self.last_active = now
+
+
+def format_group(group: int) -> str:
+    return ",".join(str(i) for i in range(group.bit_length()) if group >> i & 1)
+
+
+class GameServer:
+    """
+    Hosts puzzle sessions over the line protocol described in this module.
+
+    Sessions live in an OrderedDict kept in least-recently-used order, so the
+    periodic sweep evicts idle sessions from the front and stops at the first
+    active one. Command handling is synchronous and cheap; the event loop
+    only waits on the sockets.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, max_sessions: int = 100_000, sweep_interval: float = 5.0):
+        """
+        Initialize the server.
+
+        Args:
+            idle_timeout (float): Seconds without a command after which a session is evicted
+            max_sessions (int): Sessions held at once; NEW is refused beyond this
+            sweep_interval (float): Seconds between eviction sweeps
+        """
+        self._idle_timeout = idle_timeout
+        self._max_sessions = max_sessions
+        self._sweep_interval = sweep_interval
+        self._sessions: "OrderedDict[int, Session]" = OrderedDict()
+        self._ids = count(1)
+        self._classic = Scenario([Person(name, t) for name, t in CLASSIC_ROSTER], capacity=2, max_time=17)
+        self._created = 0
+        self._evicted = 0
+        self._moves = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def get_num_sessions(self) -> int:
+        return len(self._sessions)
+
+    def get_evicted(self) -> int:
+        return self._evicted
+
+    def get_game_state(self, session_id: int) -> Optional[GameState]:
+        session = self._sessions.get(session_id)
+        return None if session is None else session.scenario.to_game_state(session.state)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 7777) -> Tuple[str, int]:
+        """Start listening and sweeping; returns the bound address (useful with port 0)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE)
+        self._sweeper = asyncio.create_task(self._sweep_forever())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Drop every session idle for longer than the timeout; returns how many went."""
+        now = time.monotonic() if now is None else now
+        cutoff = now - self._idle_timeout
+        evicted = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_active >= cutoff:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        self._evicted += evicted
+        return evicted
+
+    def handle_line(self, line: str, now: Optional[float] = None) -> str:
+        """Run one command and return its reply line (without the newline)."""
+        words = line.split()
+        if not words:
+            return "ERR empty command"
+        command, args = words[0].upper(), words[1:]
+        now = time.monotonic() if now is None else now
+        try:
+            if command == "NEW":
+                return self._new(args, now)
+            if command == "STATS":
+                return (f"OK sessions={len(self._sessions)} created={self._created} "
+                        f"evicted={self._evicted} moves={self._moves}")
+            if command not in ("MOVE", "UNDO", "STATE", "MOVES", "CLOSE"):
+                return f"ERR unknown command {words[0]}"
+            if not args:
+                return f"ERR {command} needs a session"
+        except ValueError as error:
+            return f"ERR {error}"
+
+        session_id = int(args[0]) if args[0].isascii() and args[0].isdigit() else None
+        session = self._sessions.get(session_id)
+        if session is None:
+            return f"ERR no session {args[0]}"
+        self._sessions.move_to_end(session_id)
+        session.last_active = now
+        scenario = session.scenario
+
+        if command == "MOVE":
+            if len(args) != 2:
+                return "ERR usage: MOVE <session> <i>[,<j>...]"
+            group = self._parse_group(args[1], len(scenario.get_persons()))
+            if isinstance(group, str):
+                return f"ERR {group}"
+            reason = scenario.validate(session.state, group)
+            if reason is not None:
+                return f"ERR {reason}"
+            session.state = scenario.cross(session.state, group)
+            session.history.append(group)
+            self._moves += 1
+        elif command == "UNDO":
+            if not session.history:
+                return "ERR nothing to undo"
+            group = session.history.pop()
+            state = session.state
+            session.state = CompactState(state.get_right_mask() ^ group, not state.is_flashlight_on_right(),
+                                         state.get_elapsed_time() - scenario.group_time(group))
+        elif command == "MOVES":
+            groups = scenario.valid_groups(session.state, MAX_MOVES + 1)
+            more = " more" if len(groups) > MAX_MOVES else ""
+            return "OK " + " ".join(format_group(group) for group in groups[:MAX_MOVES]) + more
+        elif command == "CLOSE":
+            del self._sessions[session_id]
+            return "OK"
+        elif command == "STATE":
+            state = session.state
+            return (f"OK right={format_group(state.get_right_mask()) or '-'} "
+                    f"flashlight={'right' if state.is_flashlight_on_right() else 'left'} {self._progress(session)}")
+        return "OK " + self._progress(session)
+
+    def _new(self, args: List[str], now: float) -> str:
+        if len(self._sessions) >= self._max_sessions:
+            self.evict_idle(now)
+            if len(self._sessions) >= self._max_sessions:
+                return "ERR server full"
+        if args:
+            if len(args) < 3:
+                return "ERR usage: NEW [<capacity> <max_time> <t0> <t1> ...]"
+            capacity, max_time, *times = (int(arg) for arg in args)
+            if len(times) > MAX_PEOPLE:
+                return f"ERR at most {MAX_PEOPLE} people"
+            if capacity < 1 or max_time < 0 or any(t < 1 for t in times):
+                return "ERR capacity and crossing times must be positive"
+            scenario = Scenario([Person(f"P{i}", t) for i, t in enumerate(times)], capacity, max_time)
+        else:
+            scenario = self._classic
+        session_id = next(self._ids)
+        self._sessions[session_id] = Session(scenario, now)
+        self._created += 1
+        return f"OK {session_id}"
+
+    @staticmethod
+    def _parse_group(text: str, num_persons: int):
+        """Return the group mask for "i,j,..." or a string saying what is wrong with it."""
+        group = 0
+        for part in text.split(","):
+            if not (part.isascii() and part.isdigit()) or int(part) >= num_persons:
+                return f"no person {part!r}"
+            bit = 1 << int(part)
+            if group & bit:
+                return f"person {part} listed twice"
+            group |= bit
+        return group
+
+    @staticmethod
+    def _progress(session: Session) -> str:
+        state, scenario = session.state, session.scenario
+        return f"time={state.get_elapsed_time()}/{scenario.get_max_time()} status={scenario.status(state)}"
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                writer.write(self.handle_line(line.decode("utf-8", "replace")).encode() + b"\n")
+                # Only wait on the socket once a pipelining client has let replies pile up.
+                if writer.transport.get_write_buffer_size() > 1 << 16:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            self.evict_idle()
+
+
+async def serve(host: str, port: int, idle_timeout: float, max_sessions: int) -> None:
+    server = GameServer(idle_timeout, max_sessions)
+    address = await server.start(host, port)
+    print(f"serving on {address[0]}:{address[1]}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Host bridge puzzle sessions over a line-based TCP protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--idle-timeout", type=float, default=300.0, help="seconds before an idle session is dropped")
+    parser.add_argument("--max-sessions", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.idle_timeout, args.max_sessions))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,40 @@
+from .state_space import StateSpace
+from .count_space import CountStateSpace
+from .result import SolverResult
+from .transposition import TranspositionTable
+from .stats import SearchStats
+from .base import Solver
+from .astar import AStarSolver, DijkstraSolver
+from .bidirectional import BidirectionalSolver
+from .branch_bound import BranchAndBoundSolver
+from .brute_force import BruteForceSolver
+from .greedy import GreedySolver, optimal_total_time
+from .cost_to_go import CostToGoTable
+from .enumeration import SolutionEnumerator
+from .parallel import ParallelSolver
+from .incremental import IncrementalSolver
+from .cache import SolutionCache
+from .service import BatchSolver
+from .api import solve
+__all__ = [
+    "StateSpace",
+    "CountStateSpace",
+    "SolverResult",
+    "TranspositionTable",
+    "SearchStats",
+    "Solver",
+    "AStarSolver",
+    "DijkstraSolver",
+    "BidirectionalSolver",
+    "BranchAndBoundSolver",
+    "BruteForceSolver",
+    "GreedySolver",
+    "optimal_total_time",
+    "CostToGoTable",
+    "SolutionEnumerator",
+    "ParallelSolver",
+    "IncrementalSolver",
+    "SolutionCache",
+    "BatchSolver",
+    "solve",
+]
@@ -0,0 +1,18 @@
+from collections import Counter
+from math import prod
+from typing import Optional, Sequence
+from models import Bridge, Flashlight, Person
+from .astar import AStarSolver
+from .greedy import GreedySolver
+from .result import SolverResult
+
+
+def solve(bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None) -> SolverResult:
+    """Solve an instance optimally with the best solver available for it."""
+    if bridge.get_capacity() == 2:
+        return GreedySolver(bridge, persons, flashlight).solve()
+    # A merged state costs a few times more to expand, so merging tied people
+    # only pays off when it cuts the state count at least fourfold.
+    merged_states = prod(count + 1 for count in Counter(p.get_crossing_time() for p in persons).values())
+    symmetric = 4 * merged_states <= 2 ** len(persons)
+    return AStarSolver(bridge, persons, flashlight, symmetric=symmetric).solve()
@@ -0,0 +1,132 @@
+import heapq
+from itertools import count
+from typing import Callable, List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Person
+from .base import Solver, unwind_path
+from .count_space import CountStateSpace
+from .state_space import StateSpace
+from .stats import SearchStats
+from .transposition import TranspositionTable
+
+# How many expansions pass between reads of a shared time limit.
+BOUND_CHECK_INTERVAL = 1024
+
+
+def astar_search(space: StateSpace, start: int, start_time: int, time_limit: int,
+                 lower_bound: Callable[[int], int], table: TranspositionTable,
+                 shared_limit=None, stats: Optional[SearchStats] = None
+                 ) -> Tuple[Optional[List[int]], Optional[int], int]:
+    """
+    A* from `start` (reached at `start_time`) to the goal of `space`.
+
+    Only schedules finishing within `time_limit` are searched. If
+    `shared_limit` is given (any object with an int ``value``, such as a
+    `multiprocessing.Value`), it is read every `BOUND_CHECK_INTERVAL`
+    expansions and tightens `time_limit` whenever it is lower. `stats`, if
+    given, is updated as the search goes.
+
+    Returns:
+        `(group_masks, total_time, nodes_expanded)`; the masks and time are
+        None if nothing within the limit was found.
+    """
+    goal = space.get_goal_state()
+    table.store(start, start_time, 0)
+    tiebreak = count()
+    frontier = [(start_time + lower_bound(start), -start_time, start, next(tiebreak), 0, None)]
+    nodes_expanded = 0
+
+    while frontier:
+        _, neg_time, state, _, depth, path = heapq.heappop(frontier)
+        elapsed = -neg_time
+        best = table.lookup(state)
+        if best is not None and elapsed > best:
+            if stats is not None:
+                stats.on_pruned("transposition")
+            continue
+        if state == goal:
+            return unwind_path(path), elapsed, nodes_expanded
+
+        nodes_expanded += 1
+        if stats is not None:
+            stats.on_expanded()
+            stats.on_pruned("dominance", space.count_dominated(state))
+        if shared_limit is not None and nodes_expanded % BOUND_CHECK_INTERVAL == 0:
+            time_limit = min(time_limit, shared_limit.value)
+        for group, next_state, cost in space.successors(state):
+            if stats is not None:
+                stats.on_generated()
+            next_time = elapsed + cost
+            if next_time > time_limit:
+                if stats is not None:
+                    stats.on_pruned("time_limit")
+                continue
+            best = table.lookup(next_state)
+            if best is not None and next_time >= best:
+                if stats is not None:
+                    stats.on_pruned("transposition")
+                continue
+            estimate = next_time + lower_bound(next_state)
+            if estimate > time_limit:
+                if stats is not None:
+                    stats.on_pruned("bound")
+                continue
+            table.store(next_state, next_time, depth + 1)
+            # Ties on f are broken towards deeper states to reach the goal sooner.
+            heapq.heappush(frontier, (estimate, -next_time, next_state, next(tiebreak), depth + 1,
+                                      (group, path)))
+        if stats is not None:
+            stats.on_frontier(len(frontier))
+            stats.on_table(len(table))
+
+    return None, None, nodes_expanded
+
+
+class AStarSolver(Solver):
+    """
+    Optimal solver: A* over the compact state space.
+
+    Uses `StateSpace.lower_bound` as the heuristic. States are re-opened when
+    a cheaper path to them is found, so the result is optimal even where the
+    bound is not consistent. Partial paths are kept as `(group, parent)`
+    links on the frontier entries rather than in a separate parent table, so
+    a bounded transposition table (`max_table_entries`) caps the memory
+    used for duplicate detection without losing the paths. With
+    `symmetric`, people of equal crossing time are merged (see
+    `CountStateSpace`). `pattern_databases` (see `PatternDatabase`) are
+    combined with the built-in bound by taking the maximum.
+    """
+
+    name = "astar"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 use_heuristic: bool = True, prune: bool = True, max_table_entries: Optional[int] = None,
+                 eviction: str = "lru", stats: Optional[SearchStats] = None, symmetric: bool = False,
+                 pattern_databases: Sequence = ()):
+        super().__init__(bridge, persons, flashlight, prune, stats)
+        if symmetric:
+            self._space = CountStateSpace(self._persons, bridge.get_capacity(), prune)
+        self._use_heuristic = use_heuristic
+        self._max_table_entries = max_table_entries
+        self._eviction = eviction
+        self._pattern_databases = list(pattern_databases)
+
+    def _search(self):
+        space = self._space
+        lower_bound = space.lower_bound if self._use_heuristic else (lambda state: 0)
+        if self._use_heuristic and self._pattern_databases:
+            bounds = [space.lower_bound] + [database.heuristic(space) for database in self._pattern_databases]
+            lower_bound = lambda state: max(bound(state) for bound in bounds)
+        table = TranspositionTable(self._max_table_entries, self._eviction)
+        return astar_search(space, space.get_start_state(), 0, self._bridge.get_max_time(), lower_bound, table,
+                            stats=self._stats)
+
+
+class DijkstraSolver(AStarSolver):
+    """Optimal solver: uniform-cost search (A* without a heuristic)."""
+
+    name = "dijkstra"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 prune: bool = True, stats: Optional[SearchStats] = None, symmetric: bool = False):
+        super().__init__(bridge, persons, flashlight, use_heuristic=False, prune=prune, stats=stats,
+                         symmetric=symmetric)
@@ -0,0 +1,77 @@
+import time
+from contextlib import nullcontext
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, GameState, Person
+from .result import SolverResult
+from .state_space import StateSpace
+from .stats import SearchStats
+
+
+class Solver:
+    """
+    Base class for solvers over the bridge puzzle.
+
+    Subclasses implement `_search`, which works on the compact `StateSpace`
+    and returns the winning sequence of group masks; `solve` takes care of
+    timing and of turning the masks back into `Move` objects.
+    """
+
+    name = "solver"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 prune: bool = True, stats: Optional[SearchStats] = None):
+        """
+        Initialize the solver.
+
+        Args:
+            bridge (Bridge): The bridge (capacity and time limit)
+            persons (Sequence[Person]): All people, everyone starting on the left
+            flashlight (Optional[Flashlight]): The flashlight; only used by `verify`
+            prune (bool): Skip dominated moves (see `StateSpace.successors`)
+            stats (Optional[SearchStats]): Collects counters and phase timings while solving
+        """
+        self._bridge = bridge
+        self._persons = list(persons)
+        self._flashlight = flashlight
+        self._space = StateSpace(self._persons, bridge.get_capacity(), prune)
+        self._stats = stats
+
+    def get_space(self) -> StateSpace:
+        return self._space
+
+    def get_stats(self) -> Optional[SearchStats]:
+        return self._stats
+
+    def solve(self) -> SolverResult:
+        start = time.perf_counter()
+        if self._bridge.is_passable():
+            with self._phase("search"):
+                groups, total_time, nodes_expanded = self._search()
+        else:
+            groups, total_time, nodes_expanded = None, None, 0
+        with self._phase("reconstruct"):
+            moves = None if groups is None else self._space.to_moves(groups)
+        return SolverResult(self.name, moves, total_time, nodes_expanded, time.perf_counter() - start)
+
+    def verify(self, result: SolverResult) -> bool:
+        """Replay `result` on a fresh GameState for this instance and check it wins."""
+        game_state = GameState(self._bridge, self._flashlight or Flashlight(), self._persons)
+        return result.replay(game_state)
+
+    def _phase(self, name: str):
+        """Time the block as phase `name` if stats are being collected."""
+        return self._stats.phase(name) if self._stats is not None else nullcontext()
+
+    def _search(self) -> Tuple[Optional[List[int]], Optional[int], int]:
+        """Return `(group_masks, total_time, nodes_expanded)`; masks are None if unsolvable."""
+        raise NotImplementedError
+
+
+def unwind_path(path) -> List[int]:
+    """Turn a `(group, parent)` linked path into a list of groups, first move first."""
+    groups = []
+    while path is not None:
+        group, path = path
+        groups.append(group)
+    groups.reverse()
+    return groups
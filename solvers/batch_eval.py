@@ -0,0 +1,147 @@
+from typing import Sequence, Tuple
+import numpy as np
+from models import Bridge, Move, Person
+
+LEFT_TO_RIGHT = 1
+RIGHT_TO_LEFT = -1
+
+
+class BatchEvaluator:
+    """
+    Validates and times many schedules at once with NumPy.
+
+    A batch of N schedules of up to L moves is two (N, L) arrays: `groups`
+    holds each move's group as a bitmask over the roster (bit ``i`` is
+    ``persons[i]``), and `directions` holds ``LEFT_TO_RIGHT`` (1) or
+    ``RIGHT_TO_LEFT`` (-1). A zero group ends a schedule; anything after it
+    is ignored. Every move is checked exactly as `GameState.can_make_move`
+    would: the game is not over, the group fits on the bridge, everyone in it
+    is on the flashlight side and crosses away from it, and the time limit
+    holds. The loop runs over the L moves; all N schedules advance together.
+    Since every legal move flips the flashlight, its side is simply the
+    parity of the step.
+    """
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person]):
+        """
+        Initialize the evaluator.
+
+        Args:
+            bridge (Bridge): The bridge (capacity and time limit)
+            persons (Sequence[Person]): The roster; at most 63 people so masks fit in int64
+        """
+        if len(persons) > 63:
+            raise ValueError(f"BatchEvaluator supports at most 63 people, got {len(persons)}")
+        self._bridge = bridge
+        self._persons = list(persons)
+        self._index = {person: i for i, person in enumerate(self._persons)}
+        self._full_mask = (1 << len(self._persons)) - 1
+        self._num_bytes = max(1, (len(self._persons) + 7) // 8)
+
+        # Per-byte lookup tables: the slowest time and head count of every
+        # possible byte of a group mask, for each of the eight byte positions.
+        times = np.zeros(64, dtype=np.int64)
+        times[:len(self._persons)] = [p.get_crossing_time() for p in self._persons]
+        byte_values = np.arange(256)
+        bits = (byte_values[:, None] >> np.arange(8)) & 1
+        self._byte_counts = bits.sum(axis=1).astype(np.int64)
+        self._byte_max_times = np.stack([(bits * times[8 * b:8 * b + 8]).max(axis=1) for b in range(8)])
+
+    def encode(self, schedules: Sequence[Sequence[Move]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode lists of Moves as `(groups, directions)` arrays, padded with zero groups."""
+        length = max((len(schedule) for schedule in schedules), default=0)
+        groups = np.zeros((len(schedules), length), dtype=np.int64)
+        directions = np.zeros((len(schedules), length), dtype=np.int8)
+        for row, schedule in enumerate(schedules):
+            for step, move in enumerate(schedule):
+                mask = 0
+                for person in move.get_crossing_persons():
+                    mask |= 1 << self._index[person]
+                groups[row, step] = mask
+                directions[row, step] = LEFT_TO_RIGHT if move.get_direction() == "left_to_right" else RIGHT_TO_LEFT
+        return groups, directions
+
+    def evaluate(self, groups: np.ndarray, directions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate a batch of encoded schedules.
+
+        Returns:
+            Tuple of three length-N arrays:
+            - valid (bool): every move is legal and everyone ends up on the right
+            - total_time (int64): time of the legal prefix of each schedule
+            - first_failure (int64): index of the first illegal move; the schedule's
+              length if all moves are legal but it does not win; -1 if valid
+        """
+        groups = np.asarray(groups, dtype=np.int64)
+        directions = np.asarray(directions)
+        num_schedules, length = groups.shape
+        capacity = self._bridge.get_capacity()
+        max_time = self._bridge.get_max_time()
+        full_mask = np.int64(self._full_mask)
+
+        right = np.zeros(num_schedules, dtype=np.int64)
+        elapsed = np.zeros(num_schedules, dtype=np.int64)
+        first_failure = np.full(num_schedules, -1, dtype=np.int64)
+        if not self._bridge.is_passable():
+            first_failure[:] = 0
+            return np.zeros(num_schedules, dtype=bool), elapsed, first_failure
+
+        # Steps are read column by column, so work on the transposed copies.
+        # Only the rows still running are carried from step to step, so
+        # schedules that fail or end early stop costing anything.
+        step_groups = np.ascontiguousarray(groups.T)
+        step_directions = np.ascontiguousarray(directions.T)
+        lengths = np.full(num_schedules, length, dtype=np.int64)
+        rows = np.arange(num_schedules)
+        row_right = right
+        row_elapsed = elapsed
+        for step in range(length):
+            group = step_groups[step][rows]
+            present = group != 0
+            if not present.all():
+                ended = rows[~present]
+                lengths[ended] = step
+                right[ended] = row_right[~present]
+                elapsed[ended] = row_elapsed[~present]
+                rows, group, row_right, row_elapsed = rows[present], group[present], row_right[present], row_elapsed[present]
+            if not rows.size:
+                break
+
+            # The flashlight alternates sides, starting on the left.
+            on_right = step % 2 == 1
+            side = row_right if on_right else full_mask & ~row_right
+            size, move_time = self._group_size_and_time(group)
+            next_elapsed = row_elapsed + move_time
+            legal = (
+                (row_right != full_mask)
+                & (row_elapsed < max_time)
+                & (size <= capacity)
+                & (group & ~side == 0)
+                & (step_directions[step][rows] == (RIGHT_TO_LEFT if on_right else LEFT_TO_RIGHT))
+                & (next_elapsed <= max_time)
+            )
+
+            if not legal.all():
+                failed = ~legal
+                first_failure[rows[failed]] = step
+                right[rows[failed]] = row_right[failed]
+                elapsed[rows[failed]] = row_elapsed[failed]
+                rows, group, row_right, next_elapsed = rows[legal], group[legal], row_right[legal], next_elapsed[legal]
+            row_right = row_right ^ group
+            row_elapsed = next_elapsed
+
+        right[rows] = row_right
+        elapsed[rows] = row_elapsed
+
+        valid = (first_failure == -1) & (right == full_mask)
+        first_failure = np.where((first_failure == -1) & ~valid, lengths, first_failure)
+        return valid, elapsed, first_failure
+
+    def _group_size_and_time(self, group: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        size = np.zeros(group.shape, dtype=np.int64)
+        move_time = np.zeros(group.shape, dtype=np.int64)
+        for b in range(self._num_bytes):
+            byte = (group >> (8 * b)) & 0xFF
+            size += self._byte_counts[byte]
+            np.maximum(move_time, self._byte_max_times[b][byte], out=move_time)
+        return size, move_time
@@ -0,0 +1,123 @@
+import heapq
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Person
+from .base import Solver
+from .count_space import CountStateSpace
+from .state_space import StateSpace
+from .stats import SearchStats
+
+
+def bidirectional_search(space: StateSpace, time_limit: int, stats: Optional[SearchStats] = None
+                         ) -> Tuple[Optional[List[int]], Optional[int], int]:
+    """
+    Bidirectional Dijkstra between the start and the goal of `space`.
+
+    One search runs forward from the start over `StateSpace.successors`,
+    the other backward from the goal over `StateSpace.predecessors`; each
+    step settles a state on whichever side's next state is nearer its root,
+    so both sides grow to about half the optimal cost. Every
+    relaxed edge that reaches a state labelled by the other side offers a
+    complete schedule, and the cheapest one seen so far (`best`) is kept.
+
+    The search stops once the two smallest frontier keys add up to at least
+    `best`: any cheaper schedule would have to contain an edge from a state
+    settled forward to one settled backward, and relaxing that edge would
+    already have offered it. `stats`, if given, is updated as the search
+    goes; dominance pruning is counted for the forward side only.
+
+    Returns:
+        `(group_masks, total_time, nodes_expanded)`; the masks and time are
+        None if nothing within `time_limit` was found.
+    """
+    start, goal = space.get_start_state(), space.get_goal_state()
+    if start == goal:
+        return [], 0, 0
+
+    expand = (space.successors, space.predecessors)
+    distance = ({start: 0}, {goal: 0})
+    # state -> (neighbour towards this side's root, group moved between them)
+    parent = ({start: None}, {goal: None})
+    frontier = ([(0, start)], [(0, goal)])
+    best, meeting = None, None
+    nodes_expanded = 0
+
+    while frontier[0] and frontier[1]:
+        reach = frontier[0][0][0] + frontier[1][0][0]
+        if reach > time_limit or (best is not None and reach >= best):
+            break
+        side = 0 if frontier[0][0][0] <= frontier[1][0][0] else 1
+        elapsed, state = heapq.heappop(frontier[side])
+        if elapsed > distance[side][state]:
+            if stats is not None:
+                stats.on_pruned("transposition")
+            continue
+
+        nodes_expanded += 1
+        if stats is not None:
+            stats.on_expanded()
+            if side == 0:
+                stats.on_pruned("dominance", space.count_dominated(state))
+        labels, other_labels = distance[side], distance[1 - side]
+        for group, next_state, cost in expand[side](state):
+            if stats is not None:
+                stats.on_generated()
+            next_time = elapsed + cost
+            if next_time > time_limit:
+                if stats is not None:
+                    stats.on_pruned("time_limit")
+                continue
+            known = labels.get(next_state)
+            if known is None or next_time < known:
+                labels[next_state] = next_time
+                parent[side][next_state] = state, group
+                heapq.heappush(frontier[side], (next_time, next_state))
+            elif stats is not None:
+                stats.on_pruned("transposition")
+            remaining = other_labels.get(next_state)
+            if remaining is not None:
+                total = labels[next_state] + remaining
+                if total <= time_limit and (best is None or total < best):
+                    best, meeting = total, next_state
+        if stats is not None:
+            stats.on_frontier(len(frontier[0]) + len(frontier[1]))
+            stats.on_table(len(distance[0]) + len(distance[1]))
+
+    if meeting is None:
+        return None, None, nodes_expanded
+
+    groups = []
+    link = parent[0][meeting]
+    while link is not None:
+        state, group = link
+        groups.append(group)
+        link = parent[0][state]
+    groups.reverse()
+    link = parent[1][meeting]
+    while link is not None:
+        state, group = link
+        groups.append(group)
+        link = parent[1][state]
+    return groups, best, nodes_expanded
+
+
+class BidirectionalSolver(Solver):
+    """
+    Optimal solver: bidirectional Dijkstra from the all-left and all-right states.
+
+    The goal is a single known state, so the search can also grow backward
+    from it. Each side only has to reach about half of the optimal cost,
+    which settles fewer states than `DijkstraSolver` (see
+    `benchmarks.bidirectional`). With `symmetric`, people of equal crossing
+    time are merged (see `CountStateSpace`).
+    """
+
+    name = "bidirectional"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 prune: bool = True, stats: Optional[SearchStats] = None, symmetric: bool = False):
+        super().__init__(bridge, persons, flashlight, prune, stats)
+        if symmetric:
+            self._space = CountStateSpace(self._persons, bridge.get_capacity(), prune)
+
+    def _search(self):
+        return bidirectional_search(self._space, self._bridge.get_max_time(), self._stats)
@@ -0,0 +1,137 @@
+import time
+from typing import Iterator, List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Person
+from .base import Solver
+from .greedy import escort_schedule
+from .result import SolverResult
+from .stats import SearchStats
+
+
+class BranchAndBoundSolver(Solver):
+    """
+    Optimal, anytime solver: depth-first branch and bound.
+
+    Starts from `escort_schedule` as the incumbent and searches depth-first
+    for anything cheaper, cutting off a branch as soon as its elapsed time
+    plus `StateSpace.lower_bound` reaches the incumbent's. Children are tried
+    cheapest estimate first so good schedules turn up early.
+
+    Nothing is kept per visited state: the only memory is the current path,
+    one frame of sorted children per move, so it stays linear in the
+    schedule length. Moving along the path is a mask XOR, and backtracking
+    just pops the frame. The pruned space never undoes progress (forward
+    trips carry two or more, returns carry one), so there are no cycles to
+    guard against.
+    """
+
+    name = "branch_and_bound"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 stats: Optional[SearchStats] = None):
+        super().__init__(bridge, persons, flashlight, prune=True, stats=stats)
+        self._nodes_expanded = 0
+        self._proven_optimal = False
+
+    def is_proven_optimal(self) -> bool:
+        """Return True if the last search ran to completion, so its best schedule is optimal."""
+        return self._proven_optimal
+
+    def solve(self, time_budget: Optional[float] = None) -> SolverResult:
+        """
+        Return the best schedule found, searching for at most `time_budget` seconds.
+
+        Check `is_proven_optimal` to tell whether the search finished.
+        """
+        start = time.perf_counter()
+        best = None
+        with self._phase("search"):
+            for best in self.iter_incumbents(time_budget):
+                pass
+        if best is None:
+            return SolverResult(self.name, None, None, self._nodes_expanded, time.perf_counter() - start)
+        return SolverResult(self.name, best.get_moves(), best.get_total_time(), self._nodes_expanded,
+                            time.perf_counter() - start)
+
+    def iter_incumbents(self, time_budget: Optional[float] = None) -> Iterator[SolverResult]:
+        """
+        Yield each new best schedule within the time limit, cheapest last.
+
+        Each result reports the nodes expanded and the wall time spent up to
+        the moment it was found. Stopping the iteration (or running out of
+        `time_budget` seconds) leaves the last one as the best known.
+        """
+        start = time.perf_counter()
+        deadline = None if time_budget is None else start + time_budget
+        self._proven_optimal = False
+        self._nodes_expanded = 0
+        if not self._bridge.is_passable():
+            self._proven_optimal = True
+            return
+
+        space = self._space
+        stats = self._stats
+        goal = space.get_goal_state()
+        # Only schedules strictly cheaper than `bound` are of interest.
+        bound = self._bridge.get_max_time() + 1
+
+        groups = escort_schedule(space.get_times(), space.get_capacity())
+        if groups is not None:
+            total_time = sum(map(space.group_time, groups))
+            if total_time < bound:
+                bound = total_time
+                yield self._incumbent(groups, total_time, start)
+
+        path: List[int] = []
+        self._nodes_expanded += 1
+        frames = [iter(self._children(0, 0, bound))]
+        while frames:
+            child = next(frames[-1], None)
+            # Children come cheapest estimate first, so once one is cut off
+            # by the bound the rest of its frame is too.
+            if child is None or child[0] >= bound:
+                if stats is not None and child is not None:
+                    stats.on_pruned("bound", 1 + sum(1 for _ in frames[-1]))
+                frames.pop()
+                if frames:
+                    path.pop()
+                continue
+
+            _, group, next_state, next_time = child
+            if next_state == goal:
+                bound = next_time
+                yield self._incumbent(path + [group], next_time, start)
+                continue
+            self._nodes_expanded += 1
+            # Expanding a state costs far more than reading the clock, even
+            # for small rosters, so the budget is checked every time.
+            if deadline is not None and time.perf_counter() > deadline:
+                return
+            path.append(group)
+            frames.append(iter(self._children(next_state, next_time, bound)))
+            if stats is not None:
+                stats.on_frontier(len(frames))
+        self._proven_optimal = True
+
+    def _children(self, state: int, elapsed: int, bound: int) -> List[Tuple[int, int, int, int]]:
+        """Return `(estimate, group, next_state, next_time)` for the moves from `state`, lowest estimate first."""
+        lower_bound = self._space.lower_bound
+        children = []
+        generated = 0
+        for group, next_state, cost in self._space.successors(state):
+            generated += 1
+            next_time = elapsed + cost
+            estimate = next_time + lower_bound(next_state)
+            if estimate < bound:
+                children.append((estimate, group, next_state, next_time))
+        children.sort()
+        stats = self._stats
+        if stats is not None:
+            stats.on_expanded()
+            stats.on_generated(generated)
+            stats.on_pruned("bound", generated - len(children))
+            stats.on_pruned("dominance", self._space.count_dominated(state))
+        return children
+
+    def _incumbent(self, groups: Sequence[int], total_time: int, start: float) -> SolverResult:
+        return SolverResult(self.name, self._space.to_moves(groups), total_time, self._nodes_expanded,
+                            time.perf_counter() - start)
@@ -0,0 +1,59 @@
+from models import GameState, Flashlight
+from .base import Solver
+
+
+class BruteForceSolver(Solver):
+    """
+    Baseline solver: exhaustive depth-first search over a full GameState.
+
+    Explores every schedule that fits the time limit by making each valid
+    move on a single GameState and taking it back with `undo_move`, with no
+    pruning beyond the limit itself. Only practical for small rosters; it
+    exists to compare the other solvers against.
+    """
+
+    name = "brute_force"
+
+    def _search(self):
+        persons = self._space.get_persons()
+        state = GameState(self._bridge, Flashlight(), persons)
+        rank = {person: 1 << i for i, person in enumerate(persons)}
+
+        stats = self._stats
+        best_moves, best_time = None, None
+        nodes_expanded = 0
+        frames = []
+        if state.is_game_won():
+            best_moves, best_time = (), 0
+        else:
+            nodes_expanded += 1
+            frames.append(iter(self._expand(state)))
+        while frames:
+            move = next(frames[-1], None)
+            if move is None:
+                frames.pop()
+                if frames:
+                    state.undo_move()
+                continue
+            state.make_move(move)
+            if state.is_game_won():
+                if best_time is None or state.get_elapsed_time() < best_time:
+                    best_moves, best_time = state.get_move_history(), state.get_elapsed_time()
+                state.undo_move()
+                continue
+            nodes_expanded += 1
+            frames.append(iter(self._expand(state)))
+            if stats is not None:
+                stats.on_frontier(len(frames))
+
+        if best_moves is None:
+            return None, None, nodes_expanded
+        groups = [sum(rank[p] for p in move.get_crossing_persons()) for move in best_moves]
+        return groups, best_time, nodes_expanded
+
+    def _expand(self, state: GameState):
+        moves = state.get_valid_moves()
+        if self._stats is not None:
+            self._stats.on_expanded()
+            self._stats.on_generated(len(moves))
+        return moves
@@ -0,0 +1,145 @@
+import json
+import sqlite3
+import time
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Move, Person
+from .api import solve
+from .result import SolverResult
+
+# A cached solution: optimal total time (None if no schedule exists at all)
+# and the schedule as groups of indices into the sorted crossing times.
+CachedSolution = Tuple[Optional[int], List[List[int]]]
+
+
+class SolutionCache:
+    """
+    On-disk cache of optimal solutions, shared across processes and restarts.
+
+    Entries are keyed by the canonical instance: the sorted crossing times and
+    the bridge capacity. Names and the time limit are not part of the key, so
+    any roster with the same multiset of times reuses the entry; the stored
+    schedule refers to people by their position in the sorted times and is
+    mapped back onto the caller's own Person objects. The time limit is
+    applied on the way out.
+
+    The cache is an SQLite file. Each hit refreshes the entry's last-used
+    stamp, and once more than `max_entries` are stored the least recently
+    used are deleted. Each open cache counts the entries once and then
+    tracks its own inserts, so entries other processes add in the meantime
+    are only counted when it is reopened.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path (str): SQLite database file
+            max_entries (int): Maximum number of instances kept
+        """
+        self._path = path
+        self._max_entries = max_entries
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS solutions ("
+            " key TEXT PRIMARY KEY,"
+            " total_time INTEGER,"
+            " schedule TEXT NOT NULL,"
+            " last_used INTEGER NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS solutions_last_used ON solutions (last_used)")
+        self._connection.commit()
+        # Counted once here and kept up to date by `store`, so inserts do not scan the table.
+        self._num_entries = len(self)
+
+    @staticmethod
+    def make_key(times: Sequence[int], capacity: int) -> str:
+        return f"{capacity}:" + ",".join(str(t) for t in sorted(times))
+
+    def lookup(self, times: Sequence[int], capacity: int) -> Optional[CachedSolution]:
+        """Return the cached solution for these times and capacity, or None on a miss."""
+        key = self.make_key(times, capacity)
+        row = self._connection.execute(
+            "SELECT total_time, schedule FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._connection.execute("UPDATE solutions SET last_used = ? WHERE key = ?", (time.time_ns(), key))
+        self._connection.commit()
+        return row[0], json.loads(row[1])
+
+    def store(self, times: Sequence[int], capacity: int, solution: CachedSolution) -> None:
+        """Store the optimal solution for these times and capacity, evicting old entries if full."""
+        total_time, groups = solution
+        row = (total_time, json.dumps(groups), time.time_ns(), self.make_key(times, capacity))
+        inserted = self._connection.execute(
+            "INSERT OR IGNORE INTO solutions (total_time, schedule, last_used, key) VALUES (?, ?, ?, ?)", row)
+        if inserted.rowcount:
+            self._num_entries += 1
+        else:
+            self._connection.execute(
+                "UPDATE solutions SET total_time = ?, schedule = ?, last_used = ? WHERE key = ?", row)
+        excess = self._num_entries - self._max_entries
+        if excess > 0:
+            deleted = self._connection.execute(
+                "DELETE FROM solutions WHERE key IN "
+                "(SELECT key FROM solutions ORDER BY last_used LIMIT ?)", (excess,))
+            self._num_entries -= deleted.rowcount
+        self._connection.commit()
+
+    def solve(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None) -> SolverResult:
+        """
+        Solve an instance, from the cache when possible.
+
+        On a miss the instance is solved without a time limit (the cache
+        stores the true optimum) and stored. Either way, the result is solved
+        only if the optimum fits `bridge`'s time limit.
+        """
+        start = time.perf_counter()
+        times = [p.get_crossing_time() for p in persons]
+        capacity = bridge.get_capacity()
+        solution = self.lookup(times, capacity)
+        name, nodes_expanded = "cache", 0
+        if solution is None:
+            unlimited = Bridge(capacity=capacity, max_time=2 * sum(times) + 1)
+            result = solve(unlimited, persons)
+            ranked = sorted(persons, key=lambda p: p.get_crossing_time())
+            index = {id(person): i for i, person in enumerate(ranked)}
+            groups = [[index[id(p)] for p in move.get_crossing_persons()] for move in result.get_moves() or []]
+            solution = (result.get_total_time(), groups)
+            self.store(times, capacity, solution)
+            name, nodes_expanded = result.get_solver_name(), result.get_nodes_expanded()
+
+        total_time, groups = solution
+        moves = None
+        if bridge.is_passable() and total_time is not None and total_time <= bridge.get_max_time():
+            moves = self.to_moves(groups, persons)
+        else:
+            total_time = None
+        return SolverResult(name, moves, total_time, nodes_expanded, time.perf_counter() - start)
+
+    @staticmethod
+    def to_moves(groups: List[List[int]], persons: Sequence[Person]) -> List[Move]:
+        """Map a cached schedule onto `persons`, matching people by crossing-time rank."""
+        ranked = sorted(persons, key=lambda p: p.get_crossing_time())
+        moves = []
+        for step, group in enumerate(groups):
+            members = [ranked[i] for i in group]
+            move = Move(members, "left_to_right" if step % 2 == 0 else "right_to_left")
+            move.set_time_taken(max(p.get_crossing_time() for p in members))
+            moves.append(move)
+        return moves
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def __enter__(self) -> "SolutionCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SolutionCache(path='{self._path}', entries={len(self)}, max_entries={self._max_entries})"
@@ -0,0 +1,150 @@
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+from models import Bridge, GameState, Move, Person
+from .state_space import StateSpace
+
+
+def retrograde_search(space: StateSpace, max_time: Optional[int] = None) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Minimum time from each position to the goal, by Dijkstra outwards from the goal.
+
+    `space` must be unpruned, where every move can be undone at the same
+    cost, so the successors of a state are also its predecessors.
+    Positions that need more than `max_time` are left out.
+
+    Returns:
+        `(cost_to_go, best_group)`: both keyed by state; `best_group` is the
+        first group of an optimal way to finish (absent for the goal)
+    """
+    goal = space.get_goal_state()
+    cost_to_go = {goal: 0}
+    best_group: Dict[int, int] = {}
+    frontier = [(0, goal)]
+    while frontier:
+        cost, state = heapq.heappop(frontier)
+        if cost > cost_to_go[state]:
+            continue
+        for group, previous, step_cost in space.successors(state):
+            previous_cost = cost + step_cost
+            if max_time is not None and previous_cost > max_time:
+                continue
+            known = cost_to_go.get(previous)
+            if known is None or previous_cost < known:
+                cost_to_go[previous] = previous_cost
+                best_group[previous] = group
+                heapq.heappush(frontier, (previous_cost, previous))
+    return cost_to_go, best_group
+
+
+class CostToGoTable:
+    """
+    The minimum time still needed from every position of one instance.
+
+    Computed once by `retrograde_search` over the unpruned space (any move
+    `GameState` allows), then re-indexed by the game's own roster masks, so
+    a `GameState` is looked up straight from `to_compact` without sorting
+    or searching: hints, move grades and the "can we still make it?" check
+    are each O(1) plus the size of the group involved. The table has
+    ``2 ** (n + 1)`` entries, which limits it to small rosters.
+    """
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], max_people: int = 20):
+        """
+        Build the table.
+
+        Args:
+            bridge (Bridge): The bridge (capacity and time limit)
+            persons (Sequence[Person]): The roster, in the same order as the GameStates it will be asked about
+            max_people (int): Refuse larger rosters, whose table would not fit in memory
+        """
+        if len(persons) > max_people:
+            raise ValueError(f"a cost-to-go table for {len(persons)} people has 2**{len(persons) + 1} entries; "
+                             f"at most {max_people} people are supported")
+        self._persons = list(persons)
+        self._max_time = bridge.get_max_time()
+        space = StateSpace(self._persons, bridge.get_capacity(), prune=False)
+        costs, groups = retrograde_search(space, self._max_time)
+
+        # Rank bit -> roster bit, then every rank-ordered state to its roster-ordered index.
+        roster_index = {id(person): i for i, person in enumerate(self._persons)}
+        roster_bits = [1 << roster_index[id(person)] for person in space.get_persons()]
+
+        def to_roster(mask: int) -> int:
+            converted = 0
+            while mask:
+                low = mask & -mask
+                converted |= roster_bits[low.bit_length() - 1]
+                mask ^= low
+            return converted
+
+        size = 2 << len(self._persons)
+        self._cost_to_go: List[Optional[int]] = [None] * size
+        self._best_group: List[int] = [0] * size
+        for state, cost in costs.items():
+            index = to_roster(state >> 1) << 1 | state & 1
+            self._cost_to_go[index] = cost
+            if state in groups:
+                self._best_group[index] = to_roster(groups[state])
+
+    def get_persons(self) -> List[Person]:
+        return self._persons.copy()
+
+    def get_optimal_time(self) -> Optional[int]:
+        """Return the optimum from the start, or None if nobody can get everyone across in time."""
+        return self._cost_to_go[0]
+
+    def get_cost_to_go(self, game_state: GameState) -> Optional[int]:
+        """Return the minimum time still needed from `game_state`, or None if it is beyond the time limit."""
+        return self._cost_to_go[self._index(game_state)]
+
+    def can_still_win(self, game_state: GameState) -> bool:
+        """Whether everyone can still get across within `game_state.get_remaining_time()`."""
+        cost = self._cost_to_go[self._index(game_state)]
+        return cost is not None and cost <= game_state.get_remaining_time()
+
+    def get_hint(self, game_state: GameState) -> Optional[Move]:
+        """Return a move that starts a fastest way to finish, or None if there is none (or the game is won)."""
+        if game_state.is_game_over() or not self.can_still_win(game_state):
+            return None
+        index = self._index(game_state)
+        direction = "right_to_left" if index & 1 else "left_to_right"
+        return Move(self._members(self._best_group[index]), direction)
+
+    def grade_move(self, game_state: GameState, move: Move) -> Optional[int]:
+        """
+        Return how many minutes `move` loses against the best move from `game_state`.
+
+        0 means the move is optimal. Returns None if the position is already
+        lost, or the move is not allowed or leaves no way to finish in time.
+        """
+        group = game_state.mask_of(list(move.get_crossing_persons()))
+        if group is None or not self.can_still_win(game_state) or not game_state.can_make_move(move):
+            return None
+        index = self._index(game_state)
+        after = self._cost_to_go[(index >> 1 ^ group) << 1 | (index & 1 ^ 1)]
+        move_time = max(person.get_crossing_time() for person in move.get_crossing_persons())
+        if after is None or move_time + after > game_state.get_remaining_time():
+            return None
+        return move_time + after - self._cost_to_go[index]
+
+    def optimal_moves(self, game_state: GameState) -> List[Move]:
+        """Return a fastest way to finish from `game_state` (empty if there is none), leaving it untouched."""
+        index = self._index(game_state)
+        if self._cost_to_go[index] is None:
+            return []
+        moves = []
+        while self._cost_to_go[index]:
+            group = self._best_group[index]
+            direction = "right_to_left" if index & 1 else "left_to_right"
+            move = Move(self._members(group), direction)
+            move.set_time_taken(max(person.get_crossing_time() for person in move.get_crossing_persons()))
+            moves.append(move)
+            index = (index >> 1 ^ group) << 1 | (index & 1 ^ 1)
+        return moves
+
+    def _index(self, game_state: GameState) -> int:
+        compact = game_state.to_compact()
+        return compact.get_right_mask() << 1 | compact.is_flashlight_on_right()
+
+    def _members(self, group: int) -> List[Person]:
+        return [self._persons[i] for i in range(group.bit_length()) if group >> i & 1]
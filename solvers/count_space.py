@@ -0,0 +1,192 @@
+from typing import Iterator, List, Sequence, Tuple
+from models import Move, Person
+from .state_space import StateSpace
+
+
+class CountStateSpace(StateSpace):
+    """
+    Search space with people of equal crossing time merged.
+
+    People with the same crossing time are interchangeable, so a position is
+    fully described by how many people of each distinct time are on the
+    right. The counts are packed into one int in mixed radix (digit ``i``
+    has base ``count_i + 1``), and a state is ``right_counts << 1 |
+    flashlight_on_right`` as in `StateSpace`. A group is packed the same
+    way, as how many people of each time cross.
+
+    This shrinks the states from ``2**n`` to ``2 * prod(count_i + 1)`` and
+    merges moves that differ only in which of the tied people cross. The
+    same dominance pruning applies, since it only depends on group sizes.
+    `to_moves` picks concrete people for each group at the end. The searches
+    run on it unchanged; pass ``symmetric=True`` to the solvers that accept it.
+    """
+
+    def __init__(self, persons: Sequence[Person], capacity: int, prune: bool = True):
+        super().__init__(persons, capacity, prune)
+        self._distinct: List[int] = sorted(set(self._times))
+        self._counts = [self._times.count(t) for t in self._distinct]
+        self._weights = []
+        weight = 1
+        for count in self._counts:
+            self._weights.append(weight)
+            weight *= count + 1
+        self._full_counts = weight - 1
+
+    def get_distinct_times(self) -> List[int]:
+        return self._distinct.copy()
+
+    def get_counts(self) -> List[int]:
+        """Return how many people have each distinct time, fastest first."""
+        return self._counts.copy()
+
+    def get_num_states(self) -> int:
+        return 2 * (self._full_counts + 1)
+
+    def get_goal_state(self) -> int:
+        return self._full_counts << 1 | 1 if self._num_persons else 0
+
+    def decode(self, packed: int) -> List[int]:
+        """Unpack a state's right-side counts (or a group's counts) into one count per distinct time."""
+        counts = []
+        for count in self._counts:
+            packed, digit = divmod(packed, count + 1)
+            counts.append(digit)
+        return counts
+
+    def persons_of(self, group: int) -> List[Person]:
+        """
+        Return representative people for a packed group: for each time, the
+        last ``count`` people of that time, the ones `to_moves` sends first.
+
+        Tied people are interchangeable, so any choice crosses in the same
+        time; over a whole schedule use `to_moves`, which keeps track of who
+        is on which side.
+        """
+        members = []
+        end = 0
+        for count, taken in zip(self._counts, self.decode(group)):
+            end += count
+            members.extend(self._persons[end - taken:end])
+        return members
+
+    def group_time(self, group: int) -> int:
+        slowest = 0
+        for i, count in enumerate(self.decode(group)):
+            if count:
+                slowest = self._distinct[i]
+        return slowest
+
+    def successors(self, state: int) -> Iterator[Tuple[int, int, int]]:
+        """Yield `(group, next_state, cost)` like `StateSpace.successors`, with groups as packed counts."""
+        on_right = state & 1
+        side = self._flashlight_side(state)
+        sizes = self._group_sizes(on_right, sum(side))
+        sign = -1 if on_right else 1
+        for group, cost in self._groups(side, sizes):
+            yield group, state + sign * (group << 1) ^ 1, cost
+
+    def predecessors(self, state: int) -> Iterator[Tuple[int, int, int]]:
+        """Yield `(group, previous_state, cost)` for the moves into `state`; see `StateSpace.predecessors`."""
+        if not self._prune:
+            yield from self.successors(state)
+            return
+
+        on_right = state & 1
+        side = self._flashlight_side(state)
+        if on_right:
+            num_left = self._num_persons - sum(side)
+            smallest = 1 if num_left == 0 else max(2, self._capacity + 1 - num_left)
+            sizes = range(smallest, min(self._capacity, sum(side)) + 1)
+        else:
+            sizes = range(1, min(1, sum(side)) + 1)
+        sign = -1 if on_right else 1
+        for group, cost in self._groups(side, sizes):
+            yield group, state + sign * (group << 1) ^ 1, cost
+
+    def count_dominated(self, state: int) -> int:
+        """Return how many groups (as counts) pruning leaves out of `successors`."""
+        if not self._prune:
+            return 0
+        side = self._flashlight_side(state)
+        # ways[size] = number of count vectors of that total within the side.
+        ways = [1] + [0] * self._capacity
+        for available in side:
+            ways = [sum(ways[size - taken] for taken in range(min(available, size) + 1))
+                    for size in range(self._capacity + 1)]
+        kept_sizes = self._group_sizes(state & 1, sum(side))
+        return sum(ways[size] for size in range(1, self._capacity + 1) if size not in kept_sizes)
+
+    def lower_bound(self, state: int) -> int:
+        """Admissible estimate of the time still needed; the same bound as `StateSpace.lower_bound`."""
+        right = self.decode(state >> 1)
+        left = [count - on_right for count, on_right in zip(self._counts, right)]
+        num_left = sum(left)
+        if not num_left:
+            return 0
+
+        capacity = self._capacity
+        bound = 0
+        if state & 1:
+            bound += next(self._distinct[i] for i, count in enumerate(right) if count)
+
+        # Slowest first in chunks of `capacity`: count the chunk heads among
+        # each time's people.
+        position = 0
+        for i in range(len(left) - 1, -1, -1):
+            if left[i]:
+                heads = (position + left[i] - 1) // capacity - (position - 1) // capacity
+                bound += heads * self._distinct[i]
+                position += left[i]
+
+        if capacity > 1 and num_left > 1:
+            forward_trips = -(-(num_left - 1) // (capacity - 1))
+            bound += (forward_trips - 1) * self._distinct[0]
+        return bound
+
+    def to_moves(self, groups: Sequence[int]) -> List[Move]:
+        """Turn a sequence of packed groups into Moves, choosing concrete people as they go."""
+        pools = ([], [])
+        start = 0
+        for count in self._counts:
+            pools[0].append(self._persons[start:start + count])
+            pools[1].append([])
+            start += count
+
+        moves = []
+        for step, group in enumerate(groups):
+            source, target = pools[step % 2], pools[1 - step % 2]
+            members = []
+            for i, count in enumerate(self.decode(group)):
+                for _ in range(count):
+                    person = source[i].pop()
+                    target[i].append(person)
+                    members.append(person)
+            move = Move(members, "left_to_right" if step % 2 == 0 else "right_to_left")
+            move.set_time_taken(self.group_time(group))
+            moves.append(move)
+        return moves
+
+    def _flashlight_side(self, state: int) -> List[int]:
+        right = self.decode(state >> 1)
+        if state & 1:
+            return right
+        return [count - on_right for count, on_right in zip(self._counts, right)]
+
+    def _groups(self, side: List[int], sizes: range) -> Iterator[Tuple[int, int]]:
+        """Yield `(packed_group, cost)` for every count vector within `side` whose total is in `sizes`."""
+        if not sizes:
+            return
+        largest = sizes[-1]
+        distinct, weights = self._distinct, self._weights
+
+        def extend(i: int, taken: int, packed: int, cost: int):
+            if i < 0:
+                if taken in sizes:
+                    yield packed, cost
+                return
+            # Slowest times first, so the first nonzero count sets the cost.
+            for count in range(min(side[i], largest - taken), -1, -1):
+                yield from extend(i - 1, taken + count, packed + count * weights[i],
+                                  cost or (distinct[i] if count else 0))
+
+        yield from extend(len(side) - 1, 0, 0, 0)
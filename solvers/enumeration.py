@@ -0,0 +1,161 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Move, Person
+from .cost_to_go import retrograde_search
+from .state_space import StateSpace
+
+
+class SolutionEnumerator:
+    """
+    Streams every schedule that gets everyone across within the time limit.
+
+    Moves are exactly those `GameState.get_valid_moves` allows (any group up
+    to the bridge capacity on the flashlight side), so the search runs on an
+    unpruned `StateSpace`. Schedules are produced lazily by a depth-first
+    walk. Before walking, the exact minimum time to finish from every
+    position is computed once (Dijkstra outwards from the goal; moves are
+    reversible at equal cost), and any move that cannot finish in time is
+    skipped, so every branch explored ends in at least one schedule.
+
+    With `canonical=True`, people with equal crossing times are treated as
+    interchangeable: within each group of tied people, a move always uses the
+    fastest-ranked ones available on that side, so each schedule is produced
+    once per sequence of "how many of each crossing time" moves.
+    """
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 canonical: bool = False):
+        """
+        Initialize the enumerator.
+
+        Args:
+            bridge (Bridge): The bridge (capacity and time limit)
+            persons (Sequence[Person]): All people, everyone starting on the left
+            flashlight (Optional[Flashlight]): The flashlight; kept for parity with the solvers
+            canonical (bool): Produce one schedule per class of tie-symmetric schedules
+        """
+        self._bridge = bridge
+        self._flashlight = flashlight
+        self._canonical = canonical
+        self._space = StateSpace(persons, bridge.get_capacity(), prune=False)
+        self._cost_to_go: Optional[Dict[int, int]] = None
+
+        # Bits of each run of people with the same crossing time, by rank.
+        times = self._space.get_times()
+        self._tie_class = []
+        class_mask = 0
+        for i, t in enumerate(times):
+            if i and t != times[i - 1]:
+                class_mask = 0
+            class_mask |= 1 << i
+            self._tie_class.append(class_mask)
+        for i in range(len(times) - 2, -1, -1):
+            if times[i] == times[i + 1]:
+                self._tie_class[i] = self._tie_class[i + 1]
+
+    def __iter__(self) -> Iterator[Tuple[Move, ...]]:
+        return self.iter_solutions()
+
+    def iter_solutions(self) -> Iterator[Tuple[Move, ...]]:
+        """Lazily yield each schedule, as a tuple of Moves, that wins within the time limit."""
+        if not self._bridge.is_passable():
+            return
+        space = self._space
+        max_time = self._bridge.get_max_time()
+        goal = space.get_goal_state()
+        start = space.get_start_state()
+
+        if start == goal:
+            yield ()
+            return
+
+        groups: List[int] = []
+        stack = [(start, 0, self._moves(start, 0, max_time))]
+        while stack:
+            state, elapsed, moves = stack[-1]
+            step = next(moves, None)
+            if step is None:
+                stack.pop()
+                if groups:
+                    groups.pop()
+                continue
+            group, next_state, next_time = step
+            if next_state == goal:
+                yield tuple(space.to_moves(groups + [group]))
+                continue
+            groups.append(group)
+            stack.append((next_state, next_time, self._moves(next_state, next_time, max_time)))
+
+    def count(self) -> int:
+        """
+        Count the schedules `iter_solutions` would yield, without building them.
+
+        Dynamic programming over (state, elapsed time): the number of ways to
+        finish from a position depends only on where everyone is and how much
+        time is left, so each pair is counted once.
+        """
+        if not self._bridge.is_passable():
+            return 0
+        space = self._space
+        max_time = self._bridge.get_max_time()
+        goal = space.get_goal_state()
+        start = space.get_start_state()
+        if start == goal:
+            return 1
+
+        memo: Dict[Tuple[int, int], int] = {}
+        # Explicit post-order walk, so long schedules do not hit the recursion limit.
+        stack = [(start, 0, False)]
+        while stack:
+            state, elapsed, children_done = stack.pop()
+            key = (state, elapsed)
+            if key in memo:
+                continue
+            successors = list(self._moves(state, elapsed, max_time))
+            if not children_done:
+                stack.append((state, elapsed, True))
+                for _, next_state, next_time in successors:
+                    if next_state != goal and (next_state, next_time) not in memo:
+                        stack.append((next_state, next_time, False))
+                continue
+            memo[key] = sum(1 if next_state == goal else memo[(next_state, next_time)]
+                            for _, next_state, next_time in successors)
+        return memo[(start, 0)]
+
+    def _moves(self, state: int, elapsed: int, max_time: int) -> Iterator[Tuple[int, int, int]]:
+        """Yield `(group, next_state, next_elapsed)` for moves that can still finish in time."""
+        if elapsed >= max_time:
+            return
+        cost_to_go = self._get_cost_to_go()
+        for group, next_state, cost in self._space.successors(state):
+            next_time = elapsed + cost
+            remaining = cost_to_go.get(next_state)
+            if remaining is None or next_time + remaining > max_time:
+                continue
+            if self._canonical and not self._is_canonical(state, group):
+                continue
+            yield group, next_state, next_time
+
+    def _get_cost_to_go(self) -> Dict[int, int]:
+        """Minimum time from each position to the goal, found by Dijkstra from the goal."""
+        if self._cost_to_go is None:
+            self._cost_to_go = retrograde_search(self._space, self._bridge.get_max_time())[0]
+        return self._cost_to_go
+
+    def _is_canonical(self, state: int, group: int) -> bool:
+        """True if, within each tie class, `group` uses the lowest-ranked people on the flashlight side."""
+        right = state >> 1
+        side = right if state & 1 else self._space.get_full_mask() & ~right
+        rest = group
+        while rest:
+            tie_class = self._tie_class[(rest & -rest).bit_length() - 1]
+            chosen = group & tie_class
+            available = side & tie_class
+            # The lowest |chosen| available bits of the class, compared with the chosen bits.
+            lowest = 0
+            for _ in range(bin(chosen).count("1")):
+                low = (available & ~lowest) & -(available & ~lowest)
+                lowest |= low
+            if lowest != chosen:
+                return False
+            rest &= ~tie_class
+        return True
@@ -0,0 +1,157 @@
+import time
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Move, Person
+from .base import Solver
+from .result import SolverResult
+from .stats import SearchStats
+
+
+def optimal_total_time(times: Sequence[int]) -> int:
+    """
+    Optimal total time for capacity 2, in O(n log n).
+
+    With the times sorted ascending (t1 <= t2 <= ...), the two slowest people
+    still on the left are sent over by whichever pattern is cheaper:
+
+    * t1 and t2 cross, t1 returns, the two slowest cross, t2 returns
+      (t1 + 2*t2 + tn), or
+    * t1 escorts each of the two slowest across and returns twice
+      (2*t1 + tn-1 + tn).
+
+    Three or fewer people are finished off directly.
+    """
+    times = sorted(times)
+    remaining = len(times)
+    total = 0
+    while remaining > 3:
+        total += min(times[0] + 2 * times[1] + times[remaining - 1],
+                     2 * times[0] + times[remaining - 2] + times[remaining - 1])
+        remaining -= 2
+    if remaining == 3:
+        total += times[0] + times[1] + times[2]
+    elif remaining:
+        total += times[remaining - 1]
+    return total
+
+
+def escort_schedule(times: Sequence[int], capacity: int) -> Optional[List[int]]:
+    """
+    Heuristic schedule for any capacity, as group masks over ranks.
+
+    Generalizes `optimal_total_time`'s two patterns. With `times` sorted
+    ascending (rank 0 is the fastest), each round sends the 2*(c-1) slowest
+    people still on the left across by the cheaper of:
+
+    * rank 0 escorting c-1 of them over twice, returning after each trip, or
+    * ranks 0 and 1 crossing with c-2 of them, rank 0 returning, the c
+      slowest crossing and rank 1 returning.
+
+    When fewer are left, rank 0 escorts c-1 at a time, and whoever fits on
+    the bridge crosses last. For capacity 2 this is the optimal schedule; for
+    larger capacities it is an upper bound.
+
+    Returns:
+        The groups, alternating forward and back, or None if nobody can
+        bring the flashlight back (capacity below 2 with several people).
+    """
+    num_persons = len(times)
+    if num_persons > 1 and capacity < 2:
+        return None
+
+    def chunk(low: int, high: int) -> int:
+        return ((1 << high) - 1) ^ ((1 << low) - 1)
+
+    groups = []
+    remaining = num_persons
+    while remaining > capacity:
+        step = capacity - 1
+        if remaining - 2 >= 2 * step:
+            escorted = 2 * times[0] + times[remaining - 1] + times[remaining - 1 - step]
+            first_trip = max(times[1], times[remaining - 1 - capacity]) if capacity > 2 else times[1]
+            shuttled = first_trip + times[0] + times[remaining - 1] + times[1]
+            if shuttled < escorted:
+                groups += [0b11 | chunk(remaining - 2 * step, remaining - capacity), 0b1,
+                           chunk(remaining - capacity, remaining), 0b10]
+            else:
+                groups += [0b1 | chunk(remaining - step, remaining), 0b1,
+                           0b1 | chunk(remaining - 2 * step, remaining - step), 0b1]
+            remaining -= 2 * step
+        else:
+            groups += [0b1 | chunk(remaining - step, remaining), 0b1]
+            remaining -= step
+    if remaining:
+        groups.append(chunk(0, remaining))
+    return groups
+
+
+class GreedySolver(Solver):
+    """
+    Closed-form optimal solver for capacity-2 bridges.
+
+    Builds the schedule from `optimal_total_time`'s two patterns instead of
+    searching, so rosters of 100,000+ people solve in well under a second.
+    Because it is exact, it also serves as the oracle for cross-checking the
+    search-based solvers.
+    """
+
+    name = "greedy"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 stats: Optional[SearchStats] = None):
+        if bridge.get_capacity() != 2:
+            raise ValueError(f"GreedySolver requires a bridge of capacity 2, got {bridge.get_capacity()}")
+        self._bridge = bridge
+        self._persons = list(persons)
+        self._flashlight = flashlight
+        # The masks-based StateSpace is deliberately skipped: this solver works
+        # on the sorted roster directly, which keeps it O(n log n).
+        self._space = None
+        self._stats = stats
+
+    def solve(self) -> SolverResult:
+        start = time.perf_counter()
+        with self._phase("search"):
+            moves, total_time = self._build_schedule() if self._bridge.is_passable() else (None, None)
+        if total_time is not None and total_time > self._bridge.get_max_time():
+            moves, total_time = None, None
+        return SolverResult(self.name, moves, total_time, 0, time.perf_counter() - start)
+
+    def _build_schedule(self) -> Tuple[List[Move], int]:
+        persons = sorted(self._persons, key=Person.get_crossing_time)
+        times = [p.get_crossing_time() for p in persons]
+        moves = []
+        total_time = 0
+
+        def cross(group: List[Person], direction: str, move_time: int) -> None:
+            move = Move(group, direction)
+            move.set_time_taken(move_time)
+            moves.append(move)
+
+        remaining = len(persons)
+        while remaining > 3:
+            t1, t2, slow_time, slowest_time = times[0], times[1], times[remaining - 2], times[remaining - 1]
+            fastest, second = persons[0], persons[1]
+            slow, slowest = persons[remaining - 2], persons[remaining - 1]
+            if 2 * t2 <= t1 + slow_time:
+                cross([fastest, second], "left_to_right", t2)
+                cross([fastest], "right_to_left", t1)
+                cross([slow, slowest], "left_to_right", slowest_time)
+                cross([second], "right_to_left", t2)
+                total_time += t1 + 2 * t2 + slowest_time
+            else:
+                cross([fastest, slowest], "left_to_right", slowest_time)
+                cross([fastest], "right_to_left", t1)
+                cross([fastest, slow], "left_to_right", slow_time)
+                cross([fastest], "right_to_left", t1)
+                total_time += 2 * t1 + slow_time + slowest_time
+            remaining -= 2
+
+        if remaining == 3:
+            cross([persons[0], persons[2]], "left_to_right", times[2])
+            cross([persons[0]], "right_to_left", times[0])
+            cross([persons[0], persons[1]], "left_to_right", times[1])
+            total_time += times[0] + times[1] + times[2]
+        elif remaining:
+            cross(persons[:remaining], "left_to_right", times[remaining - 1])
+            total_time += times[remaining - 1]
+        return moves, total_time
@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Person
+from .astar import astar_search
+from .base import Solver
+from .greedy import GreedySolver
+from .state_space import StateSpace
+from .stats import SearchStats
+from .transposition import TranspositionTable
+
+
+class IncrementalSolver(Solver):
+    """
+    Optimal solver for live what-if editing of one instance.
+
+    The solver keeps the optimum of the current roster *without* a time
+    limit, so `set_max_time` never triggers a search: the limit only decides
+    whether that optimum is allowed. After `set_crossing_time` the previous
+    optimal schedule is re-priced with the new time and reused when it is
+    provably still optimal:
+
+    * if every edit since the last solve raised a time, no schedule got
+      cheaper, so an unchanged cost means the old schedule is still optimal;
+    * if its cost meets `StateSpace.lower_bound` of the start, it is optimal.
+
+    Otherwise the re-priced schedule is an upper bound for a fresh search,
+    and optima are memoized by the sorted crossing times, so toggling a value
+    back and forth is answered from the memo. States are indexed by rank, so
+    changing one time can reorder every state; the search table itself is not
+    carried over.
+    """
+
+    name = "incremental"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 prune: bool = True, memo_size: int = 1024, stats: Optional[SearchStats] = None):
+        """
+        Initialize the solver.
+
+        Args:
+            bridge (Bridge): The bridge (capacity and time limit)
+            persons (Sequence[Person]): All people, everyone starting on the left
+            flashlight (Optional[Flashlight]): The flashlight; only used by `verify`
+            prune (bool): Skip dominated moves (see `StateSpace.successors`)
+            memo_size (int): Number of sorted-times optima remembered
+            stats (Optional[SearchStats]): Collects counters and phase timings while solving
+        """
+        super().__init__(bridge, persons, flashlight, prune, stats)
+        self._prune = prune
+        self._memo_size = memo_size
+        self._memo: "OrderedDict[Tuple[int, ...], Tuple[Optional[int], List[int]]]" = OrderedDict()
+        # Unlimited optimum of the current roster as (total_time, group_masks),
+        # or None when it has to be worked out again.
+        self._optimum: Optional[Tuple[Optional[int], List[int]]] = None
+        # The last optimal schedule as groups of Person objects, and what is
+        # known about it after the edits since: (previous_total, all_went_up);
+        # None if there was no optimum to compare against.
+        self._schedule: Optional[List[Tuple[Person, ...]]] = None
+        self._edit: Optional[Tuple[int, bool]] = None
+        self._last_strategy: Optional[str] = None
+
+    def get_persons(self) -> List[Person]:
+        return self._persons.copy()
+
+    def get_last_strategy(self) -> Optional[str]:
+        """
+        Return how the last `solve` was answered.
+
+        One of "reuse" (roster unchanged), "memo", "incumbent" (the previous
+        schedule is still optimal), "greedy" or "search"; None before the
+        first solve.
+        """
+        return self._last_strategy
+
+    def set_max_time(self, max_time: int) -> None:
+        """Change the bridge's time limit; the cached optimum stays valid."""
+        bridge = Bridge(self._bridge.get_capacity(), max_time)
+        if not self._bridge.is_passable():
+            bridge.destroy()
+        self._bridge = bridge
+
+    def set_crossing_time(self, person: Person, crossing_time: int) -> Person:
+        """
+        Change one person's crossing time.
+
+        People are immutable, so `person` is replaced in the roster by a new
+        Person with the same name, which is returned.
+
+        Args:
+            person (Person): A member of the current roster
+            crossing_time (int): The new crossing time
+
+        Returns:
+            Person: The replacement
+        """
+        for index, member in enumerate(self._persons):
+            if member is person:
+                break
+        else:
+            raise ValueError(f"{person} is not in this solver's roster")
+
+        replacement = Person(person.get_name(), crossing_time)
+        self._persons[index] = replacement
+        self._space = StateSpace(self._persons, self._bridge.get_capacity(), self._prune)
+        went_up = crossing_time >= person.get_crossing_time()
+        if self._optimum is not None:
+            self._edit = (self._optimum[0], went_up) if self._optimum[0] is not None else None
+        elif self._edit is not None:
+            # Several edits since the last solve: the old schedule can only be
+            # trusted unchanged if every one of them was an increase.
+            self._edit = self._edit[0], self._edit[1] and went_up
+        if self._schedule is not None:
+            self._schedule = [tuple(replacement if p is person else p for p in group) for group in self._schedule]
+        self._optimum = None
+        return replacement
+
+    def _search(self):
+        nodes_expanded = 0
+        if self._optimum is None:
+            self._optimum, nodes_expanded = self._resolve()
+        else:
+            self._last_strategy = "reuse"
+
+        total_time, groups = self._optimum
+        if total_time is None or total_time > self._bridge.get_max_time():
+            return None, None, nodes_expanded
+        return groups, total_time, nodes_expanded
+
+    def _resolve(self) -> Tuple[Tuple[Optional[int], List[int]], int]:
+        """Work out the unlimited optimum of the current roster; returns it and the nodes expanded."""
+        space = self._space
+        key = tuple(space.get_times())
+        edit, self._edit = self._edit, None
+        nodes_expanded = 0
+
+        optimum = self._memo.get(key)
+        if optimum is not None:
+            self._memo.move_to_end(key)
+            self._last_strategy = "memo"
+        else:
+            ranks = {id(p): rank for rank, p in enumerate(space.get_persons())}
+            upper_bound = None
+            if edit is not None and self._schedule is not None:
+                upper_bound = sum(max(p.get_crossing_time() for p in group) for group in self._schedule)
+                previous_total, went_up = edit
+                if (went_up and upper_bound == previous_total) or upper_bound == space.lower_bound(0):
+                    optimum = upper_bound, [sum(1 << ranks[id(p)] for p in group) for group in self._schedule]
+                    self._last_strategy = "incumbent"
+
+            if optimum is None and space.get_capacity() == 2:
+                moves = GreedySolver(Bridge(2, 2 * sum(key) + 1), self._persons).solve().get_moves()
+                groups = [sum(1 << ranks[id(p)] for p in move.get_crossing_persons()) for move in moves]
+                optimum = sum(map(space.group_time, groups)), groups
+                self._last_strategy = "greedy"
+            elif optimum is None:
+                # The re-priced schedule is still a valid one, so nothing
+                # slower than it needs to be searched.
+                time_limit = upper_bound if upper_bound is not None else float("inf")
+                groups, total_time, nodes_expanded = astar_search(space, 0, 0, time_limit, space.lower_bound,
+                                                                  TranspositionTable(), stats=self._stats)
+                optimum = total_time, groups or []
+                self._last_strategy = "search"
+
+            self._memo[key] = optimum
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+
+        self._schedule = [tuple(space.persons_of(group)) for group in optimum[1]] if optimum[0] is not None else None
+        return optimum, nodes_expanded
@@ -0,0 +1,98 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+from models import Bridge, Flashlight, Person
+from .astar import astar_search
+from .base import Solver
+from .greedy import optimal_total_time
+from .state_space import StateSpace
+from .stats import SearchStats
+from .transposition import TranspositionTable
+
+# Per-process state, set once by `_init_worker`.
+_worker_space: Optional[StateSpace] = None
+_worker_limit = None
+
+
+def _init_worker(persons: List[Person], capacity: int, prune: bool, shared_limit) -> None:
+    global _worker_space, _worker_limit
+    _worker_space = StateSpace(persons, capacity, prune)
+    _worker_limit = shared_limit
+
+
+def _solve_branch(first_group: int, state: int, elapsed: int) -> Tuple[Optional[List[int]], Optional[int], int]:
+    """A* below one root move, publishing any faster schedule to the shared limit."""
+    space = _worker_space
+    groups, total_time, nodes_expanded = astar_search(
+        space, state, elapsed, _worker_limit.value, space.lower_bound, TranspositionTable(), _worker_limit)
+    if groups is None:
+        return None, None, nodes_expanded
+    with _worker_limit.get_lock():
+        # Other branches now only need to look for strictly faster schedules.
+        if total_time - 1 < _worker_limit.value:
+            _worker_limit.value = total_time - 1
+    return [first_group] + groups, total_time, nodes_expanded
+
+
+class ParallelSolver(Solver):
+    """
+    Optimal solver: A* split across processes at the root's moves.
+
+    Each move from the starting position becomes one task on a
+    `ProcessPoolExecutor`; idle workers pick up the next branch, which
+    balances uneven subtrees. Workers share the best time found so far
+    through a `multiprocessing.Value`: once any branch finishes in T
+    minutes, every other branch only searches for schedules faster than T.
+    For capacity 2 the closed-form optimum seeds that limit from the start.
+    The fastest schedule across branches is returned, so the optimal time
+    always matches the serial solvers. Which of several equally fast
+    schedules that is depends on the order branches finish in: once one
+    branch has found T minutes, the others only look for faster ones.
+    """
+
+    name = "parallel"
+
+    def __init__(self, bridge: Bridge, persons: Sequence[Person], flashlight: Optional[Flashlight] = None,
+                 workers: Optional[int] = None, prune: bool = True, stats: Optional[SearchStats] = None):
+        """
+        Initialize the solver.
+
+        Args:
+            bridge (Bridge): The bridge (capacity and time limit)
+            persons (Sequence[Person]): All people, everyone starting on the left
+            flashlight (Optional[Flashlight]): The flashlight; only used by `verify`
+            workers (Optional[int]): Number of worker processes; defaults to the CPU count
+            prune (bool): Skip dominated moves (see `StateSpace.successors`)
+            stats (Optional[SearchStats]): Collects phase timings; the search counters stay in the workers
+        """
+        super().__init__(bridge, persons, flashlight, prune, stats)
+        self._workers = workers or multiprocessing.cpu_count()
+        self._prune = prune
+
+    def get_workers(self) -> int:
+        return self._workers
+
+    def _search(self):
+        space = self._space
+        start = space.get_start_state()
+        if start == space.get_goal_state():
+            return [], 0, 0
+
+        limit = self._bridge.get_max_time()
+        if space.get_capacity() == 2:
+            limit = min(limit, optimal_total_time(space.get_times()))
+        shared_limit = multiprocessing.Value("q", limit)
+
+        branches = [(group, state, cost) for group, state, cost in space.successors(start)
+                    if cost + space.lower_bound(state) <= limit]
+        best_groups, best_time, nodes_expanded = None, None, 1
+        with ProcessPoolExecutor(self._workers, initializer=_init_worker,
+                                 initargs=(space.get_persons(), space.get_capacity(), self._prune,
+                                           shared_limit)) as pool:
+            futures = [pool.submit(_solve_branch, *branch) for branch in branches]
+            for future in futures:
+                groups, total_time, branch_nodes = future.result()
+                nodes_expanded += branch_nodes
+                if groups is not None and (best_time is None or total_time < best_time):
+                    best_groups, best_time = groups, total_time
+        return best_groups, best_time, nodes_expanded
@@ -0,0 +1,207 @@
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import os
+from typing import Callable, List, Optional, Sequence
+import numpy as np
+from models import Person
+from .count_space import CountStateSpace
+from .state_space import StateSpace
+
+# Table entry of an abstract state from which the goal cannot be reached.
+UNREACHABLE = np.iinfo(np.uint32).max
+
+
+def keep_slowest(times: Sequence[int], k: int) -> List[int]:
+    """Abstraction keeping the `k` slowest times and lowering everyone else to the fastest time."""
+    ordered = sorted(times)
+    cut = max(0, len(ordered) - k)
+    return [ordered[0]] * cut + ordered[cut:] if ordered else []
+
+
+def bucket_floors(times: Sequence[int], edges: Sequence[int]) -> List[int]:
+    """Abstraction lowering every time to the largest of `edges` not above it (times below every edge stay)."""
+    edges = sorted(edges)
+    floors = []
+    for t in sorted(times):
+        i = bisect.bisect_right(edges, t)
+        floors.append(edges[i - 1] if i else t)
+    return floors
+
+
+def family_floor(rosters: Sequence[Sequence[int]]) -> List[int]:
+    """Rank-by-rank minimum of several rosters' sorted times; a database for it covers all of them."""
+    if len({len(roster) for roster in rosters}) != 1:
+        raise ValueError("rosters of a family must all have the same size")
+    return [min(column) for column in zip(*(sorted(roster) for roster in rosters))]
+
+
+class PatternDatabase:
+    """
+    Exact costs-to-go of an abstracted roster, used as an A* heuristic.
+
+    The abstraction lowers crossing times, rank by rank: `keep_slowest`
+    keeps the k slowest and sets the rest to the fastest time, `bucket_floors`
+    rounds every time down to a bucket edge. Lowering times never makes a
+    schedule slower, so the abstract optimum from the matching position is an
+    admissible (and consistent) bound for every roster whose sorted times are
+    at least the abstract ones: one database serves a whole family of rosters
+    (see `covers` and `family_floor`) and every time limit.
+
+    The lowered roster has few distinct times, so its positions are the
+    counts of `CountStateSpace`; the table holds the cost-to-go of each, found
+    by one Dijkstra from the goal over the unpruned space (where every move
+    can be undone at the same cost). It is a flat uint32 NumPy array indexed
+    by the `CountStateSpace` state, saved with `save` and memory-mapped by
+    `load`, so a large table costs nothing until it is read.
+
+    Databases are combined by taking the maximum, never by adding them: a
+    single trip carries people from every part of a split roster and pays only
+    for its slowest member, and the returns are shared by everyone, so the
+    costs of disjoint sub-rosters do not add up to a lower bound.
+    """
+
+    def __init__(self, times: Sequence[int], capacity: int, table: np.ndarray):
+        """
+        Wrap a built table; use `build` or `load` to get one.
+
+        Args:
+            times (Sequence[int]): The abstract crossing times, one per rank
+            capacity (int): Bridge capacity the table was built for
+            table (np.ndarray): Cost-to-go per `CountStateSpace` state
+        """
+        self._times = sorted(times)
+        self._capacity = capacity
+        self._space = CountStateSpace([Person(f"A{i}", t) for i, t in enumerate(self._times)], capacity,
+                                      prune=False)
+        if len(table) != self._space.get_num_states():
+            raise ValueError(f"table has {len(table)} entries, expected {self._space.get_num_states()}")
+        self._table = table
+
+    @classmethod
+    def build(cls, times: Sequence[int], capacity: int, max_states: int = 4_000_000) -> "PatternDatabase":
+        """
+        Solve the abstract roster from every position.
+
+        Args:
+            times (Sequence[int]): The abstract crossing times, e.g. from `keep_slowest`
+            capacity (int): Bridge capacity
+            max_states (int): Refuse abstractions with more positions than this
+
+        Returns:
+            PatternDatabase: The database
+        """
+        persons = [Person(f"A{i}", t) for i, t in enumerate(sorted(times))]
+        space = CountStateSpace(persons, capacity, prune=False)
+        num_states = space.get_num_states()
+        if num_states > max_states:
+            raise ValueError(f"abstraction has {num_states:,} states, more than max_states={max_states:,}; "
+                             "keep fewer times exact or use coarser buckets")
+
+        distance = [UNREACHABLE] * num_states
+        goal = space.get_goal_state()
+        distance[goal] = 0
+        frontier = [(0, goal)]
+        while frontier:
+            cost, state = heapq.heappop(frontier)
+            if cost > distance[state]:
+                continue
+            for _, previous, step in space.predecessors(state):
+                if cost + step < distance[previous]:
+                    distance[previous] = cost + step
+                    heapq.heappush(frontier, (cost + step, previous))
+        return cls(times, capacity, np.array(distance, dtype=np.uint32))
+
+    @classmethod
+    def load(cls, path: str) -> "PatternDatabase":
+        """Open a database written by `save`; the table is memory-mapped read-only."""
+        with open(path + ".json", encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        return cls(meta["times"], meta["capacity"], np.load(path, mmap_mode="r"))
+
+    @classmethod
+    def load_or_build(cls, directory: str, times: Sequence[int], capacity: int, **kwargs) -> "PatternDatabase":
+        """
+        Return the database for these abstract times, building and saving it on the first call.
+
+        Files are named after the capacity and a hash of the sorted times, so
+        every instance of a family shares one database in `directory`.
+        Keyword arguments go to `build`.
+        """
+        key = f"{capacity}:" + ",".join(str(t) for t in sorted(times))
+        path = os.path.join(directory, f"pdb-{hashlib.sha1(key.encode()).hexdigest()[:16]}.npy")
+        if os.path.exists(path) and os.path.exists(path + ".json"):
+            return cls.load(path)
+        database = cls.build(times, capacity, **kwargs)
+        os.makedirs(directory, exist_ok=True)
+        database.save(path)
+        return database
+
+    def save(self, path: str) -> None:
+        """Write the table as a .npy file at `path` and its description next to it as `path + ".json"`."""
+        with open(path, "wb") as table_file:
+            np.save(table_file, np.asarray(self._table))
+        with open(path + ".json", "w", encoding="utf-8") as meta_file:
+            json.dump({"capacity": self._capacity, "times": self._times}, meta_file)
+
+    def get_times(self) -> List[int]:
+        return self._times.copy()
+
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    def get_num_states(self) -> int:
+        return len(self._table)
+
+    def get_nbytes(self) -> int:
+        return self._table.nbytes
+
+    def covers(self, times: Sequence[int], capacity: Optional[int] = None) -> bool:
+        """Whether the table is a lower bound for this roster: same size, every rank at least as slow."""
+        if capacity is not None and capacity > self._capacity:
+            return False
+        ordered = sorted(times)
+        return len(ordered) == len(self._times) and all(t >= a for t, a in zip(ordered, self._times))
+
+    def heuristic(self, space: StateSpace) -> Callable[[int], float]:
+        """
+        Return a lower bound on `space`'s states for `astar_search`.
+
+        The person of rank ``i`` stands for the abstract person of rank ``i``,
+        so a state maps to the abstract counts by summing a digit weight per
+        person on the right, eight ranks at a time through per-byte tables.
+        Unreachable positions give infinity, which A* prunes.
+        """
+        if isinstance(space, CountStateSpace):
+            raise TypeError("pattern databases index people by rank; use a plain StateSpace")
+        if not self.covers(space.get_times(), space.get_capacity()):
+            raise ValueError("this pattern database does not cover the roster (see covers)")
+
+        distinct = self._space.get_distinct_times()
+        weights = [1] * len(distinct)
+        for i, count in enumerate(self._space.get_counts()[:-1]):
+            weights[i + 1] = weights[i] * (count + 1)
+        rank_weights = [weights[distinct.index(t)] for t in self._times]
+        byte_tables = []
+        for start in range(0, len(rank_weights), 8):
+            chunk = rank_weights[start:start + 8]
+            byte_tables.append([sum(w for bit, w in enumerate(chunk) if value >> bit & 1) for value in range(256)])
+        table = self._table
+
+        def lower_bound(state: int) -> float:
+            right = state >> 1
+            packed = 0
+            for byte_table in byte_tables:
+                if not right:
+                    break
+                packed += byte_table[right & 255]
+                right >>= 8
+            cost = int(table[packed << 1 | state & 1])
+            return math.inf if cost == UNREACHABLE else cost
+
+        return lower_bound
+
+    def __repr__(self) -> str:
+        return f"PatternDatabase(capacity={self._capacity}, times={self._times}, states={len(self._table):,})"
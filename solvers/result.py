@@ -0,0 +1,63 @@
+from typing import List, Optional
+from models import GameState, Move
+
+
+class SolverResult:
+    """Outcome of a solver run: the schedule found plus search statistics."""
+
+    def __init__(self, solver_name: str, moves: Optional[List[Move]], total_time: Optional[int],
+                 nodes_expanded: int, wall_time: float):
+        """
+        Initialize the result.
+
+        Args:
+            solver_name (str): Name of the solver that produced this result
+            moves (Optional[List[Move]]): The schedule, or None if no schedule fits the time limit
+            total_time (Optional[int]): Total crossing time of the schedule, or None
+            nodes_expanded (int): Number of states the solver expanded
+            wall_time (float): Wall-clock seconds spent solving
+        """
+        self._solver_name = solver_name
+        self._moves = moves
+        self._total_time = total_time
+        self._nodes_expanded = nodes_expanded
+        self._wall_time = wall_time
+
+    def get_solver_name(self) -> str:
+        return self._solver_name
+
+    def get_moves(self) -> Optional[List[Move]]:
+        return None if self._moves is None else self._moves.copy()
+
+    def get_total_time(self) -> Optional[int]:
+        return self._total_time
+
+    def get_nodes_expanded(self) -> int:
+        return self._nodes_expanded
+
+    def get_wall_time(self) -> float:
+        return self._wall_time
+
+    def is_solved(self) -> bool:
+        return self._moves is not None
+
+    def replay(self, game_state: GameState) -> bool:
+        """Play the schedule on `game_state` with `make_move`; True if every move is accepted and the game is won."""
+        if self._moves is None:
+            return False
+        for move in self._moves:
+            if not game_state.make_move(move):
+                return False
+        return game_state.is_game_won()
+
+    def __str__(self) -> str:
+        outcome = f"{self._total_time} min in {len(self._moves)} moves" if self.is_solved() else "no solution"
+        return (f"{self._solver_name}: {outcome} | nodes expanded: {self._nodes_expanded} | "
+                f"wall time: {self._wall_time * 1000:.2f} ms")
+
+    def __repr__(self) -> str:
+        return (
+            f"SolverResult(solver='{self._solver_name}', total_time={self._total_time}, "
+            f"moves={None if self._moves is None else len(self._moves)}, "
+            f"nodes_expanded={self._nodes_expanded}, wall_time={self._wall_time:.6f})"
+        )
@@ -0,0 +1,258 @@
+"""
+Batch solving service: solve puzzle instances streamed as JSON lines.
+
+Each input line is one instance::
+
+    {"id": "a1", "people": [{"name": "You", "time": 1}, ...], "capacity": 2, "max_time": 17}
+
+(``"times": [1, 2, 5, 10]`` may be given instead of ``"people"``; capacity
+and max_time default to the `Bridge` defaults). Each output line, in input
+order, is::
+
+    {"id": "a1", "solved": true, "total_time": 17, "moves": [{"people": [...], "direction": "left_to_right"}, ...],
+     "cached": false}
+
+or ``{"id": ..., "error": "..."}`` for a line that could not be read or
+solved; the rest of the batch carries on.
+
+Usage: python -m solvers [input.jsonl] [-o output.jsonl] [--workers N] [--cache-size N] [--disk-cache PATH]
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+from models import Bridge, Person
+from .api import solve
+from .cache import SolutionCache
+
+# A canonical instance: sorted crossing times, capacity and time limit.
+InstanceKey = Tuple[Tuple[int, ...], int, int]
+# A solved canonical instance: total time (None if unsolvable) and the
+# schedule as groups of indices into the sorted times.
+CanonicalSolution = Tuple[Optional[int], List[List[int]]]
+
+
+def parse_instance(record: dict) -> Tuple[List[Person], Bridge]:
+    """Build the people and bridge described by one input record; raises ValueError if it is not a valid puzzle."""
+    if "people" in record:
+        persons = [Person(str(p["name"]), int(p["time"])) for p in record["people"]]
+    elif "times" in record:
+        persons = [Person(f"P{i + 1}", int(t)) for i, t in enumerate(record["times"])]
+    else:
+        raise ValueError("instance needs 'people' or 'times'")
+    capacity, max_time = int(record.get("capacity", 2)), int(record.get("max_time", 17))
+    if capacity < 1:
+        raise ValueError("capacity must be at least 1")
+    if max_time < 0:
+        raise ValueError("max_time must not be negative")
+    if any(p.get_crossing_time() < 1 for p in persons):
+        raise ValueError("crossing times must be at least 1")
+    return persons, Bridge(capacity=capacity, max_time=max_time)
+
+
+def canonical_key(persons: List[Person], bridge: Bridge) -> InstanceKey:
+    return (tuple(sorted(p.get_crossing_time() for p in persons)),
+            bridge.get_capacity(), bridge.get_max_time())
+
+
+def solve_canonical(key: InstanceKey) -> CanonicalSolution:
+    """Solve a canonical instance; people are stood in for by their index in the sorted times."""
+    times, capacity, max_time = key
+    stand_ins = [Person(str(i), t) for i, t in enumerate(times)]
+    result = solve(Bridge(capacity=capacity, max_time=max_time), stand_ins)
+    if not result.is_solved():
+        return None, []
+    return result.get_total_time(), [[int(p.get_name()) for p in move.get_crossing_persons()]
+                                     for move in result.get_moves()]
+
+
+def format_result(record: dict, persons: List[Person], solution: CanonicalSolution, cached: bool) -> dict:
+    """Map a canonical solution back onto this instance's people."""
+    total_time, groups = solution
+    ranked = sorted(persons, key=lambda p: p.get_crossing_time())
+    moves = [{"people": [ranked[i].get_name() for i in group],
+              "direction": "left_to_right" if step % 2 == 0 else "right_to_left"}
+             for step, group in enumerate(groups)]
+    return {"id": record.get("id"), "solved": total_time is not None, "total_time": total_time,
+            "moves": moves, "cached": cached}
+
+
+class BatchSolver:
+    """
+    Solves a stream of instances with a worker pool and a result cache.
+
+    At most `max_pending` instances are in flight at once, so memory stays
+    bounded however long the input is, and results come out in input order.
+    Instances with the same canonical key (sorted times, capacity, time
+    limit) are solved once: repeats are served from a bounded LRU cache, or
+    wait on the same pending task if it is still running. With a
+    `SolutionCache`, misses are looked up on disk before being solved, and
+    newly solved instances are written back.
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache_size: int = 10000, max_pending: Optional[int] = None,
+                 disk_cache: Optional[SolutionCache] = None):
+        """
+        Initialize the batch solver.
+
+        Args:
+            workers (Optional[int]): Worker processes; None for the CPU count, 0 to solve in-process
+            cache_size (int): Maximum number of canonical solutions kept
+            max_pending (Optional[int]): Maximum instances in flight; defaults to 4 per worker
+            disk_cache (Optional[SolutionCache]): Persistent cache consulted on a miss
+        """
+        self._workers = multiprocessing.cpu_count() if workers is None else workers
+        self._cache_size = cache_size
+        self._max_pending = max_pending or 4 * max(1, self._workers)
+        self._cache: "OrderedDict[InstanceKey, CanonicalSolution]" = OrderedDict()
+        self._disk_cache = disk_cache
+        self._hits = 0
+        self._misses = 0
+
+    def get_cache_hits(self) -> int:
+        return self._hits
+
+    def get_cache_misses(self) -> int:
+        return self._misses
+
+    def solve_all(self, records: Iterable[dict]) -> Iterator[dict]:
+        """Yield one result dict per input record, in input order."""
+        pool = ProcessPoolExecutor(self._workers) if self._workers > 0 else None
+        pending = deque()
+        in_flight = {}
+        try:
+            for record in records:
+                pending.append(self._submit(record, pool, in_flight))
+                while len(pending) >= self._max_pending:
+                    yield self._finish(pending.popleft(), in_flight)
+            while pending:
+                yield self._finish(pending.popleft(), in_flight)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _submit(self, record, pool: Optional[ProcessPoolExecutor], in_flight: dict) -> tuple:
+        """Start (or look up) the solution for one record; returns `(record, persons, key, outcome, cached)`."""
+        if isinstance(record, json.JSONDecodeError):
+            return None, None, None, f"unreadable line: {record}", False
+        if not isinstance(record, dict):
+            return record, None, None, "invalid instance: expected a JSON object", False
+        try:
+            persons, bridge = parse_instance(record)
+        except (KeyError, TypeError, ValueError) as error:
+            return record, None, None, f"invalid instance: {error}", False
+
+        key = canonical_key(persons, bridge)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return record, persons, key, self._cache[key], True
+        if key in in_flight:
+            self._hits += 1
+            in_flight[key][1] += 1
+            return record, persons, key, in_flight[key][0], True
+
+        if self._disk_cache is not None:
+            times, capacity, max_time = key
+            stored = self._disk_cache.lookup(times, capacity)
+            if stored is not None:
+                self._hits += 1
+                total_time, groups = stored
+                solution = (total_time, groups) if total_time is not None and total_time <= max_time else (None, [])
+                self._remember(key, solution)
+                return record, persons, key, solution, True
+
+        self._misses += 1
+        if pool is None:
+            future = Future()
+            try:
+                future.set_result(solve_canonical(key))
+            except Exception as error:
+                future.set_exception(error)
+        else:
+            future = pool.submit(solve_canonical, key)
+        in_flight[key] = [future, 1]
+        return record, persons, key, future, False
+
+    def _finish(self, entry: tuple, in_flight: dict) -> dict:
+        record, persons, key, outcome, cached = entry
+        if isinstance(outcome, Future):
+            future = outcome
+            try:
+                outcome = future.result()
+            except Exception as error:
+                # One failing task yields an error record; the batch carries on.
+                outcome = f"solver failed: {error!r}"
+            else:
+                if key not in self._cache:
+                    self._remember(key, outcome)
+                    # A schedule found within the limit is the true optimum, so it
+                    # can be shared with any limit; "unsolvable within this limit"
+                    # cannot.
+                    if self._disk_cache is not None and outcome[0] is not None:
+                        self._disk_cache.store(key[0], key[1], outcome)
+            # Several records may be waiting on the same task; forget it after the last.
+            in_flight[key][1] -= 1
+            if not in_flight[key][1]:
+                del in_flight[key]
+        if isinstance(outcome, str):
+            return {"id": record.get("id") if isinstance(record, dict) else None, "error": outcome}
+        return format_result(record, persons, outcome, cached)
+
+    def _remember(self, key: InstanceKey, solution: CanonicalSolution) -> None:
+        self._cache[key] = solution
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+
+def read_records(stream: IO[str]) -> Iterator:
+    """Yield one parsed record per non-blank line; an unreadable line yields its JSONDecodeError."""
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as error:
+            yield error
+
+
+def run(input_stream: IO[str], output_stream: IO[str], workers: Optional[int] = None,
+        cache_size: int = 10000, disk_cache: Optional[SolutionCache] = None) -> BatchSolver:
+    """Solve every instance on `input_stream`, writing one JSON result line each to `output_stream`."""
+    batch = BatchSolver(workers=workers, cache_size=cache_size, disk_cache=disk_cache)
+    for result in batch.solve_all(read_records(input_stream)):
+        output_stream.write(json.dumps(result) + "\n")
+    return batch
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Solve bridge puzzle instances from a JSONL file or stdin.")
+    parser.add_argument("input", nargs="?", help="input JSONL file (default: stdin)")
+    parser.add_argument("-o", "--output", help="output JSONL file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0 solves in-process)")
+    parser.add_argument("--cache-size", type=int, default=10000, help="canonical solutions kept in memory")
+    parser.add_argument("--disk-cache", help="SQLite file of solutions kept across runs")
+    args = parser.parse_args(argv)
+
+    input_stream = open(args.input, encoding="utf-8") if args.input else sys.stdin
+    output_stream = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    disk_cache = SolutionCache(args.disk_cache) if args.disk_cache else None
+    try:
+        batch = run(input_stream, output_stream, args.workers, args.cache_size, disk_cache)
+    finally:
+        if disk_cache is not None:
+            disk_cache.close()
+        if args.input:
+            input_stream.close()
+        if args.output:
+            output_stream.close()
+    print(f"solved {batch.get_cache_misses()} distinct instances, {batch.get_cache_hits()} repeats served from cache",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+from itertools import combinations
+from math import comb
+from typing import Iterator, List, Sequence, Tuple
+from models import Move, Person
+
+
+class StateSpace:
+    """
+    Compact search space for the bridge puzzle.
+
+    People are re-indexed in ascending crossing-time order ("rank"), so a
+    group's crossing time is simply the time of its highest set bit. A state
+    is a single int: ``right_mask << 1 | flashlight_on_right``.
+    """
+
+    def __init__(self, persons: Sequence[Person], capacity: int, prune: bool = True):
+        """
+        Build the space for a roster.
+
+        Args:
+            persons (Sequence[Person]): All people in the game, in any order
+            capacity (int): Maximum number of people per crossing
+            prune (bool): Skip moves that are dominated (see `successors`)
+        """
+        self._persons = sorted(persons, key=lambda p: p.get_crossing_time())
+        self._times = [p.get_crossing_time() for p in self._persons]
+        self._capacity = capacity
+        self._prune = prune
+        self._num_persons = len(self._persons)
+        self._full_mask = (1 << self._num_persons) - 1
+
+    def get_persons(self) -> List[Person]:
+        """Return the people in rank (ascending crossing time) order."""
+        return self._persons.copy()
+
+    def get_times(self) -> List[int]:
+        return self._times.copy()
+
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    def get_num_persons(self) -> int:
+        return self._num_persons
+
+    def get_full_mask(self) -> int:
+        return self._full_mask
+
+    def get_start_state(self) -> int:
+        return 0
+
+    def get_goal_state(self) -> int:
+        # With nobody to carry it, the flashlight never leaves the left side.
+        return self._full_mask << 1 | 1 if self._num_persons else 0
+
+    def persons_of(self, group: int) -> List[Person]:
+        """Return the members of a group mask, fastest first."""
+        members = []
+        while group:
+            low = group & -group
+            members.append(self._persons[low.bit_length() - 1])
+            group ^= low
+        return members
+
+    def group_time(self, group: int) -> int:
+        """Crossing time of a group mask: the time of its slowest (highest-rank) member."""
+        return self._times[group.bit_length() - 1] if group else 0
+
+    def successors(self, state: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield `(group_mask, next_state, cost)` for the moves from `state`.
+
+        With pruning on, only moves that some optimal schedule uses are kept:
+
+        * returns carry a single person; anyone else returning could just as
+          well have stayed, which can only make later forward trips cheaper;
+        * forward trips carry at least two people while two are available;
+        * when everyone left fits on the bridge, they all cross at once, which
+          costs exactly the lower bound of the slowest of them having to cross.
+
+        For capacity 2 this is the classic "pairs forward, singles back" rule.
+        Forward trips are not restricted to full groups for larger capacities:
+        with times 2, 4, 27, 40, 89 and capacity 3, the only 103-minute
+        schedule opens with a pair.
+        """
+        right = state >> 1
+        on_right = state & 1
+        side = right if on_right else self._full_mask & ~right
+        bits = [1 << i for i in range(self._num_persons) if side >> i & 1]
+        times = self._times
+        for size in self._group_sizes(on_right, len(bits)):
+            for members in combinations(bits, size):
+                group = sum(members)
+                yield group, (right ^ group) << 1 | (on_right ^ 1), times[members[-1].bit_length() - 1]
+
+    def count_dominated(self, state: int) -> int:
+        """Return how many moves from `state` pruning leaves out of `successors`."""
+        if not self._prune:
+            return 0
+        right = state >> 1
+        on_right = state & 1
+        side_size = bin(right if on_right else self._full_mask & ~right).count("1")
+        every_size = range(1, min(self._capacity, side_size) + 1)
+        kept_sizes = self._group_sizes(on_right, side_size)
+        return sum(comb(side_size, size) for size in every_size if size not in kept_sizes)
+
+    def _group_sizes(self, on_right: int, side_size: int) -> range:
+        """Sizes of the groups `successors` tries from a flashlight side of `side_size` people."""
+        smallest, largest = 1, min(self._capacity, side_size)
+        if self._prune and side_size:
+            if on_right:
+                largest = 1
+            elif side_size <= self._capacity:
+                smallest = largest
+            else:
+                smallest = 2
+        return range(smallest, largest + 1)
+
+    def predecessors(self, state: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield `(group_mask, previous_state, cost)` for the moves into `state`.
+
+        The exact reverse of `successors`, pruning included: the group that
+        just crossed is on the flashlight's side of `state`. Without pruning
+        every move can be undone at the same cost, so these are simply the
+        successors.
+        """
+        if not self._prune:
+            yield from self.successors(state)
+            return
+
+        right = state >> 1
+        on_right = state & 1
+        side = right if on_right else self._full_mask & ~right
+        bits = [1 << i for i in range(self._num_persons) if side >> i & 1]
+        times = self._times
+        if on_right:
+            # A forward trip: everyone left before it crossed if they fitted,
+            # otherwise it carried between two and `capacity` of them.
+            num_left = self._num_persons - len(bits)
+            smallest = 1 if num_left == 0 else max(2, self._capacity + 1 - num_left)
+            sizes = range(smallest, min(self._capacity, len(bits)) + 1)
+        else:
+            sizes = range(1, min(1, len(bits)) + 1)
+        for size in sizes:
+            for members in combinations(bits, size):
+                group = sum(members)
+                yield group, (right ^ group) << 1 | (on_right ^ 1), times[members[-1].bit_length() - 1]
+
+    def lower_bound(self, state: int) -> int:
+        """
+        Admissible estimate of the time still needed to reach the goal.
+
+        Every person on the left must cross forward; grouping them slowest-first
+        in chunks of `capacity` gives the cheapest possible sum of forward trips.
+        Each forward trip but the last is followed by a return costing at least
+        the fastest person's time, and if the flashlight is on the right someone
+        there has to bring it back first.
+        """
+        right = state >> 1
+        left = self._full_mask & ~right
+        if not left:
+            return 0
+
+        times = self._times
+        capacity = self._capacity
+        bound = 0
+        if state & 1:
+            bound += times[(right & -right).bit_length() - 1]
+
+        num_left = 0
+        while left:
+            top = left.bit_length() - 1
+            if num_left % capacity == 0:
+                bound += times[top]
+            num_left += 1
+            left ^= 1 << top
+
+        if capacity > 1 and num_left > 1:
+            forward_trips = -(-(num_left - 1) // (capacity - 1))
+            bound += (forward_trips - 1) * times[0]
+        return bound
+
+    def to_moves(self, groups: Sequence[int]) -> List[Move]:
+        """Turn a sequence of group masks (alternating, starting forward) into Moves."""
+        moves = []
+        for step, group in enumerate(groups):
+            direction = "left_to_right" if step % 2 == 0 else "right_to_left"
+            move = Move(self.persons_of(group), direction)
+            move.set_time_taken(self.group_time(group))
+            moves.append(move)
+        return moves
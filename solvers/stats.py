@@ -0,0 +1,106 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+# Reasons a generated state can be discarded, as used by the solvers.
+PRUNE_REASONS = ("time_limit", "bound", "dominance", "transposition")
+
+
+class SearchStats:
+    """
+    Counters and timings collected by a solver while it searches.
+
+    Pass an instance as a solver's `stats` argument. Searches bind it to a
+    local and guard every hook with ``if stats is not None``, so leaving it
+    out costs one comparison per hook and nothing else.
+
+    Pruned states are counted by reason:
+
+    * ``time_limit``: the move would finish after the time limit;
+    * ``bound``: elapsed time plus the lower bound reaches the limit or the
+      incumbent;
+    * ``dominance``: the move was skipped by `StateSpace` pruning;
+    * ``transposition``: the state was already reached at least as fast.
+    """
+
+    def __init__(self):
+        self._generated = 0
+        self._expanded = 0
+        self._pruned: Dict[str, int] = dict.fromkeys(PRUNE_REASONS, 0)
+        self._peak_frontier = 0
+        self._peak_table = 0
+        self._phases: Dict[str, float] = {}
+
+    def on_generated(self, count: int = 1) -> None:
+        self._generated += count
+
+    def on_expanded(self) -> None:
+        self._expanded += 1
+
+    def on_pruned(self, reason: str, count: int = 1) -> None:
+        self._pruned[reason] = self._pruned.get(reason, 0) + count
+
+    def on_frontier(self, size: int) -> None:
+        if size > self._peak_frontier:
+            self._peak_frontier = size
+
+    def on_table(self, size: int) -> None:
+        if size > self._peak_table:
+            self._peak_table = size
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall time spent inside the block to the phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + time.perf_counter() - start
+
+    def get_generated(self) -> int:
+        return self._generated
+
+    def get_expanded(self) -> int:
+        return self._expanded
+
+    def get_pruned(self) -> Dict[str, int]:
+        return dict(self._pruned)
+
+    def get_peak_frontier(self) -> int:
+        return self._peak_frontier
+
+    def get_peak_table(self) -> int:
+        return self._peak_table
+
+    def get_phases(self) -> Dict[str, float]:
+        return dict(self._phases)
+
+    def get_nodes_per_second(self) -> float:
+        """Expanded states per second of the "search" phase (0.0 if it was not timed)."""
+        seconds = self._phases.get("search", 0.0)
+        return self._expanded / seconds if seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "generated": self._generated,
+            "expanded": self._expanded,
+            "pruned": dict(self._pruned),
+            "peak_frontier": self._peak_frontier,
+            "peak_table": self._peak_table,
+            "phases": dict(self._phases),
+            "nodes_per_second": self.get_nodes_per_second(),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Return `to_dict` as JSON; keyword arguments go to `json.dumps`."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __str__(self) -> str:
+        pruned = ", ".join(f"{reason} {count:,}" for reason, count in self._pruned.items())
+        return (f"generated {self._generated:,} | expanded {self._expanded:,} "
+                f"({self.get_nodes_per_second():,.0f}/s) | pruned: {pruned} | "
+                f"peak frontier {self._peak_frontier:,} | peak table {self._peak_table:,}")
+
+    def __repr__(self) -> str:
+        return f"SearchStats({self.to_dict()!r})"
@@ -0,0 +1,112 @@
+import heapq
+from collections import OrderedDict
+from itertools import count
+from typing import Hashable, Optional
+
+
+class TranspositionTable:
+    """
+    Best known arrival time for each position.
+
+    A position is who is on the right plus the flashlight side (the elapsed
+    time is deliberately not part of the key), so every move order reaching
+    the same position shares one entry. An arrival that is no faster than
+    the stored one is pruned.
+
+    With `max_entries` set the table is bounded: once full, storing a new
+    position evicts either the least recently used entry (``"lru"``) or the
+    shallowest one (``"depth"``). Best-first search settles positions near
+    the root first and only reaches them again along slower paths, while the
+    deep entries are the ones deduplicating the live frontier. An evicted
+    position is simply searched again if it is reached later.
+    """
+
+    EVICTION_POLICIES = ("lru", "depth")
+
+    def __init__(self, max_entries: Optional[int] = None, eviction: str = "lru"):
+        """
+        Initialize the table.
+
+        Args:
+            max_entries (Optional[int]): Maximum number of positions kept; None for unbounded
+            eviction (str): "lru" or "depth", used once the table is full
+        """
+        if eviction not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{eviction}', expected one of {self.EVICTION_POLICIES}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._eviction = eviction
+        self._entries = OrderedDict() if eviction == "lru" else {}
+        self._depth_heap = []
+        self._tiebreak = count()
+        self._evictions = 0
+
+    def get_max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    def get_evictions(self) -> int:
+        return self._evictions
+
+    def lookup(self, key: Hashable) -> Optional[int]:
+        """Return the best time stored for `key`, or None if it is not in the table."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._eviction == "lru":
+            self._entries.move_to_end(key)
+        return entry[0]
+
+    def store(self, key: Hashable, elapsed_time: int, depth: int = 0) -> None:
+        """Record `elapsed_time` (reached after `depth` moves) as the best time for `key`."""
+        is_new = key not in self._entries
+        self._entries[key] = (elapsed_time, depth)
+        if self._eviction == "lru":
+            self._entries.move_to_end(key)
+        elif self._max_entries is not None:
+            heapq.heappush(self._depth_heap, (depth, next(self._tiebreak), key))
+            if len(self._depth_heap) > 2 * self._max_entries:
+                self._rebuild_depth_heap()
+        if is_new and self._max_entries is not None and len(self._entries) > self._max_entries:
+            self._evict()
+
+    def offer(self, key: Hashable, elapsed_time: int, depth: int = 0) -> bool:
+        """Store the arrival and return True if it beats the stored time; otherwise return False (prune)."""
+        best = self.lookup(key)
+        if best is not None and elapsed_time >= best:
+            return False
+        self.store(key, elapsed_time, depth)
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._depth_heap = []
+
+    def _evict(self) -> None:
+        if self._eviction == "lru":
+            self._entries.popitem(last=False)
+        else:
+            # Heap entries go stale when a key is re-stored or evicted; skip those.
+            while True:
+                depth, _, key = heapq.heappop(self._depth_heap)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] == depth:
+                    del self._entries[key]
+                    break
+        self._evictions += 1
+
+    def _rebuild_depth_heap(self) -> None:
+        self._depth_heap = [(depth, next(self._tiebreak), key) for key, (_, depth) in self._entries.items()]
+        heapq.heapify(self._depth_heap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"TranspositionTable(entries={len(self._entries)}, max_entries={self._max_entries}, "
+            f"eviction='{self._eviction}', evictions={self._evictions})"
+        )
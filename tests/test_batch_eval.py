@@ -0,0 +1,60 @@
+import random
+import pytest
+from models import Bridge, Flashlight, GameState, Move, Person
+from solvers import DijkstraSolver
+
+np = pytest.importorskip("numpy")
+from solvers.batch_eval import BatchEvaluator  # noqa: E402  (needs NumPy)
+
+
+def replay(bridge, persons, schedule):
+    """Reference result of one schedule, move by move on a GameState."""
+    game_state = GameState(bridge, Flashlight(), persons)
+    for step, move in enumerate(schedule):
+        if not game_state.make_move(move):
+            return False, game_state.get_elapsed_time(), step
+    won = game_state.is_game_won()
+    return won, game_state.get_elapsed_time(), -1 if won else len(schedule)
+
+
+def random_schedule(rng, persons, capacity):
+    schedule = []
+    for step in range(rng.randint(0, 8)):
+        group = rng.sample(persons, rng.randint(1, min(len(persons), capacity + 1)))
+        forward = step % 2 == 0 if rng.random() < 0.9 else rng.random() < 0.5
+        schedule.append(Move(group, "left_to_right" if forward else "right_to_left"))
+    return schedule
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_matches_game_state_replay(seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 15)) for i in range(rng.randint(1, 12))]
+    bridge = Bridge(rng.randint(1, 3), rng.randint(5, 60))
+    schedules = [random_schedule(rng, persons, bridge.get_capacity()) for _ in range(60)]
+    optimal = DijkstraSolver(bridge, persons, prune=False).solve()
+    if optimal.is_solved():
+        schedules.append(list(optimal.get_moves()))
+
+    evaluator = BatchEvaluator(bridge, persons)
+    valid, total_time, first_failure = evaluator.evaluate(*evaluator.encode(schedules))
+    for row, schedule in enumerate(schedules):
+        assert (bool(valid[row]), int(total_time[row]), int(first_failure[row])) == replay(bridge, persons, schedule)
+    if optimal.is_solved():
+        assert valid[-1] and total_time[-1] == optimal.get_total_time()
+
+
+def test_zero_group_ends_a_schedule():
+    persons = [Person("A", 1), Person("B", 2)]
+    evaluator = BatchEvaluator(Bridge(2, 17), persons)
+    groups = np.array([[0b11, 0, 0b01], [0b01, 0b01, 0b11]])
+    directions = np.array([[1, 0, -1], [1, -1, 1]])
+    valid, total_time, first_failure = evaluator.evaluate(groups, directions)
+    assert valid.tolist() == [True, True]
+    assert total_time.tolist() == [2, 4]
+    assert first_failure.tolist() == [-1, -1]
+
+
+def test_rejects_rosters_too_large_for_int64_masks():
+    with pytest.raises(ValueError):
+        BatchEvaluator(Bridge(2, 17), [Person(f"P{i}", 1) for i in range(64)])
@@ -0,0 +1,34 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import BidirectionalSolver, DijkstraSolver, SearchStats
+
+
+@pytest.mark.parametrize("prune", [True, False])
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_unpruned_dijkstra(prune, seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 30)) for i in range(rng.randint(1, 7))]
+    bridge = Bridge(rng.randint(1, 4), rng.randint(0, 150))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve()
+    solver = BidirectionalSolver(bridge, persons, prune=prune)
+    result = solver.solve()
+    assert result.get_total_time() == expected.get_total_time()
+    if result.is_solved():
+        assert solver.verify(result)
+
+
+def test_time_limit_exactly_at_optimum():
+    persons = [Person("You", 1), Person("Lab Assistant", 2), Person("Worker", 5), Person("Scientist", 10)]
+    assert BidirectionalSolver(Bridge(2, 17), persons).solve().get_total_time() == 17
+    assert not BidirectionalSolver(Bridge(2, 16), persons).solve().is_solved()
+
+
+def test_settles_fewer_states_than_dijkstra():
+    rng = random.Random(7)
+    persons = [Person(f"P{i}", rng.randint(1, 100)) for i in range(12)]
+    bridge = Bridge(2, 10 ** 6)
+    forward, both = SearchStats(), SearchStats()
+    DijkstraSolver(bridge, persons, stats=forward).solve()
+    BidirectionalSolver(bridge, persons, stats=both).solve()
+    assert both.get_expanded() < forward.get_expanded()
@@ -0,0 +1,46 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import BranchAndBoundSolver, DijkstraSolver, SearchStats
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_unpruned_dijkstra(seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 30)) for i in range(rng.randint(1, 7))]
+    bridge = Bridge(rng.randint(1, 4), rng.randint(0, 150))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve()
+    solver = BranchAndBoundSolver(bridge, persons)
+    result = solver.solve()
+    assert solver.is_proven_optimal()
+    assert result.get_total_time() == expected.get_total_time()
+    if result.is_solved():
+        assert solver.verify(result)
+
+
+def test_incumbents_improve_and_end_at_the_optimum():
+    rng = random.Random(5)
+    persons = [Person(f"P{i}", rng.randint(1, 60)) for i in range(9)]
+    bridge = Bridge(3, 10 ** 6)
+    solver = BranchAndBoundSolver(bridge, persons)
+    times = [result.get_total_time() for result in solver.iter_incumbents()]
+    assert times == sorted(times, reverse=True) and len(set(times)) == len(times)
+    assert times[-1] == DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    assert solver.is_proven_optimal()
+
+
+def test_zero_budget_is_not_proven_optimal():
+    persons = [Person(f"P{i}", t) for i, t in enumerate(range(1, 15))]
+    solver = BranchAndBoundSolver(Bridge(3, 10 ** 6), persons)
+    result = solver.solve(time_budget=0)
+    assert not solver.is_proven_optimal()
+    if result.is_solved():
+        assert solver.verify(result)
+
+
+def test_solve_reports_every_node_expanded():
+    rng = random.Random(1)
+    persons = [Person(f"P{i}", rng.randint(1, 30)) for i in range(7)]
+    stats = SearchStats()
+    result = BranchAndBoundSolver(Bridge(3, 1000), persons, stats=stats).solve()
+    assert result.get_nodes_expanded() == stats.get_expanded() > 0
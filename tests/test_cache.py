@@ -0,0 +1,103 @@
+import random
+import pytest
+from models import Bridge, Flashlight, GameState, Person
+from solvers import DijkstraSolver, SolutionCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.sqlite"))
+    yield cache
+    cache.close()
+
+
+def replays_to_win(bridge, persons, result):
+    game_state = GameState(bridge, Flashlight(), persons)
+    return all(game_state.make_move(move) for move in result.get_moves()) and game_state.is_game_won()
+
+
+def test_matches_unpruned_dijkstra_on_misses_and_hits(cache):
+    rng = random.Random(3)
+    for _ in range(40):
+        times = [rng.randint(1, 12) for _ in range(rng.randint(1, 5))]
+        persons = [Person(f"{rng.choice('ABC')}{i}", t) for i, t in enumerate(times)]
+        rng.shuffle(persons)
+        bridge = Bridge(rng.randint(1, 3), rng.randint(0, 60))
+        expected = DijkstraSolver(bridge, persons, prune=False).solve()
+        result = cache.solve(bridge, persons)
+        assert result.get_total_time() == expected.get_total_time()
+        if result.is_solved():
+            assert replays_to_win(bridge, persons, result)
+
+
+def test_entries_are_shared_by_canonical_instance(cache):
+    first = [Person("You", 1), Person("Lab Assistant", 2), Person("Worker", 5), Person("Scientist", 10)]
+    assert cache.solve(Bridge(2, 17), first).get_solver_name() != "cache"
+    renamed = [Person("D", 10), Person("C", 5), Person("B", 2), Person("A", 1)]
+    result = cache.solve(Bridge(2, 16), renamed)
+    assert result.get_solver_name() == "cache" and not result.is_solved()
+    result = cache.solve(Bridge(2, 17), renamed)
+    assert result.get_total_time() == 17 and replays_to_win(Bridge(2, 17), renamed, result)
+
+
+def test_survives_reopening(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    persons = [Person("A", 3), Person("B", 8), Person("C", 9)]
+    first = SolutionCache(path)
+    first.solve(Bridge(2, 100), persons)
+    first.close()
+    reopened = SolutionCache(path)
+    try:
+        assert reopened.lookup([9, 3, 8], 2) is not None
+        assert reopened.solve(Bridge(2, 100), persons).get_solver_name() == "cache"
+    finally:
+        reopened.close()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.sqlite"), max_entries=2)
+    try:
+        cache.store([1], 2, (1, [[0]]))
+        cache.store([2], 2, (2, [[0]]))
+        cache.lookup([1], 2)
+        cache.store([3], 2, (3, [[0]]))
+        assert len(cache) == 2
+        assert cache.lookup([2], 2) is None
+        assert cache.lookup([1], 2) is not None
+    finally:
+        cache.close()
+
+
+def test_store_keeps_count_without_scanning(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.sqlite"), max_entries=2)
+    statements = []
+    try:
+        cache._connection.set_trace_callback(statements.append)
+        cache.store([1], 2, (1, [[0]]))
+        cache.store([1], 2, (1, [[0]]))
+        cache.store([2], 2, (2, [[0]]))
+        assert not any("COUNT" in statement.upper() for statement in statements)
+        cache._connection.set_trace_callback(None)
+        # Storing an instance again replaces it rather than adding an entry.
+        assert len(cache) == 2
+        assert cache.lookup([1], 2) is not None
+        cache.store([3], 2, (3, [[0]]))
+        assert len(cache) == 2
+        assert cache.lookup([2], 2) is None
+    finally:
+        cache.close()
+
+
+def test_count_is_read_back_on_reopening(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    first = SolutionCache(path)
+    for t in range(1, 4):
+        first.store([t], 2, (t, [[0]]))
+    first.close()
+    reopened = SolutionCache(path, max_entries=3)
+    try:
+        reopened.store([4], 2, (4, [[0]]))
+        assert len(reopened) == 3
+        assert reopened.lookup([1], 2) is None
+    finally:
+        reopened.close()
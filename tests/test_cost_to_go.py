@@ -0,0 +1,66 @@
+import random
+import pytest
+from models import Bridge, Flashlight, GameState, Person
+from solvers import CostToGoTable, DijkstraSolver
+
+
+def random_game(rng):
+    persons = [Person(f"P{i}", rng.randint(1, 20)) for i in range(rng.randint(1, 6))]
+    bridge = Bridge(rng.randint(1, 3), rng.randint(0, 120))
+    return bridge, persons
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_optimal_time_and_moves_match_unpruned_dijkstra(seed):
+    bridge, persons = random_game(random.Random(seed))
+    table = CostToGoTable(bridge, persons)
+    expected = DijkstraSolver(bridge, persons, prune=False).solve()
+    assert table.get_optimal_time() == expected.get_total_time()
+
+    game_state = GameState(bridge, Flashlight(), persons)
+    moves = table.optimal_moves(game_state)
+    assert not game_state.get_move_history()
+    assert all(game_state.make_move(move) for move in moves)
+    assert game_state.is_game_won() == expected.is_solved()
+    if expected.is_solved():
+        assert game_state.get_elapsed_time() == expected.get_total_time()
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_hints_and_grades_along_random_play(seed):
+    rng = random.Random(seed)
+    bridge, persons = random_game(rng)
+    table = CostToGoTable(bridge, persons)
+    game_state = GameState(bridge, Flashlight(), persons)
+    while not game_state.is_game_over():
+        moves = game_state.get_valid_moves()
+        if not moves:
+            break
+        before = table.get_cost_to_go(game_state)
+        grades = [table.grade_move(game_state, move) for move in moves]
+        winning = [grade for grade in grades if grade is not None]
+        assert table.can_still_win(game_state) == bool(winning)
+        if winning:
+            # Bellman: the best move loses nothing, and the cost-to-go is the best move's time plus what follows.
+            assert min(winning) == 0
+            hint = table.get_hint(game_state)
+            assert table.grade_move(game_state, hint) == 0
+            assert before <= game_state.get_remaining_time()
+        else:
+            assert table.get_hint(game_state) is None
+        game_state.make_move(rng.choice(moves))
+    if game_state.is_game_won():
+        assert table.get_cost_to_go(game_state) == 0 and table.get_hint(game_state) is None
+
+
+def test_classic_puzzle():
+    persons = [Person("You", 1), Person("Lab Assistant", 2), Person("Worker", 5), Person("Scientist", 10)]
+    game_state = GameState(Bridge(2, 17), Flashlight(), persons)
+    table = CostToGoTable(Bridge(2, 17), persons)
+    assert table.get_optimal_time() == 17
+    assert {p.get_name() for p in table.get_hint(game_state).get_crossing_persons()} == {"You", "Lab Assistant"}
+
+
+def test_refuses_large_rosters():
+    with pytest.raises(ValueError):
+        CostToGoTable(Bridge(2, 100), [Person(f"P{i}", 1) for i in range(5)], max_people=4)
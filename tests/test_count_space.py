@@ -0,0 +1,40 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import AStarSolver, BidirectionalSolver, CountStateSpace, DijkstraSolver
+
+
+def tied_roster(rng):
+    return [Person(f"P{i}", rng.choice([1, 2, 2, 5, 5, 5, 8])) for i in range(rng.randint(1, 7))]
+
+
+@pytest.mark.parametrize("solver_class", [AStarSolver, DijkstraSolver, BidirectionalSolver])
+@pytest.mark.parametrize("seed", range(15))
+def test_symmetric_solvers_match_unpruned_dijkstra(solver_class, seed):
+    rng = random.Random(seed)
+    persons = tied_roster(rng)
+    bridge = Bridge(rng.randint(2, 4), rng.randint(5, 60))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve()
+    solver = solver_class(bridge, persons, symmetric=True)
+    result = solver.solve()
+    assert result.get_total_time() == expected.get_total_time()
+    if result.is_solved():
+        assert solver.verify(result)
+
+
+def test_persons_of_matches_first_move_of_to_moves():
+    persons = [Person("A", 1), Person("B", 5), Person("C", 5), Person("D", 5), Person("E", 9)]
+    space = CountStateSpace(persons, 3)
+    for group, _, cost in space.successors(0):
+        members = space.persons_of(group)
+        (move,) = space.to_moves([group])
+        assert set(members) == set(move.get_crossing_persons())
+        assert max(p.get_crossing_time() for p in members) == cost == space.group_time(group)
+
+
+def test_persons_of_counts_per_time():
+    persons = [Person("A", 2), Person("B", 2), Person("C", 7)]
+    space = CountStateSpace(persons, 3)
+    group = 2 * 1 + 1 * 3  # two of time 2, one of time 7
+    assert space.decode(group) == [2, 1]
+    assert sorted(p.get_name() for p in space.persons_of(group)) == ["A", "B", "C"]
@@ -0,0 +1,52 @@
+import random
+import pytest
+from models import Bridge, CrossingTimeTable, Move, Person
+
+
+def roster(rng, size):
+    return [Person(f"P{i}", rng.randint(1, 30)) for i in range(size)]
+
+
+def slowest(persons, mask):
+    return max((p.get_crossing_time() for i, p in enumerate(persons) if mask >> i & 1), default=0)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_group_time_is_the_slowest_member_before_and_after_set_roster(seed):
+    rng = random.Random(seed)
+    persons = roster(rng, rng.randint(1, 20))
+    table = CrossingTimeTable(persons)
+    masks = [rng.randrange(1 << len(persons)) for _ in range(200)]
+    for _ in range(2):  # the second pass is served from the cache
+        assert [table.group_time(mask) for mask in masks] == [slowest(persons, mask) for mask in masks]
+    assert 0 < len(table) <= len(set(masks))
+
+    replacement = roster(rng, len(persons))
+    table.set_roster(replacement)
+    assert len(table) == 0
+    assert [table.group_time(mask) for mask in masks] == [slowest(replacement, mask) for mask in masks]
+
+
+def test_cache_is_cleared_when_full():
+    persons = [Person(f"P{i}", i + 1) for i in range(6)]
+    table = CrossingTimeTable(persons, max_entries=4)
+    for mask in range(1, 1 << 6):
+        assert table.group_time(mask) == slowest(persons, mask)
+        assert len(table) <= 4
+
+
+def test_time_order_breaks_ties_by_roster_index():
+    persons = [Person("A", 5), Person("B", 1), Person("C", 5), Person("D", 1), Person("E", 3)]
+    table = CrossingTimeTable(persons)
+    assert table.get_time_order() == [(1, 1), (1, 3), (3, 4), (5, 0), (5, 2)]
+    table.set_roster(persons[::-1])
+    assert table.get_time_order() == [(1, 1), (1, 3), (3, 0), (5, 2), (5, 4)]
+    assert table.get_roster_size() == 5
+
+
+def test_move_time_is_memoized_per_move():
+    persons = [Person("A", 2), Person("B", 7)]
+    move = Move(persons, "left_to_right")
+    bridge = Bridge(2, 17)
+    assert move.calculate_time(bridge) == 7 == Bridge.calculate_crossing_time(persons)
+    assert move.execute(bridge) and move.get_time_taken() == 7
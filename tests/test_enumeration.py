@@ -0,0 +1,67 @@
+import random
+import pytest
+from models import Bridge, Flashlight, GameState, Person
+from solvers import DijkstraSolver, SolutionEnumerator
+
+
+def all_schedules(bridge, persons):
+    """Reference: every winning schedule, by exhaustive search on a GameState."""
+    game_state = GameState(bridge, Flashlight(), persons)
+    found = set()
+
+    def walk(path):
+        if game_state.is_game_won():
+            found.add(tuple(path))
+            return
+        for move in game_state.get_valid_moves():
+            game_state.make_move(move)
+            walk(path + [frozenset(move.get_crossing_persons())])
+            game_state.undo_move()
+
+    walk([])
+    return found
+
+
+def signature(schedule):
+    return tuple(tuple(sorted(p.get_crossing_time() for p in move.get_crossing_persons())) for move in schedule)
+
+
+def small_instance(rng):
+    persons = [Person(f"P{i}", rng.choice([1, 2, 2, 4, 7])) for i in range(rng.randint(1, 4))]
+    capacity = rng.randint(1, 3)
+    optimum = DijkstraSolver(Bridge(capacity, 10 ** 6), persons, prune=False).solve().get_total_time()
+    return Bridge(capacity, max(0, (optimum or 10) + rng.randint(-1, 4))), persons
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_streams_exactly_the_winning_schedules(seed):
+    bridge, persons = small_instance(random.Random(seed))
+    enumerator = SolutionEnumerator(bridge, persons)
+    schedules = list(enumerator)
+    as_sets = [tuple(frozenset(move.get_crossing_persons()) for move in schedule) for schedule in schedules]
+    assert len(set(as_sets)) == len(as_sets)
+    assert set(as_sets) == all_schedules(bridge, persons)
+    assert enumerator.count() == len(schedules)
+
+    optimal = DijkstraSolver(bridge, persons, prune=False).solve()
+    if optimal.is_solved():
+        assert min(sum(m.get_time_taken() for m in schedule) for schedule in schedules) == optimal.get_total_time()
+    else:
+        assert schedules == []
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_canonical_keeps_one_schedule_per_tie_class(seed):
+    bridge, persons = small_instance(random.Random(seed))
+    every = {signature(schedule) for schedule in SolutionEnumerator(bridge, persons)}
+    canonical = SolutionEnumerator(bridge, persons, canonical=True)
+    signatures = [signature(schedule) for schedule in canonical]
+    assert len(signatures) == len(set(signatures))
+    assert set(signatures) == every
+    assert canonical.count() == len(signatures)
+
+
+def test_classic_puzzle_has_two_optimal_schedules():
+    persons = [Person("You", 1), Person("Lab Assistant", 2), Person("Worker", 5), Person("Scientist", 10)]
+    assert SolutionEnumerator(Bridge(2, 17), persons).count() == 2
+    assert SolutionEnumerator(Bridge(2, 16), persons).count() == 0
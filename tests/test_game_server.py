@@ -0,0 +1,91 @@
+import random
+import time
+from itertools import combinations
+import pytest
+from models import CompactState, Move, Person
+from server import GameServer
+from server.game_server import MAX_MOVES, Scenario
+
+
+def new_session(server, *args):
+    reply = server.handle_line(" ".join(["NEW", *map(str, args)]))
+    assert reply.startswith("OK "), reply
+    return reply.split()[1]
+
+
+def test_classic_solution_wins():
+    server = GameServer()
+    session = new_session(server)
+    for group in ("0,1", "0", "2,3", "1", "0,1"):
+        reply = server.handle_line(f"MOVE {session} {group}")
+    assert reply == "OK time=17/17 status=won"
+
+
+def test_non_ascii_digits_are_refused_without_raising():
+    server = GameServer()
+    session = new_session(server)
+    assert server.handle_line(f"MOVE {session} ²") == "ERR no person '²'"
+    assert server.handle_line(f"MOVE {session} 0,١").startswith("ERR no person")
+    assert server.handle_line("NEW 2 17 ² 3").startswith("ERR")
+    assert server.handle_line(f"MOVE {session} 0,1").startswith("OK")
+
+
+def test_session_ids_must_be_ascii_digits():
+    server = GameServer()
+    sessions = [new_session(server) for _ in range(10)]
+    assert sessions[0] == "1" and sessions[-1] == "10"
+    for text in ("١", "1_0", "+1", "-0", "1.0"):
+        assert server.handle_line(f"STATE {text}") == f"ERR no session {text}"
+    assert server.handle_line("STATE 10").startswith("OK")
+    assert server.handle_line("STATE 01").startswith("OK")
+
+
+def test_moves_lists_every_group_of_a_small_roster():
+    server = GameServer()
+    session = new_session(server)
+    groups = server.handle_line(f"MOVES {session}").split()[1:]
+    assert len(groups) == 4 + 6
+    assert "more" not in groups
+
+
+def test_moves_reply_is_bounded_for_large_rosters():
+    server = GameServer()
+    session = new_session(server, 20, 1000, *([1] * 20))
+    start = time.perf_counter()
+    reply = server.handle_line(f"MOVES {session}")
+    assert time.perf_counter() - start < 1.0
+    words = reply.split()
+    assert words[0] == "OK" and words[-1] == "more"
+    groups = words[1:-1]
+    assert len(groups) == MAX_MOVES
+    assert groups[:20] == [str(i) for i in range(20)]
+    assert len(set(groups)) == MAX_MOVES
+
+
+def test_moves_matches_brute_force_on_custom_roster():
+    server = GameServer()
+    times = [3, 1, 4, 1, 5]
+    session = new_session(server, 3, 9, *times)
+    reply = server.handle_line(f"MOVES {session}").split()[1:]
+    expected = {",".join(map(str, sorted(c))) for size in (1, 2, 3)
+                for c in combinations(range(len(times)), size) if max(times[i] for i in c) <= 9}
+    assert {",".join(sorted(g.split(","), key=int)) for g in reply} == expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_validate_agrees_with_can_make_move(seed):
+    rng = random.Random(seed)
+    num_persons = rng.randint(1, 6)
+    persons = [Person(f"P{i}", rng.randint(1, 12)) for i in range(num_persons)]
+    scenario = Scenario(persons, rng.randint(1, 3), rng.randint(1, 30))
+    for _ in range(50):
+        right = rng.randrange(1 << num_persons)
+        state = CompactState(right, rng.random() < 0.5, rng.randint(0, scenario.get_max_time()))
+        game_state = scenario.to_game_state(state)
+        group = rng.randrange(1 << num_persons)
+        if rng.random() < 0.7:
+            # Mostly draw from the flashlight side, so that many groups are valid.
+            group &= right if state.is_flashlight_on_right() else ~right
+        direction = "right_to_left" if state.is_flashlight_on_right() else "left_to_right"
+        move = Move(game_state.persons_of(group), direction)
+        assert (scenario.validate(state, group) is None) == game_state.can_make_move(move)
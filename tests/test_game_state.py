@@ -0,0 +1,143 @@
+import random
+import pytest
+from models import Bridge, CompactState, Flashlight, GameState, Move, Person
+
+
+def make_game(times=(1, 2, 5, 10), capacity=2, max_time=17):
+    persons = [Person(f"P{i}", t) for i, t in enumerate(times)]
+    return GameState(Bridge(capacity, max_time), Flashlight(), persons), persons
+
+
+def test_duplicate_people_are_rejected():
+    with pytest.raises(ValueError, match="more than once"):
+        GameState(Bridge(2, 17), Flashlight(), [Person("A", 5), Person("A", 5), Person("B", 1)])
+
+
+def test_same_name_with_different_times_is_allowed():
+    game_state = GameState(Bridge(2, 17), Flashlight(), [Person("A", 5), Person("A", 6)])
+    assert len(game_state.get_left_side()) == 2
+
+
+def test_classic_schedule_wins():
+    game_state, (a, b, c, d) = make_game()
+    for group, direction in (([a, b], "left_to_right"), ([a], "right_to_left"), ([c, d], "left_to_right"),
+                             ([b], "right_to_left"), ([a, b], "left_to_right")):
+        assert game_state.make_move(Move(group, direction))
+    assert game_state.is_game_won()
+    assert game_state.get_elapsed_time() == 17
+
+
+def test_compact_round_trip():
+    game_state, (a, b, _, _) = make_game()
+    game_state.make_move(Move([a, b], "left_to_right"))
+    compact = game_state.to_compact()
+    assert compact == CompactState(0b11, True, 2)
+    rebuilt = GameState.from_compact(Bridge(2, 17), Flashlight(), game_state._all_persons, compact)
+    assert rebuilt.to_compact() == compact
+
+
+def test_rollback_restores_checkpoint():
+    game_state, (a, b, c, d) = make_game()
+    start = game_state.checkpoint()
+    game_state.make_move(Move([a, b], "left_to_right"))
+    middle = game_state.checkpoint()
+    game_state.make_move(Move([a], "right_to_left"))
+    game_state.make_move(Move([c, d], "left_to_right"))
+    undone = game_state.rollback(middle)
+    assert [m.get_direction() for m in undone] == ["left_to_right", "right_to_left"]
+    assert game_state.get_elapsed_time() == 2
+    game_state.rollback(start)
+    assert game_state.get_elapsed_time() == 0
+    assert len(game_state.get_left_side()) == 4
+
+
+def test_rollback_refuses_a_diverged_line():
+    game_state, (a, b, c, d) = make_game()
+    game_state.make_move(Move([a, b], "left_to_right"))
+    later = game_state.checkpoint()
+    game_state.undo_move()
+    with pytest.raises(ValueError, match="not on the current line of play"):
+        game_state.rollback(later)
+    game_state.make_move(Move([c, d], "left_to_right"))
+    game_state.make_move(Move([c], "right_to_left"))
+    with pytest.raises(ValueError, match="not on the current line of play"):
+        game_state.rollback(later)
+
+
+def test_nested_checkpoints_survive_rolling_back():
+    game_state, (a, b, c, d) = make_game()
+    start = game_state.checkpoint()
+    game_state.make_move(Move([a, b], "left_to_right"))
+    middle = game_state.checkpoint()
+    game_state.make_move(Move([a], "right_to_left"))
+    game_state.rollback(middle)
+    game_state.make_move(Move([b], "right_to_left"))
+    game_state.rollback(middle)
+    assert game_state.rollback(middle) == []
+    game_state.rollback(start)
+    assert game_state.get_elapsed_time() == 0
+    with pytest.raises(ValueError):
+        game_state.rollback(middle)
+
+
+def test_reset_invalidates_checkpoints():
+    game_state, (a, b, _, _) = make_game()
+    game_state.make_move(Move([a, b], "left_to_right"))
+    token = game_state.checkpoint()
+    game_state.reset()
+    game_state.make_move(Move([a, b], "left_to_right"))
+    with pytest.raises(ValueError):
+        game_state.rollback(token)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rollback_matches_a_recorded_line_of_play(seed):
+    """Play and undo at random; a token is valid exactly when its moves are still the current prefix."""
+    rng = random.Random(seed)
+    game_state, persons = make_game(times=[rng.randint(1, 9) for _ in range(5)], capacity=3, max_time=60)
+    tokens = []
+    for _ in range(60):
+        moves = game_state.get_valid_moves()
+        if moves and rng.random() < 0.6:
+            game_state.make_move(rng.choice(moves))
+        else:
+            game_state.undo_move()
+        if rng.random() < 0.3:
+            tokens.append((game_state.checkpoint(), game_state.get_move_history(), snapshot(game_state)))
+    rng.shuffle(tokens)
+    for token, history, position in tokens:
+        current = game_state.get_move_history()
+        on_line = len(history) <= len(current) and all(x is y for x, y in zip(history, current))
+        if on_line:
+            game_state.rollback(token)
+            assert snapshot(game_state) == position
+        else:
+            with pytest.raises(ValueError):
+                game_state.rollback(token)
+
+
+def snapshot(game_state):
+    return (game_state.get_left_side(), game_state.get_right_side(), game_state.get_elapsed_time(),
+            game_state.get_flashlight_holder(), game_state.get_move_history(), game_state.is_game_over())
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_undo_restores_every_earlier_position(seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 15)) for i in range(rng.randint(1, 7))]
+    bridge = Bridge(rng.randint(1, 3), rng.randint(10, 80))
+    if rng.random() < 0.5:
+        game_state = GameState(bridge, Flashlight(), persons)
+    else:
+        mask = rng.randrange(1 << len(persons))
+        game_state = GameState.from_compact(bridge, Flashlight(), persons, CompactState(mask, rng.random() < 0.5, 0))
+    snapshots = [snapshot(game_state)]
+    while True:
+        moves = game_state.get_valid_moves()
+        if not moves:
+            break
+        assert game_state.make_move(rng.choice(moves))
+        snapshots.append(snapshot(game_state))
+    while snapshots:
+        assert snapshot(game_state) == snapshots.pop()
+        game_state.undo_move()
@@ -0,0 +1,29 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import DijkstraSolver, GreedySolver, SearchStats
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_unpruned_dijkstra(seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 30)) for i in range(rng.randint(1, 7))]
+    bridge = Bridge(2, rng.randint(1, 150))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    result = GreedySolver(bridge, persons).solve()
+    assert result.get_total_time() == expected
+    if result.is_solved():
+        assert GreedySolver(bridge, persons).verify(result)
+
+
+def test_get_stats_like_other_solvers():
+    persons = [Person("A", 1), Person("B", 2)]
+    assert GreedySolver(Bridge(2, 17), persons).get_stats() is None
+    stats = SearchStats()
+    GreedySolver(Bridge(2, 17), persons, stats=stats).solve()
+    assert "search" in stats.get_phases()
+
+
+def test_rejects_other_capacities():
+    with pytest.raises(ValueError):
+        GreedySolver(Bridge(3, 17), [Person("A", 1)])
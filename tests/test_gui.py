@@ -0,0 +1,36 @@
+import os
+import pytest
+from models import Bridge, Flashlight, GameState, Person
+
+pytest.importorskip("pygame")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+from gui import PuzzleGUI  # noqa: E402  (the prompt setting must come first)
+
+
+def make_gui(max_time):
+    persons = [Person("You", 1), Person("Lab Assistant", 2), Person("Worker", 5), Person("Scientist", 10)]
+    game_state = GameState(Bridge(2, max_time), Flashlight(), persons)
+    return PuzzleGUI(game_state, persons, headless=True, fps=0)
+
+
+def test_autoplay_wins_the_classic_puzzle():
+    gui = make_gui(17)
+    try:
+        gui.run(max_frames=2000, autoplay=True, frame_dt=1 / 10)
+        assert gui.get_crossings() >= 5
+    finally:
+        gui.close()
+
+
+def test_autoplay_stops_when_the_plan_does_not_fit(monkeypatch):
+    gui = make_gui(16)
+    plans = []
+    original = gui._plan_moves
+    monkeypatch.setattr(gui, "_plan_moves", lambda: plans.append(1) or original())
+    try:
+        gui.run(max_frames=200, autoplay=True, frame_dt=1 / 120)
+        assert len(plans) == 1
+        assert not gui._autoplay
+        assert gui._message == "No schedule fits the time limit"
+    finally:
+        gui.close()
@@ -0,0 +1,49 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import DijkstraSolver
+from solvers.incremental import IncrementalSolver
+
+
+def test_two_edits_before_solve_do_not_reuse_a_stale_schedule():
+    persons = [Person(f"P{i}", t) for i, t in enumerate([19, 17, 11, 8])]
+    solver = IncrementalSolver(Bridge(3, 1000), persons)
+    solver.solve()
+    raised = solver.set_crossing_time(persons[2], 18)
+    solver.set_crossing_time(persons[3], 1)
+    result = solver.solve()
+    assert result.get_total_time() == 37
+    assert solver.get_last_strategy() != "incumbent"
+    assert raised in solver.get_persons()
+
+
+def test_edits_before_first_solve():
+    persons = [Person(f"P{i}", t) for i, t in enumerate([1, 2, 5, 10])]
+    solver = IncrementalSolver(Bridge(2, 19), persons)
+    solver.set_crossing_time(persons[3], 12)
+    assert solver.solve().get_total_time() == 19
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_edit_sequences_match_unpruned_dijkstra(seed):
+    rng = random.Random(seed)
+    capacity = rng.randint(2, 4)
+    persons = [Person(f"P{i}", rng.randint(1, 25)) for i in range(rng.randint(2, 6))]
+    solver = IncrementalSolver(Bridge(capacity, 10 ** 6), persons)
+    for _ in range(8):
+        for _ in range(rng.randint(1, 3)):
+            member = rng.choice(solver.get_persons())
+            solver.set_crossing_time(member, rng.randint(1, 25))
+        result = solver.solve()
+        expected = DijkstraSolver(Bridge(capacity, 10 ** 6), solver.get_persons(), prune=False).solve()
+        assert result.get_total_time() == expected.get_total_time()
+        assert solver.verify(result)
+
+
+def test_time_limit_change_reuses_optimum():
+    persons = [Person(f"P{i}", t) for i, t in enumerate([1, 2, 5, 10])]
+    solver = IncrementalSolver(Bridge(2, 17), persons)
+    assert solver.solve().get_total_time() == 17
+    solver.set_max_time(16)
+    assert not solver.solve().is_solved()
+    assert solver.get_last_strategy() == "reuse"
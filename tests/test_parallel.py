@@ -0,0 +1,17 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import DijkstraSolver, ParallelSolver
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_unpruned_dijkstra(seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 30)) for i in range(rng.randint(2, 6))]
+    bridge = Bridge(rng.randint(2, 3), rng.randint(10, 150))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    solver = ParallelSolver(bridge, persons, workers=2)
+    result = solver.solve()
+    assert result.get_total_time() == expected
+    if result.is_solved():
+        assert solver.verify(result)
@@ -0,0 +1,74 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import AStarSolver, CountStateSpace, DijkstraSolver, StateSpace
+
+pytest.importorskip("numpy")
+from solvers.cost_to_go import retrograde_search  # noqa: E402
+from solvers.pattern_db import PatternDatabase, bucket_floors, family_floor, keep_slowest  # noqa: E402
+
+
+def random_times(rng):
+    return [rng.randint(1, 30) for _ in range(rng.randint(2, 7))]
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_heuristic_is_admissible_and_exact_without_abstraction(seed):
+    rng = random.Random(seed)
+    times = random_times(rng)
+    capacity = rng.randint(2, 3)
+    space = StateSpace([Person(f"P{i}", t) for i, t in enumerate(times)], capacity, prune=False)
+    cost_to_go, _ = retrograde_search(space)
+    exact = PatternDatabase.build(times, capacity).heuristic(space)
+    abstract = PatternDatabase.build(keep_slowest(times, 2), capacity).heuristic(space)
+    for state, cost in cost_to_go.items():
+        assert exact(state) == cost
+        assert abstract(state) <= cost
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_astar_with_databases_matches_unpruned_dijkstra(seed):
+    rng = random.Random(seed)
+    times = random_times(rng)
+    persons = [Person(f"P{i}", t) for i, t in enumerate(times)]
+    bridge = Bridge(rng.randint(2, 3), rng.randint(10, 150))
+    databases = [PatternDatabase.build(keep_slowest(times, 2), bridge.get_capacity()),
+                 PatternDatabase.build(bucket_floors(times, [1, 5, 10, 20]), bridge.get_capacity())]
+    solver = AStarSolver(bridge, persons, pattern_databases=databases)
+    result = solver.solve()
+    assert result.get_total_time() == DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    if result.is_solved():
+        assert solver.verify(result)
+
+
+def test_load_or_build_saves_once_and_reloads(tmp_path):
+    built = PatternDatabase.load_or_build(str(tmp_path), [1, 2, 5, 10], 2)
+    saved = sorted(path.name for path in tmp_path.iterdir())
+    loaded = PatternDatabase.load_or_build(str(tmp_path), [10, 5, 2, 1], 2)
+    assert sorted(path.name for path in tmp_path.iterdir()) == saved and len(saved) == 2
+    assert loaded.get_times() == built.get_times() and loaded.get_num_states() == built.get_num_states()
+    space = StateSpace([Person(f"P{i}", t) for i, t in enumerate([1, 2, 5, 10])], 2)
+    built_bound, loaded_bound = built.heuristic(space), loaded.heuristic(space)
+    assert all(built_bound(state) == loaded_bound(state) for state in range(2 << 4))
+    assert loaded_bound(space.get_start_state()) == 17
+
+
+def test_family_floor_covers_every_member():
+    rosters = [[3, 9, 4], [5, 2, 8], [7, 7, 1]]
+    database = PatternDatabase.build(family_floor(rosters), 2)
+    assert all(database.covers(roster, 2) for roster in rosters)
+    assert not database.covers([1, 1, 1], 2)
+    assert not database.covers(rosters[0], 3)
+    with pytest.raises(ValueError):
+        family_floor([[1, 2], [1, 2, 3]])
+
+
+def test_rejects_uncovered_rosters_and_count_spaces():
+    database = PatternDatabase.build([2, 5, 9], 2)
+    persons = [Person("A", 2), Person("B", 5), Person("C", 9)]
+    with pytest.raises(TypeError):
+        database.heuristic(CountStateSpace(persons, 2))
+    with pytest.raises(ValueError):
+        database.heuristic(StateSpace([Person("A", 1), Person("B", 5), Person("C", 9)], 2))
+    with pytest.raises(ValueError):
+        PatternDatabase.build(list(range(1, 30)), 3, max_states=1000)
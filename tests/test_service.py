@@ -0,0 +1,81 @@
+import io
+import json
+import random
+import pytest
+from models import Bridge, Person
+from solvers import DijkstraSolver
+from solvers import service
+from solvers.service import BatchSolver, parse_instance, run
+
+
+def solve_lines(lines, workers=0):
+    output = io.StringIO()
+    run(io.StringIO("\n".join(lines) + "\n"), output, workers=workers)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("record", [
+    {"times": [1, 2], "capacity": 0},
+    {"times": [1, 0]},
+    {"times": [1, -3]},
+    {"times": [1, 2], "max_time": -1},
+    {"people": [{"name": "A", "time": 0}]},
+])
+def test_parse_instance_rejects_invalid_puzzles(record):
+    with pytest.raises(ValueError):
+        parse_instance(record)
+
+
+def test_invalid_line_gives_error_record_and_batch_continues():
+    results = solve_lines([
+        json.dumps({"id": "bad", "times": [1, 2], "capacity": 0}),
+        "{not json",
+        json.dumps({"id": "ok", "times": [1, 2, 5, 10]}),
+    ])
+    assert [r.get("id") for r in results] == ["bad", None, "ok"]
+    assert "capacity" in results[0]["error"]
+    assert "error" in results[1]
+    assert results[2]["solved"] and results[2]["total_time"] == 17
+
+
+def test_failing_task_gives_error_record(monkeypatch):
+    real = service.solve_canonical
+
+    def flaky(key):
+        if key[0] == (3, 3):
+            raise RuntimeError("boom")
+        return real(key)
+
+    monkeypatch.setattr(service, "solve_canonical", flaky)
+    results = list(BatchSolver(workers=0).solve_all([
+        {"id": "a", "times": [3, 3], "max_time": 10},
+        {"id": "b", "times": [3, 3], "max_time": 10},
+        {"id": "c", "times": [1, 2, 5, 10]},
+    ]))
+    assert results[0] == {"id": "a", "error": "solver failed: RuntimeError('boom')"}
+    assert "error" in results[1]
+    assert results[2]["total_time"] == 17
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_matches_unpruned_dijkstra(workers):
+    rng = random.Random(12)
+    records = []
+    for i in range(25):
+        records.append({"id": i, "times": [rng.randint(1, 20) for _ in range(rng.randint(1, 6))],
+                        "capacity": rng.randint(1, 3), "max_time": rng.randint(0, 120)})
+    for record, result in zip(records, BatchSolver(workers=workers).solve_all(records)):
+        persons, bridge = parse_instance(record)
+        expected = DijkstraSolver(bridge, persons, prune=False).solve()
+        assert result["id"] == record["id"]
+        assert result["solved"] == expected.is_solved()
+        if expected.is_solved():
+            assert result["total_time"] == expected.get_total_time()
+
+
+def test_repeats_served_from_cache():
+    batch = BatchSolver(workers=0)
+    records = [{"id": i, "times": [10, 1, 5, 2]} for i in range(3)]
+    results = list(batch.solve_all(records))
+    assert [r["cached"] for r in results] == [False, True, True]
+    assert batch.get_cache_misses() == 1 and batch.get_cache_hits() == 2
@@ -0,0 +1,59 @@
+import pytest
+from main import display_current_state, print_game_state
+from models import Bridge, Flashlight, GameState, Move, Person
+
+
+def make_state():
+    persons = [Person("A", 1), Person("B", 2), Person("C", 5)]
+    return GameState(Bridge(2, 20), Flashlight(), persons), persons
+
+
+def test_models_reject_new_attributes():
+    game_state, persons = make_state()
+    move = Move(persons[:2], "left_to_right")
+    for obj in (persons[0], move, game_state, Bridge(2, 20), Flashlight()):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.extra = 1
+
+
+def test_accessors_return_tuples():
+    game_state, persons = make_state()
+    move = Move(persons[:2], "left_to_right")
+    assert move.get_crossing_persons() == (persons[0], persons[1])
+    game_state.make_move(move)
+    assert game_state.get_left_side() == (persons[2],)
+    assert game_state.get_right_side() == (persons[0], persons[1])
+    assert game_state.get_move_history() == (move,)
+
+
+def test_move_does_not_alias_caller_list():
+    _, persons = make_state()
+    group = persons[:2]
+    move = Move(group, "left_to_right")
+    group.append(persons[2])
+    assert move.get_crossing_persons() == (persons[0], persons[1])
+
+
+def test_accessor_results_cannot_change_state():
+    game_state, persons = make_state()
+    left = game_state.get_left_side()
+    with pytest.raises(AttributeError):
+        left.append(Person("D", 3))
+    # Callers that need a list take a copy, which leaves the state alone.
+    copied = list(left)
+    copied.pop()
+    assert len(game_state.get_left_side()) == 3
+
+
+def test_list_style_callers_still_work(capsys):
+    game_state, persons = make_state()
+    game_state.make_move(Move(persons[:2], "left_to_right"))
+    history = game_state.get_move_history()
+    names = " + ".join(p.get_name() for p in history[-1].get_crossing_persons())
+    assert names == "A + B"
+    display_current_state(game_state)
+    print_game_state(game_state, 1)
+    out = capsys.readouterr().out
+    assert "Step 1" in out
+    assert "C (5 min)" in out
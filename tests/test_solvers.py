@@ -0,0 +1,58 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import AStarSolver, BruteForceSolver, DijkstraSolver, solve
+
+
+def random_instance(rng, max_people=6):
+    persons = [Person(f"P{i}", rng.randint(1, 20)) for i in range(rng.randint(1, max_people))]
+    return Bridge(rng.randint(1, 4), rng.randint(0, 100)), persons
+
+
+def test_classic_puzzle():
+    persons = [Person("You", 1), Person("Lab Assistant", 2), Person("Worker", 5), Person("Scientist", 10)]
+    for solver_class in (AStarSolver, DijkstraSolver, BruteForceSolver):
+        solver = solver_class(Bridge(2, 17), persons)
+        result = solver.solve()
+        assert result.get_total_time() == 17
+        assert solver.verify(result)
+    assert not AStarSolver(Bridge(2, 16), persons).solve().is_solved()
+
+
+@pytest.mark.parametrize("solver_class", [AStarSolver, DijkstraSolver])
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_unpruned_dijkstra(solver_class, seed):
+    bridge, persons = random_instance(random.Random(seed))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve()
+    solver = solver_class(bridge, persons)
+    result = solver.solve()
+    assert result.get_total_time() == expected.get_total_time()
+    if result.is_solved():
+        assert solver.verify(result)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_unpruned_dijkstra_matches_brute_force(seed):
+    rng = random.Random(seed)
+    _, persons = random_instance(rng, max_people=4)
+    capacity = rng.randint(1, 3)
+    # Brute force explores every schedule within the limit, so keep it near the optimum.
+    optimum = DijkstraSolver(Bridge(capacity, 10 ** 6), persons, prune=False).solve().get_total_time()
+    bridge = Bridge(capacity, max(0, (optimum or 30) + rng.randint(-2, 3)))
+    brute_force = BruteForceSolver(bridge, persons)
+    result = brute_force.solve()
+    assert result.get_total_time() == DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    if result.is_solved():
+        assert brute_force.verify(result)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_api_solve_matches_unpruned_dijkstra(seed):
+    bridge, persons = random_instance(random.Random(100 + seed))
+    assert solve(bridge, persons).get_total_time() == \
+        DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+
+
+def test_nobody_to_move():
+    result = AStarSolver(Bridge(2, 0), []).solve()
+    assert result.is_solved() and result.get_total_time() == 0
@@ -0,0 +1,62 @@
+import random
+from itertools import combinations
+import pytest
+from models import Bridge, Flashlight, GameState, Move, Person
+from solvers import DijkstraSolver, StateSpace
+from solvers.cost_to_go import retrograde_search
+
+
+def random_roster(rng, max_people=6):
+    return [Person(f"P{i}", rng.randint(1, 20)) for i in range(rng.randint(1, max_people))]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_valid_moves_are_every_allowed_group_up_to_capacity(seed):
+    rng = random.Random(seed)
+    persons = random_roster(rng)
+    game_state = GameState(Bridge(rng.randint(1, 4), rng.randint(10, 80)), Flashlight(), persons)
+    for _ in range(6):
+        moves = game_state.get_valid_moves()
+        if game_state.is_game_over():
+            assert moves == []
+            break
+        on_right = game_state.is_flashlight_on_right()
+        side = game_state.get_right_side() if on_right else game_state.get_left_side()
+        direction = "right_to_left" if on_right else "left_to_right"
+        expected = {frozenset(group) for size in range(1, game_state._bridge.get_capacity() + 1)
+                    for group in combinations(side, size)
+                    if game_state.can_make_move(Move(list(group), direction))}
+        assert {frozenset(move.get_crossing_persons()) for move in moves} == expected
+        assert len(moves) == len(expected)
+        if not moves:
+            break
+        assert game_state.make_move(rng.choice(moves))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pruning_only_drops_counted_moves(seed):
+    rng = random.Random(seed)
+    persons = random_roster(rng)
+    capacity = rng.randint(1, 4)
+    pruned, full = StateSpace(persons, capacity), StateSpace(persons, capacity, prune=False)
+    for state in range(2 << len(persons)):
+        kept = {group for group, _, _ in pruned.successors(state)}
+        every = {group for group, _, _ in full.successors(state)}
+        assert kept <= every
+        assert len(every) - len(kept) == pruned.count_dominated(state)
+
+
+def test_capacity_three_forward_trip_need_not_be_full():
+    persons = [Person(f"P{i}", t) for i, t in enumerate([2, 4, 27, 40, 89])]
+    bridge = Bridge(3, 1000)
+    assert DijkstraSolver(bridge, persons).solve().get_total_time() == 103
+    assert DijkstraSolver(bridge, persons, prune=False).solve().get_total_time() == 103
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_lower_bound_is_admissible(seed):
+    rng = random.Random(seed)
+    space = StateSpace(random_roster(rng), rng.randint(2, 4), prune=False)
+    cost_to_go, _ = retrograde_search(space)
+    for state, cost in cost_to_go.items():
+        assert space.lower_bound(state) <= cost
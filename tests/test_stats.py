@@ -0,0 +1,49 @@
+import json
+import random
+import pytest
+from models import Bridge, Person
+from solvers import (AStarSolver, BidirectionalSolver, BranchAndBoundSolver, DijkstraSolver, IncrementalSolver,
+                     SearchStats)
+
+
+@pytest.mark.parametrize("solver_class", [AStarSolver, DijkstraSolver, BidirectionalSolver, BranchAndBoundSolver,
+                                          IncrementalSolver])
+@pytest.mark.parametrize("seed", range(5))
+def test_stats_do_not_change_results_and_count_expansions(solver_class, seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 30)) for i in range(rng.randint(3, 7))]
+    bridge = Bridge(rng.randint(3, 4), rng.randint(40, 200))
+    stats = SearchStats()
+    result = solver_class(bridge, persons, stats=stats).solve()
+    assert result.get_total_time() == solver_class(bridge, persons).solve().get_total_time()
+    assert result.get_total_time() == DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    if result.get_nodes_expanded():
+        assert stats.get_expanded() == result.get_nodes_expanded()
+    assert stats.get_generated() >= stats.get_expanded() - 1
+    assert all(count >= 0 for count in stats.get_pruned().values())
+    assert "search" in stats.get_phases()
+
+
+def test_unpruned_search_counts_no_dominance():
+    persons = [Person(f"P{i}", t) for i, t in enumerate([1, 2, 5, 10, 12])]
+    pruned, unpruned = SearchStats(), SearchStats()
+    DijkstraSolver(Bridge(2, 100), persons, stats=pruned).solve()
+    DijkstraSolver(Bridge(2, 100), persons, prune=False, stats=unpruned).solve()
+    assert pruned.get_pruned()["dominance"] > 0
+    assert unpruned.get_pruned()["dominance"] == 0
+
+
+def test_phase_and_json_report():
+    stats = SearchStats()
+    with stats.phase("search"):
+        stats.on_expanded()
+        stats.on_generated(3)
+        stats.on_pruned("bound", 2)
+        stats.on_frontier(5)
+        stats.on_frontier(4)
+    report = json.loads(stats.to_json())
+    assert report["expanded"] == 1 and report["generated"] == 3
+    assert report["pruned"]["bound"] == 2
+    assert report["peak_frontier"] == 5
+    assert report["phases"]["search"] >= 0
+    assert stats.get_nodes_per_second() >= 0
@@ -0,0 +1,67 @@
+import random
+import pytest
+from models import Bridge, CompactState, Flashlight, GameState, Move, Person
+
+
+def describe(game_state):
+    return (game_state.get_left_side(), game_state.get_right_side(), game_state.get_elapsed_time(),
+            game_state.get_flashlight_holder(), game_state.get_move_history(), game_state.is_flashlight_on_right(),
+            game_state.is_game_won(), game_state.is_game_over(), game_state.to_compact())
+
+
+def random_position(rng):
+    persons = [Person(f"P{i}", rng.randint(1, 12)) for i in range(rng.randint(1, 6))]
+    bridge = Bridge(rng.randint(1, 3), rng.randint(1, 40))
+    compact = CompactState(rng.randrange(1 << len(persons)), rng.random() < 0.5, rng.randint(0, 10))
+    game_state = GameState.from_compact(bridge, Flashlight(), persons, compact)
+    for _ in range(rng.randint(0, 3)):
+        moves = game_state.get_valid_moves()
+        if not moves:
+            break
+        game_state.make_move(rng.choice(moves))
+    return game_state, persons
+
+
+def random_move(rng, persons):
+    group = rng.sample(persons, rng.randint(1, len(persons)))
+    return Move(group, rng.choice(["left_to_right", "right_to_left"]))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_next_state_matches_make_move_on_a_copy(seed):
+    rng = random.Random(seed)
+    game_state, persons = random_position(rng)
+    for move in game_state.get_valid_moves() + [random_move(rng, persons) for _ in range(10)]:
+        before = describe(game_state)
+        successor = game_state.next_state(move)
+        assert describe(game_state) == before
+        copied = game_state.deepcopy()
+        if copied.make_move(move):
+            assert successor is not None
+            assert describe(successor) == describe(copied)
+        else:
+            assert successor is None
+            assert not game_state.can_make_move(move)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_iter_successors_yields_one_successor_per_valid_move(seed):
+    rng = random.Random(seed)
+    game_state, _ = random_position(rng)
+    before = describe(game_state)
+    pairs = list(game_state.iter_successors())
+    assert describe(game_state) == before
+    assert [move for move, _ in pairs] == game_state.get_valid_moves()
+    for move, successor in pairs:
+        assert describe(successor) == describe(game_state.next_state(move))
+        assert successor.get_move_history()[-1] is move
+    assert len({successor.to_compact() for _, successor in pairs}) == len(pairs)
+
+
+def test_successors_are_independent_of_each_other():
+    persons = [Person("A", 1), Person("B", 2), Person("C", 5)]
+    game_state = GameState(Bridge(2, 20), Flashlight(), persons)
+    (_, first), (_, second) = list(game_state.iter_successors())[:2]
+    first.make_move(first.get_valid_moves()[0])
+    assert len(second.get_move_history()) == 1
+    assert game_state.get_elapsed_time() == 0 and not game_state.get_move_history()
@@ -0,0 +1,56 @@
+import json
+import sys
+import pytest
+from benchmarks import suite
+
+
+def results(**cases):
+    return {"meta": {}, "results": {name: dict(case) for name, case in cases.items()}}
+
+
+BASELINE = results(fast={"seconds": 0.010, "total_time": 17}, slow={"seconds": 0.100, "total_time": 29},
+                   primitive={"seconds": 0.001})
+
+
+def test_compare_flags_slower_cases_only_beyond_threshold():
+    current = results(fast={"seconds": 0.0115, "total_time": 17}, slow={"seconds": 0.150, "total_time": 29},
+                      primitive={"seconds": 0.0005}, new={"seconds": 1.0, "total_time": 3})
+    assert suite.compare(current, BASELINE, threshold=0.2) == ["slow: 1.50x slower"]
+
+
+def test_compare_flags_changed_total_time():
+    current = results(fast={"seconds": 0.010, "total_time": 19}, slow={"seconds": 0.100, "total_time": 29},
+                      primitive={"seconds": 0.001})
+    assert suite.compare(current, BASELINE, threshold=0.2) == ["fast: total 17 -> 19"]
+
+
+def test_compare_reports_both_kinds_for_one_case():
+    current = results(fast={"seconds": 0.050, "total_time": None})
+    assert suite.compare(current, BASELINE, threshold=0.2) == ["fast: 5.00x slower", "fast: total 17 -> None"]
+
+
+@pytest.mark.parametrize("current, status", [
+    (results(fast={"seconds": 0.010, "total_time": 17}), None),
+    (results(fast={"seconds": 0.030, "total_time": 17}), 1),
+    (results(fast={"seconds": 0.010, "total_time": 18}), 1),
+])
+def test_main_exit_status_follows_regressions(tmp_path, monkeypatch, current, status):
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(BASELINE), encoding="utf-8")
+    output_path = tmp_path / "current.json"
+    monkeypatch.setattr(suite, "run_suite", lambda grid, repeats, seed: current)
+    monkeypatch.setattr(sys, "argv", ["suite", "--quick", "--output", str(output_path),
+                                      "--baseline", str(baseline_path)])
+    if status is None:
+        suite.main()
+    else:
+        with pytest.raises(SystemExit) as exit_info:
+            suite.main()
+        assert exit_info.value.code == status
+    assert json.loads(output_path.read_text(encoding="utf-8")) == current
+
+
+def test_full_grid_covers_capacity_five():
+    assert 5 in suite.FULL_GRID["capacities"]
+    capacities = {case["capacity"] for case in suite.solver_cases(suite.FULL_GRID, 0)}
+    assert capacities == set(suite.FULL_GRID["capacities"])
@@ -0,0 +1,56 @@
+import random
+import pytest
+from models import Bridge, Person
+from solvers import AStarSolver, DijkstraSolver, TranspositionTable
+
+
+def test_offer_prunes_arrivals_that_are_not_faster():
+    table = TranspositionTable()
+    assert table.offer("a", 10)
+    assert not table.offer("a", 10)
+    assert not table.offer("a", 12)
+    assert table.offer("a", 7)
+    assert table.lookup("a") == 7
+    assert table.lookup("b") is None
+
+
+def test_lru_evicts_least_recently_used():
+    table = TranspositionTable(max_entries=2)
+    table.store("a", 1)
+    table.store("b", 2)
+    table.lookup("a")
+    table.store("c", 3)
+    assert table.lookup("b") is None
+    assert table.lookup("a") == 1 and table.lookup("c") == 3
+    assert table.get_evictions() == 1
+
+
+def test_depth_evicts_shallowest():
+    table = TranspositionTable(max_entries=2, eviction="depth")
+    table.store("deep", 5, depth=4)
+    table.store("shallow", 1, depth=1)
+    table.store("deeper", 9, depth=6)
+    assert table.lookup("shallow") is None
+    assert table.lookup("deep") == 5 and table.lookup("deeper") == 9
+
+
+@pytest.mark.parametrize("arguments", [{"eviction": "fifo"}, {"max_entries": 0}])
+def test_rejects_bad_configuration(arguments):
+    with pytest.raises(ValueError):
+        TranspositionTable(**arguments)
+
+
+@pytest.mark.parametrize("eviction", ["lru", "depth"])
+@pytest.mark.parametrize("seed", range(15))
+def test_bounded_table_keeps_searches_optimal(eviction, seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 20)) for i in range(rng.randint(2, 7))]
+    bridge = Bridge(rng.randint(2, 4), rng.randint(20, 120))
+    expected = DijkstraSolver(bridge, persons, prune=False).solve().get_total_time()
+    for use_heuristic in (True, False):
+        solver = AStarSolver(bridge, persons, use_heuristic=use_heuristic, max_table_entries=rng.randint(1, 8),
+                             eviction=eviction)
+        result = solver.solve()
+        assert result.get_total_time() == expected
+        if result.is_solved():
+            assert solver.verify(result)
@@ -0,0 +1,41 @@
+import random
+from itertools import combinations
+import pytest
+from models import Bridge, CompactState, Flashlight, GameState, Move, Person
+
+
+def filtered_candidates(game_state):
+    """The moves the eager implementation returned: every group of the flashlight side, checked one by one."""
+    if game_state.is_game_over() or game_state.get_flashlight_holder() is None:
+        return []
+    if game_state.is_flashlight_on_right():
+        side, direction = game_state.get_right_side(), "right_to_left"
+    else:
+        side, direction = game_state.get_left_side(), "left_to_right"
+    candidates = [Move(list(group), direction) for size in range(1, game_state._bridge.get_capacity() + 1)
+                  for group in combinations(side, size)]
+    return [move for move in candidates if game_state.can_make_move(move)]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_valid_moves_equal_the_filtered_candidates(seed):
+    rng = random.Random(seed)
+    persons = [Person(f"P{i}", rng.randint(1, 12)) for i in range(rng.randint(1, 7))]
+    bridge = Bridge(rng.randint(1, 4), rng.randint(1, 40))
+    mask = rng.randrange(1 << len(persons))
+    compact = CompactState(mask, rng.random() < 0.5, rng.randint(0, bridge.get_max_time()))
+    game_state = GameState.from_compact(bridge, Flashlight(), persons, compact)
+    for _ in range(5):
+        moves = game_state.get_valid_moves()
+        assert moves == filtered_candidates(game_state)
+        if not moves:
+            break
+        game_state.make_move(rng.choice(moves))
+
+
+def test_roster_ordered_move_is_found():
+    a, b = Person("A", 10), Person("B", 1)
+    game_state = GameState(Bridge(2, 17), Flashlight(), [a, b])
+    moves = game_state.get_valid_moves()
+    assert Move([a, b], "left_to_right") in moves
+    assert [m.get_person_names() for m in moves] == [["A"], ["B"], ["A", "B"]]